@@ -0,0 +1,71 @@
+"""
+Per-frame allocations of the event path (run with --alloc to see blocks and
+bytes retained per call next to the timing).
+
+An open-hand or lost-hand frame should allocate nothing; a moving frame one
+compact MouseEvent plus its position.
+"""
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.events import EVENT_SIZE, MouseEvent, idle_event, move_event
+
+
+def _fsm_lost_hand():
+    fsm = GestureFSM(KineMouseConfig(), (1920, 1080))
+    return lambda: fsm.process(None, timestamp=0.0)
+
+
+def _fsm_open_hand():
+    fsm = GestureFSM(KineMouseConfig(), (1920, 1080))
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        return fsm._transition(False, False, (i & 1023, 500), i / 30)
+    return run
+
+
+def _fsm_move():
+    fsm = GestureFSM(KineMouseConfig(), (1920, 1080))
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        return fsm._transition(True, False, (i & 1023, 500), i / 30)
+    return run
+
+
+def _idle_event():
+    return idle_event
+
+
+def _move_event():
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        return move_event(i & 1023, 500)
+    return run
+
+
+def _pack_into():
+    event = move_event(960, 540)
+    buf = bytearray(EVENT_SIZE)
+    return lambda: event.pack_into(buf)
+
+
+def _unpack():
+    data = move_event(960, 540).pack()
+    return lambda: MouseEvent.unpack(data)
+
+
+BENCHMARKS = [
+    ("alloc/fsm_lost_hand", _fsm_lost_hand),
+    ("alloc/fsm_open_hand", _fsm_open_hand),
+    ("alloc/fsm_move", _fsm_move),
+    ("alloc/idle_event", _idle_event),
+    ("alloc/move_event", _move_event),
+    ("alloc/event_pack_into", _pack_into),
+    ("alloc/event_unpack", _unpack),
+]
@@ -0,0 +1,130 @@
+"""
+Per-event cost of the Wayland uinput backend: batched single-write events
+versus the previous one-syscall-per-event write()/syn() pattern of
+python-evdev (emulated here as _Legacy, which does the same writes).
+
+Both write to /dev/null, so the timings are the syscall and packing cost
+without a real uinput device. Run this module directly for syscalls per
+event type:
+
+    python -m benchmarks.bench_backends
+"""
+
+import os
+
+from kinemouse.backends.base_backend import BaseBackend
+from kinemouse.backends.linux_wayland_backend import (
+    LinuxWaylandBackend, _pack, _EV_ABS, _EV_KEY, _EV_SYN, _ABS_X, _ABS_Y, _BTN_LEFT, _SYN_REPORT,
+)
+from kinemouse.state.events import click_event, mouse_down_event, move_event
+from kinemouse.utils.config import KineMouseConfig
+
+
+class _Counting:
+    def __init__(self):
+        self.fd = os.open(os.devnull, os.O_WRONLY)
+        self.syscalls = 0
+
+    def write_raw(self, data: bytes):
+        self.syscalls += 1
+        os.write(self.fd, data)
+
+
+class _Legacy(BaseBackend):
+    """The previous backend: every write() and syn() is its own syscall, repeats included."""
+
+    def __init__(self, sink: _Counting):
+        super().__init__(KineMouseConfig())
+        self._sink = sink
+
+    def get_screen_resolution(self):
+        return (1920, 1080)
+
+    def _w(self, type_, code, value):
+        self._sink.write_raw(_pack(type_, code, value))
+
+    def _emit(self, x, y):
+        self._w(_EV_ABS, _ABS_X, x)
+        self._w(_EV_ABS, _ABS_Y, y)
+        self._w(_EV_SYN, _SYN_REPORT, 0)
+
+    def dispatch(self, event):       # no redundant-move check
+        getattr(self, event.type.name.lower())(*event.position)
+
+    def move(self, x, y):
+        self._emit(x, y)
+
+    def click(self, x, y):
+        self._emit(x, y)
+        for value in (1, 0):
+            self._w(_EV_KEY, _BTN_LEFT, value)
+            self._w(_EV_SYN, _SYN_REPORT, 0)
+
+    def mouse_down(self, x, y):
+        self._emit(x, y)
+        self._w(_EV_KEY, _BTN_LEFT, 1)
+        self._w(_EV_SYN, _SYN_REPORT, 0)
+
+    def right_click(self, x, y): pass
+    def mouse_up(self, x, y): pass
+
+
+def _batched(sink: _Counting) -> LinuxWaylandBackend:
+    b = LinuxWaylandBackend.__new__(LinuxWaylandBackend)
+    BaseBackend.__init__(b, KineMouseConfig())
+    b._screen_res = (1920, 1080)
+    b._device = None
+    b._fd = sink.fd
+    b._abs_x = b._abs_y = None
+    b._write = sink.write_raw
+    return b
+
+
+# (name, event for frame i): moving cursor, cursor at rest, moving clicks, press in place
+_CASES = {
+    "move": lambda i: move_event(i & 1023, 500),
+    "move_repeat": lambda i: move_event(960, 540),
+    "click": lambda i: click_event(i & 1023, 500),
+    "mouse_down_in_place": lambda i: mouse_down_event(960, 540),
+}
+
+
+def _bench(make_backend, case):
+    def setup():
+        backend = make_backend(_Counting())
+        event_for = _CASES[case]
+        state = [0]
+
+        def run():
+            i = state[0] = state[0] + 1
+            backend.dispatch(event_for(i))
+        return run
+    return setup
+
+
+def syscalls_per_event(n: int = 1000) -> dict:
+    out = {}
+    for case, event_for in _CASES.items():
+        row = {}
+        for label, make in (("legacy", _Legacy), ("batched", _batched)):
+            sink = _Counting()
+            backend = make(sink)
+            backend.dispatch(move_event(960, 540))
+            sink.syscalls = 0
+            for i in range(1, n + 1):
+                backend.dispatch(event_for(i))
+            row[label] = sink.syscalls / n
+        out[case] = row
+    return out
+
+
+BENCHMARKS = [
+    (f"backends/wayland_{case}_{label}", _bench(make, case))
+    for case in _CASES
+    for label, make in (("legacy", _Legacy), ("batched", _batched))
+]
+
+
+if __name__ == "__main__":
+    for case, row in syscalls_per_event().items():
+        print(f"  {case:<22} syscalls/event  legacy {row['legacy']:.2f}  batched {row['batched']:.2f}")
@@ -0,0 +1,44 @@
+"""Whole-session evaluation: frame-by-frame GestureFSM vs BatchGestureEvaluator, plus quality analytics."""
+
+import numpy as np
+
+from benchmarks.common import synthetic_session, as_landmark_objects
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.batch_fsm import BatchGestureEvaluator
+from kinemouse.utils.session_io import RecordedSession
+from kinemouse.utils.session_analytics import analyze_session
+
+_CFG = KineMouseConfig()
+_FRAMES = 900   # 30 s at 30 fps
+
+
+def _per_frame_session():
+    frames = [as_landmark_objects(p) for p in synthetic_session(_FRAMES)]
+
+    def run():
+        fsm = GestureFSM(_CFG, (1920, 1080))
+        for lm in frames:
+            fsm.process(lm)
+    return run
+
+
+def _batch_session():
+    landmarks = synthetic_session(_FRAMES)
+    timestamps = np.arange(_FRAMES) / 30.0
+    evaluator = BatchGestureEvaluator(_CFG)
+    return lambda: evaluator.evaluate(landmarks, timestamps)
+
+
+def _analytics_session():
+    landmarks = synthetic_session(_FRAMES)
+    session = RecordedSession(np.arange(_FRAMES) / 30.0, landmarks, np.ones(_FRAMES, dtype=bool))
+    result = BatchGestureEvaluator(_CFG).evaluate_session(session)
+    return lambda: analyze_session(session, _CFG, result=result)
+
+
+BENCHMARKS = [
+    ("batch/per_frame_fsm_30s_session", _per_frame_session),
+    ("batch/batch_evaluator_30s_session", _batch_session),
+    ("batch/analytics_metrics_30s_session", _analytics_session),
+]
@@ -0,0 +1,70 @@
+"""
+Camera-loop cost of handing events to the dispatch thread, and how many
+stale MOVEs reach a slow backend.
+
+dispatch/submit_move_coalescing times one submit() against a backend that
+takes 2 ms per event; the dispatcher keeps only the latest MOVE, so the
+backend never falls behind the hand. The baseline is the bounded
+queue.Queue put the main loop used before.
+
+dispatch/interpolator_step is one timer tick of the cursor interpolator
+(position update plus a MOVE handed to the dispatcher), paid up to
+cursor_output_hz times a second off the camera loop.
+"""
+
+import queue
+import time
+
+from kinemouse.backends.cursor_interpolator import CursorInterpolator
+from kinemouse.backends.dispatcher import CoalescingDispatcher
+from kinemouse.state.events import move_event
+from kinemouse.utils.config import KineMouseConfig
+
+
+class _SlowBackend:
+    def dispatch(self, event):
+        time.sleep(0.002)
+
+
+def _submit_move():
+    d = CoalescingDispatcher(_SlowBackend())
+    d.start()
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        d.submit(move_event(i & 1023, 500))
+    return run
+
+
+def _queue_put_nowait():
+    q: queue.Queue = queue.Queue(maxsize=4)
+    event = move_event(960, 540)
+
+    def run():
+        try:
+            q.put_nowait(event)
+        except queue.Full:
+            pass        # the old main loop dropped the new event
+    return run
+
+
+def _interpolator_step():
+    d = CoalescingDispatcher(_SlowBackend())
+    d.start()
+    interp = CursorInterpolator(d, KineMouseConfig(cursor_interpolation=True))
+    state = [0.0]
+
+    def run():
+        t = state[0] = state[0] + 1.0 / 120
+        if not interp.gliding:
+            interp._set_target((int(t * 3000) & 1023, 500), t)
+        interp.step(t)
+    return run
+
+
+BENCHMARKS = [
+    ("dispatch/submit_move_coalescing", _submit_move),
+    ("dispatch/queue_put_nowait_baseline", _queue_put_nowait),
+    ("dispatch/interpolator_step", _interpolator_step),
+]
@@ -0,0 +1,94 @@
+"""
+Per-frame feature extraction cost: legacy scalar helpers vs HandFeatures.
+
+The legacy path is what GestureFSM + ScrollGesture + classify_pose used to
+compute independently each frame (D_ref once per consumer, four pinch checks,
+tip/PIP comparisons).
+"""
+
+import numpy as np
+
+from benchmarks.common import synthetic_hand, as_landmark_objects
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import compute_dref, is_pinching
+from kinemouse.state.hand_features import HandFeatures
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.gesture_classifier import PoseClassifier, classify_pose
+
+_CFG = KineMouseConfig()
+
+
+def _legacy_frame():
+    lm = as_landmark_objects(synthetic_hand(np.random.default_rng(1)))
+    cfg = _CFG
+
+    def run():
+        dref = compute_dref(lm)
+        is_pinching(lm, cfg.THUMB_TIP, cfg.INDEX_TIP, dref, cfg.pinch_threshold)
+        is_pinching(lm, cfg.THUMB_TIP, cfg.MIDDLE_TIP, dref, cfg.pinch_threshold)
+        dref = compute_dref(lm)
+        is_pinching(lm, cfg.THUMB_TIP, cfg.RING_TIP, dref, cfg.pinch_threshold)
+        is_pinching(lm, cfg.THUMB_TIP, cfg.INDEX_TIP, dref, cfg.pinch_threshold)
+        [lm[t].y < lm[p].y for t, p in ((8, 6), (12, 10), (16, 14), (20, 18))]
+    return run
+
+
+def _features_frame():
+    lm = as_landmark_objects(synthetic_hand(np.random.default_rng(1)))
+
+    def run():
+        f = HandFeatures(lm, _CFG)
+        f.dref
+        f.pinch_index, f.pinch_middle, f.pinch_ring
+        f.extended
+    return run
+
+
+def _features_pinch_only():
+    lm = as_landmark_objects(synthetic_hand(np.random.default_rng(1)))
+
+    def run():
+        f = HandFeatures(lm, _CFG)
+        f.pinch_index
+    return run
+
+
+def _pose_legacy():
+    lm = as_landmark_objects(synthetic_hand(np.random.default_rng(1)))
+    return lambda: classify_pose(lm, HandFeatures(lm, _CFG))
+
+
+def _pose_angles():
+    lm = as_landmark_objects(synthetic_hand(np.random.default_rng(1)))
+    classifier = PoseClassifier()
+    return lambda: classifier.classify(lm, HandFeatures(lm, _CFG))
+
+
+def _pose_model(method: str):
+    def setup():
+        from kinemouse.state.pose_model import PoseModel
+        rng = np.random.default_rng(0)
+        hands = np.array([synthetic_hand(rng, pinch=i % 2 == 0) for i in range(2000)])
+        labels = np.array(["PINCH" if i % 2 == 0 else "OPEN" for i in range(2000)])
+        model = PoseModel.fit(hands, labels, method=method)
+        lm = as_landmark_objects(hands[0])
+        return lambda: model.classify(lm)
+    return setup
+
+
+def _fsm_process():
+    lm = as_landmark_objects(synthetic_hand(np.random.default_rng(1)))
+    fsm = GestureFSM(_CFG, (1920, 1080))
+    return lambda: fsm.process(lm)
+
+
+BENCHMARKS = [
+    ("features/legacy_scalar_all_consumers", _legacy_frame),
+    ("features/hand_features_all_consumers", _features_frame),
+    ("features/hand_features_pinch_only", _features_pinch_only),
+    ("features/pose_legacy_tip_pip", _pose_legacy),
+    ("features/pose_joint_angles", _pose_angles),
+    ("features/pose_model_centroid", _pose_model("centroid")),
+    ("features/pose_model_knn_1000", _pose_model("knn")),
+    ("fsm/process_frame", _fsm_process),
+]
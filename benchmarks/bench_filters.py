@@ -0,0 +1,104 @@
+"""Per-frame cost of cursor filters, the tremor notch, the latency predictor, pointer mapping and the landmark filter bank."""
+
+import math
+
+import numpy as np
+
+from benchmarks.common import synthetic_hand
+from kinemouse.state.latency_predictor import LatencyPredictor
+from kinemouse.state.sensitivity import SensitivityController
+from kinemouse.state.tremor_filter import TremorFilter
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import OneEuroFilter, ema_smooth
+from kinemouse.vision.landmark_filter import LandmarkFilterBank
+
+
+def _ema_point():
+    state = [(0.5, 0.5)]
+
+    def run():
+        state[0] = ema_smooth((0.51, 0.49), state[0], 0.25)
+    return run
+
+
+def _one_euro_point():
+    f = OneEuroFilter()
+    t = [0.0]
+
+    def run():
+        t[0] += 1 / 30
+        f((0.5 + 0.01 * np.sin(t[0]), 0.5), t[0])
+    return run
+
+
+def _predictor_point():
+    p = LatencyPredictor()
+    t = [0.0]
+
+    def run():
+        t[0] += 1 / 30
+        p((0.5 + 0.1 * np.sin(t[0]), 0.5), t[0])
+    return run
+
+
+def _landmark_bank():
+    bank = LandmarkFilterBank()
+    frames = [synthetic_hand(np.random.default_rng(i)) for i in range(32)]
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        bank(frames[i & 31], i / 30)
+    return run
+
+
+def _landmark_scalar_filters():
+    """Reference: 21 scalar 2D One Euro filters + z — what the bank replaces."""
+    filters = [OneEuroFilter() for _ in range(32)]
+    frames = [synthetic_hand(np.random.default_rng(i)).tolist() for i in range(32)]
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        pts = frames[i & 31]
+        for k, p in enumerate(pts):
+            filters[k]((p[0], p[1]), i / 30)
+            filters[21 + k % 11]((p[2], 0.0), i / 30)
+    return run
+
+
+def _pointer_map(pointer_mode: str, accel: bool):
+    def setup():
+        sens = SensitivityController(KineMouseConfig(pointer_mode=pointer_mode, pointer_accel=accel))
+        state = [0]
+
+        def run():
+            i = state[0] = state[0] + 1
+            sens.map((0.5 + 0.1 * math.sin(i / 20), 0.5), i / 30, True, (1920, 1080))
+        return run
+    return setup
+
+
+def _tremor_point(adaptive: bool):
+    def setup():
+        f = TremorFilter(adaptive=adaptive)
+        state = [0]
+
+        def run():
+            i = state[0] = state[0] + 1
+            f((0.5 + 0.01 * math.sin(i * 1.7), 0.5), i / 30)
+        return run
+    return setup
+
+
+BENCHMARKS = [
+    ("filters/ema_point", _ema_point),
+    ("filters/one_euro_point", _one_euro_point),
+    ("filters/tremor_notch_point", _tremor_point(False)),
+    ("filters/tremor_adaptive_point", _tremor_point(True)),
+    ("filters/latency_predictor_point", _predictor_point),
+    ("filters/landmark_bank_63_coords", _landmark_bank),
+    ("filters/landmark_scalar_filters_63_coords", _landmark_scalar_filters),
+    ("filters/pointer_absolute", _pointer_map("absolute", False)),
+    ("filters/pointer_relative_accel_lut", _pointer_map("relative", True)),
+]
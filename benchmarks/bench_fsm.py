@@ -0,0 +1,45 @@
+"""Per-frame cost of the gesture state-transition step (compiled table dispatch),
+and what shadow mode adds to the camera loop (one queue put)."""
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.events import move_event
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.shadow_eval import ShadowEvaluator
+
+# pinch, release, quick re-pinch (drag), release, pause, right-click pinch, open
+_SEQUENCE = (
+    [(True, False)] * 10 + [(False, False)] * 5 + [(True, False)] * 10
+    + [(False, False)] * 20 + [(False, True)] * 5 + [(False, False)] * 14
+)
+
+
+def _transition(click_mode: str):
+    def setup():
+        fsm = GestureFSM(KineMouseConfig(click_mode=click_mode), (1920, 1080))
+        state = [0]
+
+        def run():
+            i = state[0] = state[0] + 1
+            p_index, p_middle = _SEQUENCE[i & 63]
+            fsm._transition(p_index, p_middle, (i & 1023, 500), i / 30)
+        return run
+    return setup
+
+
+def _shadow_submit():
+    shadows = ShadowEvaluator(KineMouseConfig(), (1920, 1080), {"one_euro": {"smoothing": "one_euro"}})
+    shadows.start()
+    event = move_event(960, 540)
+    state = [0]
+
+    def run():
+        i = state[0] = state[0] + 1
+        shadows.submit(None, i / 30, event)
+    return run
+
+
+BENCHMARKS = [
+    ("fsm/transition_double_pinch", _transition("double_pinch")),
+    ("fsm/transition_speculative", _transition("speculative")),
+    ("fsm/shadow_submit", _shadow_submit),
+]
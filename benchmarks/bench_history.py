@@ -0,0 +1,51 @@
+"""GestureHistory ring: append, zero-copy window and vectorized stats on an all-day buffer."""
+
+import numpy as np
+
+from kinemouse.state.events import click_event, move_event
+from kinemouse.state.gesture_history import GestureHistory
+
+_CAPACITY = 200_000
+
+
+def _full_history() -> GestureHistory:
+    history = GestureHistory(_CAPACITY)
+    rng = np.random.default_rng(0)
+    t = np.cumsum(rng.exponential(0.1, size=_CAPACITY + 1000))
+    for i, ts in enumerate(t):
+        history.record(click_event(0, 0) if i % 7 == 0 else move_event(i & 1023, 500), timestamp=float(ts))
+    return history
+
+
+def _record():
+    history = GestureHistory(_CAPACITY)
+    event = move_event(960, 540)
+    state = [0.0]
+
+    def run():
+        state[0] += 0.033
+        history.record(event, timestamp=state[0])
+    return run
+
+
+def _last_n():
+    history = _full_history()
+    return lambda: history.last_n(1000)
+
+
+def _rates():
+    history = _full_history()
+    return lambda: history.rates(window_s=60.0)
+
+
+def _counts_full():
+    history = _full_history()
+    return history.counts
+
+
+BENCHMARKS = [
+    ("history/record", _record),
+    ("history/last_n_1000", _last_n),
+    ("history/rates_last_minute_200k", _rates),
+    ("history/counts_200k", _counts_full),
+]
@@ -0,0 +1,99 @@
+"""
+SQLiteHistoryStore queries over synthetic history at about 2M events a
+month: one month (2M rows) and five months (10M rows). The "last week"
+queries touch the same rows at both sizes, so their times should match;
+the rows outside the window must not matter.
+
+Each database is built once per run in a temporary directory (about 15 s
+per 2M rows).
+"""
+
+import atexit
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from kinemouse.state.events import EventType
+from kinemouse.state.history_store import SQLiteHistoryStore, _INSERT, _SCHEMA
+
+_MONTH = 30 * 86400.0
+_ROWS_PER_MONTH = 2_000_000
+_CHUNK = 500_000
+_stores = {}
+
+
+def _shared_store(months: int) -> SQLiteHistoryStore:
+    if months not in _stores:
+        tmp = Path(tempfile.mkdtemp(prefix="kinemouse-bench-"))
+        atexit.register(shutil.rmtree, tmp, ignore_errors=True)
+        path = tmp / "history.db"
+        rng = np.random.default_rng(0)
+        conn = sqlite3.connect(str(path))
+        conn.executescript(_SCHEMA)
+        for month in range(months):
+            for part in range(_ROWS_PER_MONTH // _CHUNK):
+                t0 = (months - month - 1) * _MONTH + part * _MONTH * _CHUNK / _ROWS_PER_MONTH
+                ts = np.sort(rng.uniform(t0, t0 + _MONTH * _CHUNK / _ROWS_PER_MONTH, _CHUNK))
+                types = rng.choice(
+                    [EventType.MOVE.value, EventType.CLICK.value, EventType.MOUSE_DOWN.value,
+                     EventType.MOUSE_UP.value, EventType.SCROLL.value],
+                    size=_CHUNK, p=[0.8, 0.08, 0.05, 0.05, 0.02],
+                )
+                durations = np.where(types == EventType.MOUSE_UP.value, rng.exponential(400.0, _CHUNK), np.nan)
+                with conn:
+                    conn.executemany(_INSERT, [
+                        (t, int(k), 100, 100, None if np.isnan(d) else d)
+                        for t, k, d in zip(ts.tolist(), types.tolist(), durations.tolist())
+                    ])
+        conn.close()
+        # Opening the store fills the hourly rollup for the bulk-loaded rows
+        store = _stores[months] = SQLiteHistoryStore(str(path))
+        atexit.register(store.close)
+    return _stores[months]
+
+
+def _end(months: int) -> float:
+    return months * _MONTH
+
+
+def _clicks_per_hour_last_week(months: int):
+    def setup():
+        store = _shared_store(months)
+        return lambda: store.per_bucket(EventType.CLICK, start=_end(months) - 7 * 86400.0)
+    return setup
+
+
+def _counts_last_week(months: int):
+    def setup():
+        store = _shared_store(months)
+        return lambda: store.counts(start=_end(months) - 7 * 86400.0)
+    return setup
+
+
+def _short_drags_last_week(months: int):
+    def setup():
+        store = _shared_store(months)
+        return lambda: store.drags(max_duration_ms=100.0, start=_end(months) - 7 * 86400.0)
+    return setup
+
+
+def _one_minute_range(months: int):
+    def setup():
+        store = _shared_store(months)
+        return lambda: store.range(start=_end(months) / 2, end=_end(months) / 2 + 60.0)
+    return setup
+
+
+BENCHMARKS = [
+    (f"history_store/{name}_{months * 2}M", bench(months))
+    for months in (1, 5)
+    for name, bench in (
+        ("clicks_per_hour_last_week", _clicks_per_hour_last_week),
+        ("counts_last_week", _counts_last_week),
+        ("drags_under_100ms_last_week", _short_drags_last_week),
+        ("range_one_minute", _one_minute_range),
+    )
+]
@@ -0,0 +1,31 @@
+"""
+Per-frame cost of the motion-gesture recognizer versus the number of templates.
+Flat while NumPy call overhead dominates, then linear in templates × length.
+"""
+
+import math
+
+from kinemouse.state.motion_gestures import MotionGestureRecognizer, builtin_templates
+
+# Palm circling slowly: every frame moves, so every template column is updated
+_PATH = [(0.5 + 0.1 * math.cos(i / 10), 0.5 + 0.1 * math.sin(i / 10)) for i in range(1024)]
+
+
+def _update(copies: int):
+    def setup():
+        r = MotionGestureRecognizer(templates=builtin_templates() * copies, threshold=0.0)
+        state = [0]
+
+        def run():
+            i = state[0] = state[0] + 1
+            r.update(_PATH[i & 1023], i / 30)
+        return run
+    return setup
+
+
+BENCHMARKS = [
+    ("motion/update_12_templates", _update(1)),
+    ("motion/update_48_templates", _update(4)),
+    ("motion/update_192_templates", _update(16)),
+    ("motion/update_600_templates", _update(50)),
+]
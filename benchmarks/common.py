@@ -0,0 +1,84 @@
+"""
+Shared helpers for the KineMouse micro-benchmarks.
+
+Each bench_*.py module exposes a BENCHMARKS list of (name, setup) pairs,
+where setup() returns a zero-argument callable to be timed. run_benchmarks.py
+discovers and runs them all.
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def synthetic_hand(rng: np.random.Generator, pinch: bool = True) -> np.ndarray:
+    """A plausible (21, 3) hand: wrist low, fingers spread upward, optional pinch."""
+    pts = np.zeros((21, 3))
+    pts[0] = (0.5, 0.8, 0.0)
+    for finger in range(5):
+        base = 1 + finger * 4
+        for joint in range(4):
+            pts[base + joint] = (0.38 + 0.06 * finger, 0.65 - 0.06 * joint, 0.0)
+    if pinch:
+        pts[8] = pts[4] + (0.005, 0.0, 0.0)
+    pts[:, :2] += rng.normal(0.0, 0.002, size=(21, 2))
+    return pts
+
+
+def synthetic_session(n_frames: int = 900, seed: int = 0) -> np.ndarray:
+    """(N, 21, 3) landmark array: alternating pinch/open with a drifting hand."""
+    rng = np.random.default_rng(seed)
+    frames = np.empty((n_frames, 21, 3))
+    for i in range(n_frames):
+        frames[i] = synthetic_hand(rng, pinch=(i // 15) % 2 == 0)
+        frames[i, :, 0] += 0.1 * np.sin(i / 40.0)
+    return frames
+
+
+def as_landmark_objects(points: np.ndarray) -> List[SimpleNamespace]:
+    """Mimic a MediaPipe landmark list from a (21, 3) array."""
+    return [SimpleNamespace(x=float(p[0]), y=float(p[1]), z=float(p[2])) for p in points]
+
+
+def time_per_call_us(fn: Callable[[], object], min_time: float = 0.2) -> float:
+    """Run fn repeatedly for at least min_time seconds; return mean µs per call."""
+    n = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            return elapsed / n * 1e6
+        n *= 2
+
+
+def retained_per_call(fn: Callable[[], object], n: int = 2000) -> Tuple[float, float]:
+    """
+    Call fn n times, keeping every result alive (as a frame loop hands each
+    event to the dispatcher); return the mean (blocks, bytes) still allocated
+    per call. Shared or interned results cost nothing; fresh objects count
+    with all their parts (instance, __dict__, position tuple).
+    """
+    for _ in range(16):
+        fn()   # warm caches and lazily built state
+    keep = [None] * n
+    tracemalloc.start()
+    try:
+        blocks0 = sys.getallocatedblocks()
+        bytes0 = tracemalloc.get_traced_memory()[0]
+        for i in range(n):
+            keep[i] = fn()
+        blocks = sys.getallocatedblocks() - blocks0
+        size = tracemalloc.get_traced_memory()[0] - bytes0
+    finally:
+        tracemalloc.stop()
+    del keep
+    return blocks / n, size / n
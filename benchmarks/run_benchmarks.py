@@ -0,0 +1,57 @@
+"""
+run_benchmarks.py — run the KineMouse micro-benchmark suite.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --filter features
+    python benchmarks/run_benchmarks.py --json results.json
+    python benchmarks/run_benchmarks.py --filter alloc --alloc
+"""
+
+import sys
+import json
+import argparse
+import importlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import retained_per_call, time_per_call_us
+
+
+def discover():
+    """Yield (name, setup) pairs from every benchmarks/bench_*.py module."""
+    for path in sorted(Path(__file__).parent.glob("bench_*.py")):
+        module = importlib.import_module(f"benchmarks.{path.stem}")
+        yield from getattr(module, "BENCHMARKS", [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run KineMouse micro-benchmarks")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per benchmark")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file")
+    parser.add_argument("--alloc", action="store_true",
+                        help="Also report memory blocks/bytes retained per call")
+    args = parser.parse_args()
+
+    results = {}
+    for name, setup in discover():
+        if args.filter not in name:
+            continue
+        us = time_per_call_us(setup(), min_time=args.min_time)
+        results[name] = round(us, 3)
+        if args.alloc:
+            blocks, size = retained_per_call(setup())
+            results[name + ":blocks"] = round(blocks, 2)
+            results[name + ":bytes"] = round(size, 1)
+            print(f"  {name:<48} {us:>10.2f} µs {blocks:>7.2f} blocks {size:>8.1f} B")
+        else:
+            print(f"  {name:<48} {us:>10.2f} µs")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,14 @@ Useful for:
   - Debugging gesture recognition
   - Building test fixtures
 
+Frames can carry a ground-truth pose "label" for tools/pose_eval.py: pass
+--label for the whole recording, or press keys in the preview window while
+recording (1 OPEN_HAND, 2 FIST, 3 PEACE, 4 THUMBS_UP, 0 clear).
+
 Usage:
     python examples/record_session.py --out session.json --duration 30
     python examples/record_session.py --camera 1 --out my_session.json
+    python examples/record_session.py --out fist.json --label FIST
 """
 
 import sys
@@ -29,6 +34,8 @@ import cv2
 
 log = get_logger("record")
 
+LABEL_KEYS = {ord("1"): "OPEN_HAND", ord("2"): "FIST", ord("3"): "PEACE", ord("4"): "THUMBS_UP", ord("0"): None}
+
 
 def landmark_to_dict(lm) -> dict:
     return {"x": round(lm.x, 5), "y": round(lm.y, 5), "z": round(lm.z, 5)}
@@ -40,7 +47,9 @@ def main():
     parser.add_argument("--camera", type=int, default=0)
     parser.add_argument("--duration", type=float, default=None, help="Max recording duration in seconds")
     parser.add_argument("--no-preview", action="store_true")
+    parser.add_argument("--label", default=None, help="Pose label stored on every frame (e.g. FIST)")
     args = parser.parse_args()
+    label = args.label
 
     init_logging("INFO")
     config = KineMouseConfig(camera_index=args.camera)
@@ -54,7 +63,8 @@ def main():
     with HandTracker(config) as tracker:
         while True:
             hf = tracker.next_frame()
-            elapsed = time.monotonic() - t_start
+            # Capture time, so replay reproduces the FSM's timing exactly
+            elapsed = (hf.timestamp or time.monotonic()) - t_start
 
             if args.duration and elapsed > args.duration:
                 break
@@ -64,9 +74,11 @@ def main():
                 "found": hf.found,
                 "landmarks": [landmark_to_dict(lm) for lm in hf.landmarks] if hf.found and hf.landmarks else [],
             }
+            if label:
+                record["label"] = label
 
             if hf.found:
-                event = fsm.process(hf.landmarks)
+                event = fsm.process(hf.landmarks, timestamp=hf.timestamp)
                 record["event"] = event.type.name
                 record["pos"] = list(event.position) if event.position else None
             else:
@@ -77,11 +89,14 @@ def main():
             frames.append(record)
 
             if not args.no_preview and hf.annotated_frame is not None:
-                cv2.putText(hf.annotated_frame, f"REC {len(frames)} frames", (10, 30),
+                cv2.putText(hf.annotated_frame, f"REC {len(frames)} frames  {label or ''}", (10, 30),
                             cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
                 cv2.imshow("Recording", hf.annotated_frame)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q'):
                     break
+                if key in LABEL_KEYS:
+                    label = LABEL_KEYS[key]
 
     cv2.destroyAllWindows()
     out_path = Path(args.out)
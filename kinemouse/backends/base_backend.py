@@ -1,12 +1,24 @@
 """
 BaseBackend — Abstract interface all OS backends must implement.
 Layer 3 contract.
+
+The base class remembers the last position it sent to the OS. dispatch()
+skips a MOVE to that same position (counted in skipped_moves). Button
+methods use _position_changed() to skip repositioning when the cursor is
+already there. The remembered position is trusted for POSITION_TTL_S only,
+because the physical mouse may have moved the pointer since.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Optional, Tuple
 from kinemouse.state.events import MouseEvent, EventType
 from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+POSITION_TTL_S = 0.25   # how long the last sent position is assumed to still be the pointer's
 
 
 class BaseBackend(ABC):
@@ -17,6 +29,23 @@ class BaseBackend(ABC):
 
     def __init__(self, config: KineMouseConfig):
         self.config = config
+        self._scroll_units = 0   # hi-res wheel units not yet sent as a whole notch
+        self._clock = time.monotonic
+        self._last_pos: Optional[Tuple[int, int]] = None   # last position sent to the OS
+        self._last_pos_at = 0.0
+        self.skipped_moves = 0
+
+    def _position_changed(self, x: int, y: int) -> bool:
+        """
+        True if (x, y) must be sent: it differs from the last sent position,
+        or that one is too old to trust. Records (x, y) as sent.
+        """
+        now = self._clock()
+        if self._last_pos == (x, y) and now - self._last_pos_at < POSITION_TTL_S:
+            return False
+        self._last_pos = (x, y)
+        self._last_pos_at = now
+        return True
 
     @abstractmethod
     def get_screen_resolution(self) -> Tuple[int, int]:
@@ -42,18 +71,66 @@ class BaseBackend(ABC):
     def mouse_up(self, x: int, y: int) -> None:
         """Release the left mouse button at (x, y) — end drag."""
 
+    def scroll_hires(self, units: int) -> None:
+        """
+        Scroll by high-resolution wheel units (120 = one notch, positive = up).
+        Backends with native hi-res wheels override this; the default sums
+        units into whole notches for _scroll_notches.
+        """
+        total = self._scroll_units + units
+        notches = int(total / 120)        # toward zero; the rest waits for more units
+        self._scroll_units = total - notches * 120
+        if notches:
+            self._scroll_notches(notches)
+
+    def _scroll_notches(self, notches: int) -> None:
+        """Scroll whole wheel notches (positive = up). Uses ScrollMixin.scroll when mixed in."""
+        scroll = getattr(self, "scroll", None)
+        if scroll is None:
+            log.debug("%s cannot scroll", type(self).__name__)
+            return
+        from kinemouse.state.scroll_gesture import ScrollDirection
+        scroll(ScrollDirection.UP if notches > 0 else ScrollDirection.DOWN, abs(notches))
+
+    def motion_gesture(self, name: str) -> None:
+        """
+        Run the action bound to a motion gesture in config.motion_gesture_actions.
+        Backends with KeyboardMixin send it as a hotkey; others log and ignore it.
+        """
+        combo = self.config.motion_gesture_actions.get(name)
+        if not combo:
+            return
+        send = getattr(self, "send_hotkey", None)
+        if send is None:
+            log.debug("Motion gesture %s: %s cannot send hotkeys", name, type(self).__name__)
+            return
+        try:
+            send(combo)
+        except ValueError as e:
+            log.warning("Motion gesture %s: %s", name, e)
+
     def dispatch(self, event: MouseEvent) -> None:
         """
         Dispatch a MouseEvent to the appropriate OS action.
         This is the single entry point called by the main loop.
         """
+        if event.type == EventType.MOTION_GESTURE:
+            self.motion_gesture(event.gesture)
+            return
+        if event.type == EventType.SCROLL:
+            self.scroll_hires(event.amount)
+            return
+
         if event.position is None and event.type not in (EventType.IDLE,):
             return
 
         pos = event.position or (0, 0)
 
         if event.type == EventType.MOVE:
-            self.move(*pos)
+            if self._position_changed(*pos):
+                self.move(*pos)
+            else:
+                self.skipped_moves += 1
         elif event.type == EventType.CLICK:
             self.click(*pos)
         elif event.type == EventType.RIGHT_CLICK:
@@ -0,0 +1,171 @@
+"""
+CursorInterpolator — cursor MOVEs at display rate between camera-rate targets.
+
+The FSM produces a cursor target once per camera frame (30 Hz), so on a
+60–240 Hz display the pointer visibly steps even when tracking is accurate.
+The interpolator sits between the camera loop and the CoalescingDispatcher.
+Each FSM MOVE becomes a new target. A dispatch-side thread, woken by a
+PeriodicTimer (timerfd on Linux) at cursor_output_hz, glides the cursor
+from where it is to that target in a straight line. The glide spans one
+measured target interval, so the cursor reaches each target by the time
+the next one arrives. Interpolation therefore adds at most one target
+interval of delay. The thread blocks when the cursor is at rest.
+
+Everything still goes through the dispatcher as absolute MOVEs, so it works
+the same with the uinput and pynput backends.
+
+Button events stay ordered against the interpolated moves. A click, press
+or release carries its own position: it ends the glide, the cursor jumps
+there, and the event is handed to the dispatcher under the same lock the
+timer thread emits with. No interpolated MOVE can land after it from the
+old path. Events without a position (scroll, hotkeys) pass straight through.
+
+Usage:
+    interpolator = CursorInterpolator(dispatcher, config)
+    interpolator.start()
+    interpolator.submit(event)        # instead of dispatcher.submit
+    interpolator.stop()               # before dispatcher.stop()
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from kinemouse.state.events import EventType, MouseEvent, move_event
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.hires_timer import PeriodicTimer
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+MAX_GLIDE_S = 0.1   # never stretch one glide longer than this (camera stalls, lost hand)
+
+
+class CursorInterpolator:
+    """Glides the cursor toward the latest FSM target on a high-rate timer thread."""
+
+    def __init__(
+        self,
+        dispatcher,
+        config: KineMouseConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.dispatcher = dispatcher
+        self.config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.interval = 1.0 / config.capture_fps     # running estimate of the target interval
+        self._cur: Optional[Tuple[float, float]] = None   # cursor position (float, unrounded)
+        self._start: Tuple[float, float] = (0.0, 0.0)
+        self._end: Optional[Tuple[int, int]] = None       # target of the glide in progress
+        self._t0 = 0.0
+        self._duration = self.interval
+        self._last_target_at: Optional[float] = None
+        self._sent: Optional[Tuple[int, int]] = None
+
+        self.targets = 0
+        self.interpolated = 0    # MOVEs emitted by the timer thread
+
+    # --- Camera-loop side ---
+
+    def submit(self, event: MouseEvent):
+        """Route one event: MOVEs become glide targets, the rest go out in order."""
+        if event.type == EventType.MOVE:
+            self._set_target(event.position, self._clock())
+            self._wake.set()
+            return
+        with self._lock:
+            if event.position is not None:
+                # The button event moves the cursor itself: end the glide there
+                self._end = None
+                self._cur = (float(event.position[0]), float(event.position[1]))
+                self._sent = event.position
+            self.dispatcher.submit(event)
+
+    def _set_target(self, pos: Tuple[int, int], now: float):
+        with self._lock:
+            if self._last_target_at is not None:
+                gap = now - self._last_target_at
+                if 0 < gap < MAX_GLIDE_S:
+                    self.interval += 0.2 * (gap - self.interval)
+            self._last_target_at = now
+            self.targets += 1
+            if self._cur is None:
+                # First target: nothing to glide from
+                self._cur = (float(pos[0]), float(pos[1]))
+                self._sent = pos
+                self.dispatcher.submit(move_event(*pos))
+                return
+            self._start = self._cur
+            self._end = pos
+            self._t0 = now
+            self._duration = min(max(self.interval, 1.0 / self.config.cursor_output_hz), MAX_GLIDE_S)
+
+    # --- Timer side ---
+
+    @property
+    def gliding(self) -> bool:
+        return self._end is not None
+
+    def step(self, now: float) -> Optional[Tuple[int, int]]:
+        """Advance the glide to `now`; emits and returns a MOVE position if the pixel changed."""
+        with self._lock:
+            if self._end is None:
+                return None
+            k = min(1.0, (now - self._t0) / self._duration)
+            (sx, sy), (ex, ey) = self._start, self._end
+            self._cur = (sx + (ex - sx) * k, sy + (ey - sy) * k)
+            pos = (int(round(self._cur[0])), int(round(self._cur[1])))
+            if k >= 1.0:
+                self._end = None
+            if pos == self._sent:
+                return None
+            self._sent = pos
+            self.interpolated += 1
+            self.dispatcher.submit(move_event(*pos))
+            return pos
+
+    def reset(self):
+        """Forget the cursor (e.g. backend restarted); the next target is sent as is."""
+        with self._lock:
+            self._cur = None
+            self._end = None
+            self._sent = None
+            self._last_target_at = None
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="kinemouse-interp", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the timer thread; a glide still in progress lands on its target."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            if self._end is not None and self._end != self._sent:
+                self._sent = self._end
+                self.dispatcher.submit(move_event(*self._end))
+            self._end = None
+
+    def _run(self):
+        while not self._stopped.is_set():
+            # Sleep until a glide starts
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            with PeriodicTimer(1.0 / self.config.cursor_output_hz) as timer:
+                while self.gliding and not self._stopped.is_set():
+                    timer.wait()
+                    try:
+                        self.step(self._clock())
+                    except Exception as e:
+                        log.warning("Cursor interpolation failed: %s", e)
@@ -0,0 +1,135 @@
+"""
+CoalescingDispatcher — hands events from the camera loop to the OS backend.
+
+A bounded queue that drops on overflow is the wrong shape for mouse
+events: it can lose a MOUSE_UP (a stuck drag) while stale MOVEs queued
+ahead of it are still replayed. Events are split by kind instead:
+
+- MOVE goes into a single latest-value slot. A MOVE arriving before the
+  previous one was applied replaces it (counted as coalesced), so a slow
+  backend always applies the freshest position next.
+- Every other event (clicks, button press/release, scroll, motion
+  gestures) goes into an ordered channel that never drops. That includes
+  the SmoothScroller's momentum scroll, submitted from its timer thread,
+  so the worker is the only thread that touches the backend.
+
+Order is preserved between the two. A button event carrying a position
+supersedes a pending MOVE, because the backend moves there before pressing.
+Events without a position (scroll, hotkeys) push the pending MOVE into the
+channel ahead of themselves. The worker drains the channel first and then
+applies the slot.
+
+The handoff is a Condition wakeup: submit() never blocks on the backend,
+and the worker sleeps only while both are empty. stop() delivers what is
+still pending before the thread exits.
+
+Usage:
+    dispatcher = CoalescingDispatcher(backend)
+    dispatcher.start()
+    dispatcher.submit(event)          # camera loop, every non-idle event
+    dispatcher.stop()
+    dispatcher.stats()                # {"dispatched": 812, "coalesced": 37, ...}
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from kinemouse.state.events import EventType, MouseEvent
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class CoalescingDispatcher:
+    """Latest-value MOVE slot plus a lossless ordered channel, drained by one worker thread."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._cond = threading.Condition()
+        self._move: Optional[MouseEvent] = None       # latest MOVE not yet applied
+        self._channel: Deque[MouseEvent] = deque()    # everything else, in order
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.submitted = 0
+        self.dispatched = 0
+        self.coalesced = 0      # MOVEs replaced before the backend applied them
+        self.errors = 0
+        self.max_backlog = 0    # deepest the channel has been
+
+    def start(self):
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="kinemouse-dispatch", daemon=True)
+        self._thread.start()
+
+    def submit(self, event: MouseEvent):
+        """Queue one event for the backend. Never blocks on the backend."""
+        if event.type == EventType.IDLE:
+            return
+        with self._cond:
+            idle = self._move is None and not self._channel   # only then can the worker be waiting
+            self.submitted += 1
+            if event.type == EventType.MOVE:
+                if self._move is not None:
+                    self.coalesced += 1
+                self._move = event
+            else:
+                if self._move is not None:
+                    if event.position is not None:
+                        self.coalesced += 1               # the button event moves there itself
+                    else:
+                        self._channel.append(self._move)  # keep the position ahead of e.g. a scroll
+                    self._move = None
+                self._channel.append(event)
+                self.max_backlog = max(self.max_backlog, len(self._channel))
+            if idle:
+                self._cond.notify()
+
+    def stop(self, timeout: Optional[float] = 1.0):
+        """Deliver what is still pending, then stop the worker."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._channel) + (self._move is not None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "dispatched": self.dispatched,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "max_backlog": self.max_backlog,
+            }
+
+    def _next(self) -> Optional[MouseEvent]:
+        """Block until there is an event (channel first) or the dispatcher stops."""
+        with self._cond:
+            while not self._channel and self._move is None:
+                if self._stopping:
+                    return None
+                self._cond.wait()
+            if self._channel:
+                return self._channel.popleft()
+            event, self._move = self._move, None
+            return event
+
+    def _run(self):
+        while True:
+            event = self._next()
+            if event is None:
+                break
+            try:
+                self.backend.dispatch(event)
+                self.dispatched += 1
+            except Exception as e:
+                self.errors += 1
+                log.warning("Dispatch of %s failed: %s", event.type.name, e)
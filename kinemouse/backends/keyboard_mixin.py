@@ -0,0 +1,48 @@
+"""
+KeyboardMixin — adds send_hotkey() to backends that can synthesize key presses.
+Used to map motion gestures (swipes, circles) to keyboard shortcuts.
+
+Combos are "+"-separated pynput key names or single characters:
+"ctrl+z", "alt+left", "ctrl+shift+tab", "super+d".
+
+Usage:
+    class LinuxX11Backend(BaseBackend, KeyboardMixin):
+        ...
+    backend.send_hotkey("alt+left")
+"""
+
+from typing import List
+
+
+def parse_hotkey(combo: str) -> List[str]:
+    """Split "ctrl+shift+z" into lower-case key names; a bare "+" is a key."""
+    if combo.strip() == "+":
+        return ["+"]
+    keys = [k.strip().lower() for k in combo.split("+")]
+    if not all(keys):
+        raise ValueError(f"Malformed hotkey {combo!r}")
+    return keys
+
+
+class KeyboardMixin:
+    """
+    Mixin that presses a key combination with the pynput keyboard controller:
+    modifiers down in order, then released in reverse.
+    """
+
+    _keyboard = None
+
+    def send_hotkey(self, combo: str):
+        from pynput.keyboard import Controller, Key
+
+        if self._keyboard is None:
+            self._keyboard = Controller()
+        keys = [getattr(Key, "cmd" if k == "super" else k, None) or k for k in parse_hotkey(combo)]
+        pressed = []
+        try:
+            for key in keys:
+                self._keyboard.press(key)
+                pressed.append(key)
+        finally:
+            for key in reversed(pressed):
+                self._keyboard.release(key)
@@ -11,22 +11,54 @@ Requires:
 """
 
 import os
-from typing import Tuple
+import struct
+from typing import Optional, Tuple
 
 from kinemouse.backends.base_backend import BaseBackend
 from kinemouse.utils.config import KineMouseConfig
 
 
+# Linux input event codes (stable kernel ABI, linux/input-event-codes.h).
+# Kept here so the hot path needs no evdev lookups or imports.
+_EV_SYN, _EV_KEY, _EV_REL, _EV_ABS = 0x00, 0x01, 0x02, 0x03
+_SYN_REPORT = 0x00
+_ABS_X, _ABS_Y = 0x00, 0x01
+_BTN_LEFT, _BTN_RIGHT = 0x110, 0x111
+_REL_WHEEL = 0x08
+_REL_WHEEL_HI_RES = 0x0b   # Linux 5.0+; older python-evdev builds do not name it
+
+# struct input_event: timeval (ignored by uinput), type, code, value
+_EVENT = struct.Struct("llHHi")
+
+
+def _pack(type_: int, code: int, value: int) -> bytes:
+    return _EVENT.pack(0, 0, type_, code, value)
+
+
+_SYN = _pack(_EV_SYN, _SYN_REPORT, 0)
+_LEFT_DOWN = _pack(_EV_KEY, _BTN_LEFT, 1) + _SYN
+_LEFT_UP = _pack(_EV_KEY, _BTN_LEFT, 0) + _SYN
+_RIGHT_CLICK = _pack(_EV_KEY, _BTN_RIGHT, 1) + _SYN + _pack(_EV_KEY, _BTN_RIGHT, 0) + _SYN
+
+
 class LinuxWaylandBackend(BaseBackend):
     """
     Mouse backend for Linux Wayland using evdev uinput virtual device.
     Creates a kernel-level virtual mouse, bypassing Wayland compositor restrictions.
+
+    Each action is packed into one buffer of input_event structs and written
+    with a single write() on the uinput fd: a click (position, press, release,
+    each closed by SYN_REPORT) is one syscall instead of seven. Axes whose
+    value the device already reports are left out.
     """
 
     def __init__(self, config: KineMouseConfig):
         super().__init__(config)
         self._screen_res = self._detect_resolution()
         self._device = self._create_uinput_device()
+        self._fd = self._device.fd
+        self._abs_x: Optional[int] = None    # ABS values the virtual device last reported
+        self._abs_y: Optional[int] = None
 
     def _detect_resolution(self) -> Tuple[int, int]:
         """Detect screen resolution using wayland tools or fallback."""
@@ -58,6 +90,7 @@ class LinuxWaylandBackend(BaseBackend):
                     (e.ABS_X, AbsInfo(value=0, min=0, max=self._screen_res[0], fuzz=0, flat=0, resolution=1)),
                     (e.ABS_Y, AbsInfo(value=0, min=0, max=self._screen_res[1], fuzz=0, flat=0, resolution=1)),
                 ],
+                e.EV_REL: [e.REL_WHEEL, _REL_WHEEL_HI_RES],
                 e.EV_SYN: [],
             }
             return UInput(cap, name="KineMouse Virtual Pointer", version=0x3)
@@ -70,40 +103,47 @@ class LinuxWaylandBackend(BaseBackend):
     def get_screen_resolution(self) -> Tuple[int, int]:
         return self._screen_res
 
-    def _emit(self, x: int, y: int):
-        """Move the virtual pointer to absolute position."""
-        from evdev import ecodes as e
-        self._device.write(e.EV_ABS, e.ABS_X, x)
-        self._device.write(e.EV_ABS, e.ABS_Y, y)
-        self._device.syn()
+    def _write(self, data: bytes):
+        """One write() of one or more packed input events."""
+        os.write(self._fd, data)
+
+    def _abs(self, x: int, y: int) -> bytes:
+        """ABS events for the axes that change, closed by SYN_REPORT (b"" if none)."""
+        data = b""
+        if x != self._abs_x:
+            data += _pack(_EV_ABS, _ABS_X, x)
+            self._abs_x = x
+        if y != self._abs_y:
+            data += _pack(_EV_ABS, _ABS_Y, y)
+            self._abs_y = y
+        return data + _SYN if data else data
 
     def move(self, x: int, y: int) -> None:
-        self._emit(x, y)
+        data = self._abs(x, y)
+        if data:
+            self._write(data)
 
     def click(self, x: int, y: int) -> None:
-        from evdev import ecodes as e
-        self._emit(x, y)
-        self._device.write(e.EV_KEY, e.BTN_LEFT, 1)
-        self._device.syn()
-        self._device.write(e.EV_KEY, e.BTN_LEFT, 0)
-        self._device.syn()
+        self._write(self._abs(x, y) + _LEFT_DOWN + _LEFT_UP)
 
     def right_click(self, x: int, y: int) -> None:
-        from evdev import ecodes as e
-        self._emit(x, y)
-        self._device.write(e.EV_KEY, e.BTN_RIGHT, 1)
-        self._device.syn()
-        self._device.write(e.EV_KEY, e.BTN_RIGHT, 0)
-        self._device.syn()
+        self._write(self._abs(x, y) + _RIGHT_CLICK)
 
     def mouse_down(self, x: int, y: int) -> None:
-        from evdev import ecodes as e
-        self._emit(x, y)
-        self._device.write(e.EV_KEY, e.BTN_LEFT, 1)
-        self._device.syn()
+        self._write(self._abs(x, y) + _LEFT_DOWN)
 
     def mouse_up(self, x: int, y: int) -> None:
-        from evdev import ecodes as e
-        self._emit(x, y)
-        self._device.write(e.EV_KEY, e.BTN_LEFT, 0)
-        self._device.syn()
+        self._write(self._abs(x, y) + _LEFT_UP)
+
+    def scroll_hires(self, units: int) -> None:
+        """
+        Native high-resolution wheel: REL_WHEEL_HI_RES every call, plus the
+        legacy REL_WHEEL notch each 120 units for clients without hi-res support.
+        """
+        data = _pack(_EV_REL, _REL_WHEEL_HI_RES, units)
+        total = self._scroll_units + units
+        notches = int(total / 120)
+        self._scroll_units = total - notches * 120
+        if notches:
+            data += _pack(_EV_REL, _REL_WHEEL, notches)
+        self._write(data + _SYN)
@@ -7,10 +7,11 @@ from typing import Tuple
 from pynput.mouse import Button, Controller
 
 from kinemouse.backends.base_backend import BaseBackend
+from kinemouse.backends.keyboard_mixin import KeyboardMixin
 from kinemouse.utils.config import KineMouseConfig
 
 
-class LinuxX11Backend(BaseBackend):
+class LinuxX11Backend(BaseBackend, KeyboardMixin):
     """Mouse backend for Linux X11 (Xorg) using pynput."""
 
     def __init__(self, config: KineMouseConfig):
@@ -38,21 +39,29 @@ class LinuxX11Backend(BaseBackend):
         self._mouse.position = (x, y)
 
     def click(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.click(Button.left, 1)
 
     def right_click(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.click(Button.right, 1)
 
     def mouse_down(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.press(Button.left)
 
     def mouse_up(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.release(Button.left)
 
+    def _scroll_notches(self, notches: int) -> None:
+        # X11 wheel events are whole button 4/5 clicks
+        self._mouse.scroll(0, notches)
+
 
 # --- Scroll support ---
 from kinemouse.backends.scroll_mixin import ScrollMixin
@@ -5,9 +5,10 @@ macOS Backend — uses pynput (Quartz CoreGraphics) for cursor control on macOS
 from typing import Tuple
 from pynput.mouse import Button, Controller
 from kinemouse.backends.base_backend import BaseBackend
+from kinemouse.backends.keyboard_mixin import KeyboardMixin
 from kinemouse.utils.config import KineMouseConfig
 
-class MacOSBackend(BaseBackend):
+class MacOSBackend(BaseBackend, KeyboardMixin):
     def __init__(self, config: KineMouseConfig):
         super().__init__(config)
         self._mouse = Controller()
@@ -29,17 +30,24 @@ class MacOSBackend(BaseBackend):
         self._mouse.position = (x, y)
 
     def click(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.click(Button.left, 1)
 
     def right_click(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.click(Button.right, 1)
 
     def mouse_down(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.press(Button.left)
 
     def mouse_up(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.release(Button.left)
+
+    def _scroll_notches(self, notches: int) -> None:
+        self._mouse.scroll(0, notches)
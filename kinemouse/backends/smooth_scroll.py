@@ -0,0 +1,163 @@
+"""
+SmoothScroller — continuous, momentum-based scrolling delivered from its own
+high-rate timer instead of the camera loop.
+
+The gesture side only sets a target velocity (wheel notches per second,
+positive = up) each camera frame, or releases it. A dispatch-side thread
+wakes at scroll_rate_hz on a PeriodicTimer and integrates the velocity into
+high-resolution wheel units (120 per notch), so pages glide at 120 Hz
+even though the hand is only seen at 30. After release the velocity decays
+exponentially (scroll_friction_ms), giving the inertial coast of a touchpad
+flick. The thread blocks when there is nothing to scroll.
+
+The units go out as SCROLL events through the dispatcher (the same sink
+the camera loop submits to), so a single thread owns the backend and
+scrolls stay ordered against clicks and drags. The backend applies them
+with BaseBackend.scroll_hires, which sends them natively where the OS
+supports high-resolution wheels and accumulates whole notches elsewhere.
+
+Usage:
+    scroller = SmoothScroller(dispatcher, config)
+    scroller.start()
+    scroller.set_velocity(6.0)     # each frame while the scroll gesture is held
+    scroller.release()             # gesture ended — coast to a stop
+    scroller.stop()
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+from kinemouse.state.events import scroll_event
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.hires_timer import PeriodicTimer
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+WHEEL_UNITS = 120   # high-resolution units per wheel notch
+
+
+class ScrollMomentum:
+    """
+    Scroll velocity integrator: follows a target velocity while the gesture
+    is held, coasts with exponential decay after release. step() returns
+    whole high-resolution units and carries the fraction to the next step.
+    """
+
+    def __init__(self, friction_ms: float = 350.0, response_ms: float = 50.0, stop_speed: float = 0.3):
+        self.friction_ms = friction_ms    # decay time constant after release (0 = stop at once)
+        self.response_ms = response_ms    # how fast the velocity follows the gesture
+        self.stop_speed = stop_speed      # notches/s — coasting ends below this
+        self.target: Optional[float] = None
+        self.velocity = 0.0
+        self._remainder = 0.0
+        self._last: Optional[float] = None
+
+    @property
+    def idle(self) -> bool:
+        """Nothing to scroll until a new target is set."""
+        return self.target is None and self.velocity == 0.0
+
+    def set_target(self, velocity: float):
+        self.target = velocity
+
+    def release(self):
+        self.target = None
+
+    def reset(self):
+        self.target = None
+        self.velocity = 0.0
+        self._remainder = 0.0
+        self._last = None
+
+    def step(self, now: float) -> int:
+        """Advance to `now`; returns the high-resolution units to send (+ = up)."""
+        if self._last is None:
+            self._last = now
+            return 0
+        dt = now - self._last
+        self._last = now
+        if dt <= 0:
+            return 0
+
+        v0 = self.velocity
+        if self.target is not None:
+            k = 1.0 - math.exp(-dt * 1000.0 / self.response_ms) if self.response_ms > 0 else 1.0
+            self.velocity = v0 + (self.target - v0) * k
+        else:
+            decay = math.exp(-dt * 1000.0 / self.friction_ms) if self.friction_ms > 0 else 0.0
+            self.velocity = v0 * decay
+            if abs(self.velocity) < self.stop_speed:
+                self.velocity = 0.0
+
+        travel = self._remainder + 0.5 * (v0 + self.velocity) * dt * WHEEL_UNITS
+        units = int(travel)          # toward zero; the fraction carries over
+        self._remainder = travel - units if not self.idle else 0.0
+        return units
+
+
+class SmoothScroller:
+    """Runs a ScrollMomentum on a background PeriodicTimer thread, submitting SCROLL events to a sink."""
+
+    def __init__(
+        self,
+        sink,
+        config: KineMouseConfig,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.sink = sink                  # CoalescingDispatcher (or anything with submit(event))
+        self.config = config
+        self._clock = clock
+        self.momentum = ScrollMomentum(friction_ms=config.scroll_friction_ms)
+        self._lock = threading.Lock()     # momentum is shared with the camera loop
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def set_velocity(self, notches_per_s: float):
+        """Target scroll speed for the current frame (gesture held)."""
+        with self._lock:
+            self.momentum.set_target(notches_per_s)
+        self._wake.set()
+
+    def release(self):
+        """Gesture ended: coast to a stop."""
+        with self._lock:
+            self.momentum.release()
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="kinemouse-scroll", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        momentum = self.momentum
+        while not self._stopped.is_set():
+            # Sleep until there is something to scroll
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            with PeriodicTimer(1.0 / self.config.scroll_rate_hz) as timer:
+                with self._lock:
+                    momentum.friction_ms = self.config.scroll_friction_ms
+                    momentum.step(self._clock())
+                while True:
+                    timer.wait()
+                    with self._lock:
+                        # Idle check and reset together, so a concurrent set_velocity is never wiped
+                        if momentum.idle or self._stopped.is_set():
+                            momentum.reset()
+                            break
+                        units = momentum.step(self._clock())
+                    if units:
+                        self.sink.submit(scroll_event(units))
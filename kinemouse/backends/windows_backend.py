@@ -5,9 +5,10 @@ Windows Backend — uses pynput for cursor control on Windows 10/11.
 from typing import Tuple
 from pynput.mouse import Button, Controller
 from kinemouse.backends.base_backend import BaseBackend
+from kinemouse.backends.keyboard_mixin import KeyboardMixin
 from kinemouse.utils.config import KineMouseConfig
 
-class WindowsBackend(BaseBackend):
+class WindowsBackend(BaseBackend, KeyboardMixin):
     def __init__(self, config: KineMouseConfig):
         super().__init__(config)
         self._mouse = Controller()
@@ -25,17 +26,25 @@ class WindowsBackend(BaseBackend):
         self._mouse.position = (x, y)
 
     def click(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.click(Button.left, 1)
 
     def right_click(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.click(Button.right, 1)
 
     def mouse_down(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.press(Button.left)
 
     def mouse_up(self, x: int, y: int) -> None:
-        self._mouse.position = (x, y)
+        if self._position_changed(x, y):
+            self._mouse.position = (x, y)
         self._mouse.release(Button.left)
+
+    def scroll_hires(self, units: int) -> None:
+        # pynput sends dy * WHEEL_DELTA (120) as the wheel delta, so fractions are hi-res
+        self._mouse.scroll(0, units / 120)
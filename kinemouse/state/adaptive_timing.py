@@ -0,0 +1,212 @@
+"""
+Adaptive double-pinch window — learns each user's release-to-repinch timing.
+
+A fixed double_pinch_window_ms makes fast users wait on every single click
+and lets slow users' drags fall apart into clicks. DoublePinchLearner
+watches the index pinch, measures every release → re-pinch interval and
+keeps a streaming estimate of a high quantile of those intervals (the P²
+algorithm: five markers, O(1) per sample, no stored samples). The window
+is that quantile plus a safety margin, clamped to [min_ms, max_ms]: the
+shortest window that still catches the target share of the user's own
+double-pinches.
+
+Only plausible double-pinches count: the gap must be below max_ms and the
+second pinch must be held for min_hold_ms (a flicker is not a re-pinch).
+Until min_samples intervals are seen, the configured window is used.
+
+The estimator state is a small dict, persisted per profile with
+config_io.save_profile so learning carries over between runs.
+
+Usage:
+    learner = DoublePinchLearner(reliability=0.95)
+    learner.update(pinching, now)         # every frame
+    window = learner.window_ms(config.double_pinch_window_ms)
+
+    save_profile("alice", {"double_pinch": learner.state()})
+    learner.load_state(load_profile("alice").get("double_pinch"))
+"""
+
+import math
+from typing import List, Optional
+
+import numpy as np
+
+
+class P2Quantile:
+    """Streaming quantile estimate (Jain & Chlamtac P²) in constant memory."""
+
+    def __init__(self, q: float):
+        if not 0.0 < q < 1.0:
+            raise ValueError("q must be in (0, 1)")
+        self.q = q
+        self.count = 0
+        self._h: List[float] = []                      # marker heights
+        self._n = [0.0, 1.0, 2.0, 3.0, 4.0]            # marker positions
+        self._want = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+        self._step = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, x: float):
+        self.count += 1
+        h = self._h
+        if self.count <= 5:
+            h.append(x)
+            h.sort()
+            return
+
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= h[k + 1]:
+                k += 1
+        n = self._n
+        for i in range(k + 1, 5):
+            n[i] += 1.0
+        want = self._want
+        for i in range(5):
+            want[i] += self._step[i]
+
+        # Nudge the three middle markers toward their desired positions
+        for i in (1, 2, 3):
+            d = want[i] - n[i]
+            if (d >= 1.0 and n[i + 1] - n[i] > 1.0) or (d <= -1.0 and n[i - 1] - n[i] < -1.0):
+                s = 1.0 if d > 0 else -1.0
+                hp = h[i] + s / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + s) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - s) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not h[i - 1] < hp < h[i + 1]:
+                    j = i + int(s)
+                    hp = h[i] + s * (h[j] - h[i]) / (n[j] - n[i])
+                h[i] = hp
+                n[i] += s
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current estimate; None before the first sample."""
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            return float(np.quantile(self._h, self.q))
+        return self._h[2]
+
+    def state(self) -> dict:
+        return {"q": self.q, "count": self.count, "h": list(self._h), "n": list(self._n), "want": list(self._want)}
+
+    def load_state(self, state: dict):
+        if state.get("q") != self.q:
+            return   # a different target quantile — start over
+        self.count = int(state["count"])
+        self._h = [float(v) for v in state["h"]]
+        self._n = [float(v) for v in state["n"]]
+        self._want = [float(v) for v in state["want"]]
+
+
+class DoublePinchLearner:
+    """Online release → re-pinch interval statistics and the window they imply."""
+
+    def __init__(
+        self,
+        reliability: float = 0.95,
+        margin_ms: float = 40.0,
+        min_ms: float = 200.0,
+        max_ms: float = 600.0,
+        min_hold_ms: float = 100.0,
+        min_samples: int = 20,
+    ):
+        self.margin_ms = margin_ms      # added to the quantile: frame-time slack
+        self.min_ms = min_ms
+        self.max_ms = max_ms            # never wait longer; longer gaps are separate gestures
+        self.min_hold_ms = min_hold_ms  # second pinch must last this long to count
+        self.min_samples = min_samples
+        self.quantile = P2Quantile(reliability)
+        self._was_pinching = False
+        self._released_at: Optional[float] = None
+        self._gap_ms: Optional[float] = None      # candidate interval, waiting for min_hold_ms
+        self._repinched_at = 0.0
+
+    @property
+    def reliability(self) -> float:
+        return self.quantile.q
+
+    @property
+    def samples(self) -> int:
+        return self.quantile.count
+
+    def observe(self, interval_ms: float):
+        """Add one release → re-pinch interval (ms)."""
+        if 0.0 < interval_ms < self.max_ms:
+            self.quantile.add(interval_ms)
+
+    def update(self, pinching: bool, now: float):
+        """Feed the index pinch state of one frame."""
+        if pinching and not self._was_pinching:
+            if self._released_at is not None:
+                self._gap_ms = (now - self._released_at) * 1000.0
+                self._repinched_at = now
+        elif pinching and self._gap_ms is not None:
+            if (now - self._repinched_at) * 1000.0 >= self.min_hold_ms:
+                self.observe(self._gap_ms)
+                self._gap_ms = None
+        elif not pinching and self._was_pinching:
+            self._released_at = now
+            self._gap_ms = None
+        self._was_pinching = pinching
+
+    def reset(self):
+        """Hand lost: the next pinch does not pair with the last release."""
+        self._was_pinching = False
+        self._released_at = None
+        self._gap_ms = None
+
+    def window_ms(self, default: float) -> float:
+        """Learned window, or default until enough intervals were observed."""
+        estimate = self.quantile.value
+        if estimate is None or self.samples < self.min_samples:
+            return default
+        return min(self.max_ms, max(self.min_ms, math.ceil(estimate + self.margin_ms)))
+
+    def state(self) -> dict:
+        return {"quantile": self.quantile.state()}
+
+    def load_state(self, state: Optional[dict]):
+        if state and "quantile" in state:
+            self.quantile.load_state(state["quantile"])
+
+
+def repinch_intervals(
+    pinch: np.ndarray,
+    timestamps: np.ndarray,
+    found: Optional[np.ndarray] = None,
+    min_hold_ms: float = 0.0,
+) -> np.ndarray:
+    """
+    Release → re-pinch intervals (ms) of a whole recorded session, for
+    seeding a learner offline (tools/seed_double_pinch.py). Gaps spanning a
+    lost-hand frame are dropped, and so are re-pinches held for less than
+    min_hold_ms (DoublePinchLearner.min_hold_ms, to count what it counts live).
+    """
+    pinch = np.asarray(pinch, dtype=bool)
+    t = np.asarray(timestamps, dtype=np.float64)
+    prev = np.concatenate(([False], pinch[:-1]))
+    onsets = np.flatnonzero(pinch & ~prev)
+    releases = np.flatnonzero(~pinch & prev)
+    if len(onsets) == 0 or len(releases) == 0:
+        return np.empty(0)
+    k = np.searchsorted(releases, onsets) - 1     # last release before each onset
+    ok = k >= 0
+    onsets, rel = onsets[ok], releases[k[ok]]
+    if min_hold_ms > 0:
+        # Last pinched frame of each re-pinch: before the next release, or the session end
+        ends = np.append(releases, len(pinch))[np.searchsorted(releases, onsets)] - 1
+        held = (t[ends] - t[onsets]) * 1000.0 >= min_hold_ms
+        onsets, rel = onsets[held], rel[held]
+    if found is not None:
+        lost = np.cumsum(~np.asarray(found, dtype=bool))
+        keep = lost[onsets] == lost[rel]
+        onsets, rel = onsets[keep], rel[keep]
+    return (t[onsets] - t[rel]) * 1000.0
@@ -0,0 +1,217 @@
+"""
+BatchGestureEvaluator — evaluate a GestureFSM config over whole recorded sessions.
+
+Instead of feeding frames one by one through GestureFSM.process, the batch
+engine computes every per-frame input for the entire session at once:
+D_ref and pinch masks over an (N, 21, 3) landmark array, pinch midpoints,
+the EMA trajectory and the screen mapping. Only the small state-transition
+scan runs sequentially, through the very same GestureFSM._transition used
+live, so the emitted event stream is identical.
+
+Frame timestamps drive the double-pinch window, so the result is
+deterministic and runs as fast as the CPU allows.
+
+Configs using stages that are not vectorized yet (see vectorizable), and
+gesture maps guarding on the ring/pinky pinch or the pose, fall back to
+frame-by-frame GestureFSM.process on the same arrays, so the result is
+always exact.
+
+Usage:
+    evaluator = BatchGestureEvaluator(config)
+    result = evaluator.evaluate_session(load_session("session.json"))
+    result.counts()          # {"MOVE": 812, "CLICK": 3, ...}
+    result.events()          # List[MouseEvent], one per frame
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import ema_smooth_series, map_to_screen_array
+from kinemouse.utils.session_io import RecordedSession
+from kinemouse.state.events import MouseEvent, EventType, idle_event
+from kinemouse.state.gesture_fsm import GestureFSM, pinch_debounced
+from kinemouse.state.gesture_table import GestureTableSource
+from kinemouse.state.hand_features import batch_distances
+from kinemouse.state.pinch_debouncer import debounce_series
+
+_IDLE = EventType.IDLE.value
+
+
+@dataclass
+class BatchResult:
+    """Per-frame events of one session in compact array form."""
+    event_types: np.ndarray    # (N,) int8 — EventType.value of each frame's event
+    positions: np.ndarray      # (N, 2) int64 — screen position, -1 where none
+    timestamps: np.ndarray     # (N,) frame timestamps (seconds)
+    amounts: Optional[np.ndarray] = None   # (N,) int32 — SCROLL units; None if nothing scrolled
+
+    def events(self) -> List[MouseEvent]:
+        """Expand back into one MouseEvent per frame."""
+        out = []
+        amounts = self.amounts.tolist() if self.amounts is not None else [0] * len(self.event_types)
+        for t, (x, y), amount in zip(self.event_types.tolist(), self.positions.tolist(), amounts):
+            if x < 0:
+                out.append(idle_event() if t == _IDLE else MouseEvent(EventType(t), amount=amount))
+            else:
+                out.append(MouseEvent(EventType(t), position=(x, y)))
+        return out
+
+    def counts(self) -> Dict[str, int]:
+        """Event frequency by EventType name (IDLE included)."""
+        values, counts = np.unique(self.event_types, return_counts=True)
+        return {EventType(int(v)).name: int(c) for v, c in zip(values, counts)}
+
+
+def pinch_series(landmarks: np.ndarray, found: np.ndarray, config: KineMouseConfig) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (N, 2) index/middle pinch flags and (N,) D_ref of a session, exactly as
+    the live FSM computes them (debounced when configured). landmarks must
+    not hold NaN; rows where found is False are ignored.
+    """
+    dist = batch_distances(landmarks, config)
+    dref = dist[:, 4]
+    active = found & (dref != 0)
+    if pinch_debounced(config):
+        # Same debouncer as live: restarts when the hand is found again,
+        # frames without a usable D_ref leave it untouched
+        pinch = debounce_series(
+            dist[:, :2], dref, config.pinch_threshold, config.pinch_release_threshold, config.pinch_dwell_frames,
+            restart=found & ~np.concatenate(([False], found[:-1])), hold=~active,
+        )
+    else:
+        pinch = dist[:, :2] < (config.pinch_threshold * dref)[:, None]
+    return pinch, dref
+
+
+def _amount_array(amounts: Dict[int, int], n: int) -> Optional[np.ndarray]:
+    """Sparse per-frame SCROLL units → (N,) int32, or None if nothing scrolled."""
+    if not amounts:
+        return None
+    out = np.zeros(n, dtype=np.int32)
+    out[list(amounts)] = list(amounts.values())
+    return out
+
+
+class BatchGestureEvaluator:
+    """
+    Runs a GestureFSM configuration over entire sessions with vectorized
+    feature extraction and a sequential state scan.
+    """
+
+    def __init__(self, config: KineMouseConfig):
+        self.config = config
+
+    @property
+    def vectorizable(self) -> bool:
+        """True if the config only uses stages the vectorized path implements."""
+        cfg = self.config
+        return (cfg.smoothing == "ema" and cfg.pointer_mode == "absolute"
+                and not (cfg.landmark_filter or cfg.prediction or cfg.pointer_accel or cfg.tremor_filter)
+                and not GestureTableSource().get(cfg, 0.0).needs_features)
+
+    def evaluate_session(self, session: RecordedSession) -> BatchResult:
+        return self.evaluate(session.landmarks, session.timestamps, session.found, session.screen_res)
+
+    def evaluate_many(self, sessions: Iterable[RecordedSession]) -> List[BatchResult]:
+        return [self.evaluate_session(s) for s in sessions]
+
+    def evaluate(
+        self,
+        landmarks: np.ndarray,
+        timestamps: np.ndarray,
+        found: Optional[np.ndarray] = None,
+        screen_res: Tuple[int, int] = (1920, 1080),
+    ) -> BatchResult:
+        """
+        landmarks: (N, 21, 3) array; rows without a hand may hold NaN
+        timestamps: (N,) capture times in seconds
+        found: (N,) bool; derived from NaNs in landmarks when omitted
+        """
+        cfg = self.config
+        n = len(timestamps)
+        if found is None:
+            found = ~np.isnan(landmarks).any(axis=(1, 2))
+        found = np.asarray(found, dtype=bool)
+        if not self.vectorizable:
+            return self._evaluate_per_frame(landmarks, timestamps, found, screen_res)
+
+        # --- Vectorized per-frame inputs ---
+        pts = np.where(found[:, None, None], landmarks, 0.0)
+        pinch, dref = pinch_series(pts, found, cfg)
+        active = found & (dref != 0)
+
+        thumb = pts[:, cfg.THUMB_TIP, :2]
+        index = pts[:, cfg.INDEX_TIP, :2]
+        mid = (thumb + index) / 2.0
+
+        # EMA restarts on the first active frame after a lost hand;
+        # found frames with D_ref == 0 leave the filter untouched.
+        counted = ~(found & (dref == 0))
+        sub_active = active[counted]
+        restart_sub = sub_active & ~np.concatenate(([False], sub_active[:-1]))
+        restart = np.zeros(n, dtype=bool)
+        restart[np.flatnonzero(counted)] = restart_sub
+
+        smoothed = ema_smooth_series(mid[active], cfg.ema_alpha, restart[active])
+        screen = np.full((n, 2), -1, dtype=np.int64)
+        screen[active] = map_to_screen_array(smoothed, cfg.active_box, screen_res)
+
+        # --- Sequential state scan (shared with the live FSM) ---
+        fsm = GestureFSM(cfg, screen_res)
+        types = [_IDLE] * n
+        positions = [(-1, -1)] * n
+        amounts: Dict[int, int] = {}
+        rows = zip(
+            found.tolist(), active.tolist(),
+            pinch[:, 0].tolist(), pinch[:, 1].tolist(),
+            screen.tolist(), np.asarray(timestamps, dtype=np.float64).tolist(),
+        )
+        for i, (f, a, p_index, p_middle, (x, y), t) in enumerate(rows):
+            if not f:
+                fsm._hand_lost()
+                continue
+            if not a:
+                continue
+            event = fsm._transition(p_index, p_middle, (x, y), t)
+            types[i] = event.type.value
+            if event.position is not None:
+                positions[i] = event.position
+            elif event.amount:
+                amounts[i] = event.amount
+
+        return BatchResult(
+            np.array(types, dtype=np.int8),
+            np.array(positions, dtype=np.int64).reshape(n, 2),
+            np.asarray(timestamps),
+            _amount_array(amounts, n),
+        )
+
+    def _evaluate_per_frame(
+        self,
+        landmarks: np.ndarray,
+        timestamps: np.ndarray,
+        found: np.ndarray,
+        screen_res: Tuple[int, int],
+    ) -> BatchResult:
+        """Exact fallback: run GestureFSM.process on each frame's landmark array."""
+        fsm = GestureFSM(self.config, screen_res)
+        n = len(timestamps)
+        types = [_IDLE] * n
+        positions = [(-1, -1)] * n
+        amounts: Dict[int, int] = {}
+        for i, (f, t) in enumerate(zip(found.tolist(), np.asarray(timestamps, dtype=np.float64).tolist())):
+            event = fsm.process(landmarks[i] if f else None, timestamp=t)
+            types[i] = event.type.value
+            if event.position is not None:
+                positions[i] = event.position
+            elif event.amount:
+                amounts[i] = event.amount
+        return BatchResult(
+            np.array(types, dtype=np.int8),
+            np.array(positions, dtype=np.int64).reshape(n, 2),
+            np.asarray(timestamps),
+            _amount_array(amounts, n),
+        )
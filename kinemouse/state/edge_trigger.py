@@ -0,0 +1,51 @@
+"""
+EdgeTrigger — turns a held boolean gesture into a single rising-edge event.
+
+A discrete gesture (e.g. the thumb–middle right-click pinch) stays true for
+as long as it is held; firing on every frame floods the dispatcher. The
+trigger fires once when the gesture starts and re-arms only after:
+- the gesture has been released for `rearm_frames` consecutive frames
+  (so a one-frame tracking dropout mid-hold does not fire again), and
+- `cooldown_ms` has passed since the last fire.
+
+A press that starts during the cooldown is swallowed until it is released.
+
+Usage:
+    trigger = EdgeTrigger(rearm_frames=2, cooldown_ms=250)
+    if trigger.update(pinching_middle, now):
+        return right_click_event(x, y)
+"""
+
+from typing import Optional
+
+
+class EdgeTrigger:
+    """Rising-edge detector with release-frame and cooldown re-arm conditions."""
+
+    def __init__(self, rearm_frames: int = 1, cooldown_ms: float = 0.0):
+        self.rearm_frames = rearm_frames
+        self.cooldown_ms = cooldown_ms
+        self._last_fire: Optional[float] = None
+        self.reset()
+
+    def reset(self):
+        """Re-arm immediately (e.g. hand lost). The cooldown still applies."""
+        self._armed = True
+        self._released = 0
+
+    def update(self, active: bool, now: float) -> bool:
+        """Feed one frame; True only on the frame the gesture (re)starts."""
+        if not active:
+            self._released += 1
+            if self._released >= self.rearm_frames:
+                self._armed = True
+            return False
+
+        self._released = 0
+        if not self._armed:
+            return False
+        self._armed = False
+        if self._last_fire is not None and (now - self._last_fire) * 1000 < self.cooldown_ms:
+            return False
+        self._last_fire = now
+        return True
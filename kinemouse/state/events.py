@@ -1,10 +1,23 @@
 """
 Mouse event definitions for KineMouse.
 Layer 2 emits these events; Layer 3 executes them.
+
+Events are immutable, slotted values, so constant ones (idle, each motion
+gesture) are built once and shared. Every event also has a fixed 32-byte
+binary layout (EVENT_STRUCT) for logging or sending across processes:
+
+    type u8 | flags u8 | pad 2 | x i32 | y i32 | amount i32 | gesture 16s
+
+Usage:
+    data = event.pack()                    # 32 bytes
+    event.pack_into(ring, offset)          # no allocation
+    event = MouseEvent.unpack(data)
 """
 
+import struct
 from enum import Enum, auto
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional
 
 
@@ -16,23 +29,70 @@ class EventType(Enum):
     MOUSE_DOWN  = auto()   # Begin drag (mouse button held)
     MOUSE_UP    = auto()   # End drag (mouse button released)
     RIGHT_CLICK = auto()   # Right click
+    MOTION_GESTURE = auto()  # Dynamic hand gesture (swipe, circle) — see MouseEvent.gesture
+    SCROLL      = auto()   # Wheel scroll by MouseEvent.amount hi-res units (120 per notch, + = up)
+
 
+EVENT_STRUCT = struct.Struct("<BBxxiii16s")
+EVENT_SIZE = EVENT_STRUCT.size
+GESTURE_NAME_BYTES = 16         # longest motion gesture name that fits the layout (UTF-8)
 
-@dataclass
+_HAS_POSITION = 0x01
+_TYPES_BY_VALUE = {t.value: t for t in EventType}
+
+
+@dataclass(frozen=True, slots=True)
 class MouseEvent:
     """A single mouse event with optional screen coordinates."""
     type: EventType
     position: Optional[Tuple[int, int]] = None  # Screen (x, y) in pixels
+    gesture: Optional[str] = None               # MOTION_GESTURE name, e.g. "swipe_left"
+    amount: int = 0                             # SCROLL: hi-res wheel units
+
+    def _fields(self) -> tuple:
+        name = self.gesture.encode() if self.gesture else b""
+        if len(name) > GESTURE_NAME_BYTES:
+            raise ValueError(f"gesture name {self.gesture!r} exceeds {GESTURE_NAME_BYTES} bytes")
+        if self.position is None:
+            return self.type.value, 0, 0, 0, self.amount, name
+        x, y = self.position
+        return self.type.value, _HAS_POSITION, x, y, self.amount, name
+
+    def pack(self) -> bytes:
+        """The event as EVENT_SIZE bytes (see EVENT_STRUCT)."""
+        return EVENT_STRUCT.pack(*self._fields())
+
+    def pack_into(self, buffer, offset: int = 0):
+        """Write the event into a writable buffer at offset."""
+        EVENT_STRUCT.pack_into(buffer, offset, *self._fields())
+
+    @classmethod
+    def unpack(cls, data, offset: int = 0) -> "MouseEvent":
+        """Read an event written by pack()/pack_into(); idle comes back interned."""
+        value, flags, x, y, amount, name = EVENT_STRUCT.unpack_from(data, offset)
+        event_type = _TYPES_BY_VALUE[value]
+        position = (x, y) if flags & _HAS_POSITION else None
+        gesture = name.rstrip(b"\0").decode() or None
+        if event_type is EventType.IDLE and position is None:
+            return _IDLE_EVENT
+        return cls(event_type, position=position, gesture=gesture, amount=amount)
 
     def __repr__(self):
+        if self.gesture:
+            return f"MouseEvent({self.type.name}, gesture={self.gesture})"
+        if self.type == EventType.SCROLL:
+            return f"MouseEvent({self.type.name}, amount={self.amount})"
         if self.position:
             return f"MouseEvent({self.type.name}, pos={self.position})"
         return f"MouseEvent({self.type.name})"
 
 
+_IDLE_EVENT = MouseEvent(EventType.IDLE)
+
+
 # Convenience constructors
 def idle_event() -> MouseEvent:
-    return MouseEvent(EventType.IDLE)
+    return _IDLE_EVENT
 
 def move_event(x: int, y: int) -> MouseEvent:
     return MouseEvent(EventType.MOVE, position=(x, y))
@@ -48,3 +108,10 @@ def mouse_up_event(x: int, y: int) -> MouseEvent:
 
 def right_click_event(x: int, y: int) -> MouseEvent:
     return MouseEvent(EventType.RIGHT_CLICK, position=(x, y))
+
+@lru_cache(maxsize=64)
+def motion_gesture_event(name: str) -> MouseEvent:
+    return MouseEvent(EventType.MOTION_GESTURE, gesture=name)
+
+def scroll_event(units: int) -> MouseEvent:
+    return MouseEvent(EventType.SCROLL, amount=units)
@@ -8,12 +8,26 @@ Detects:
 - OPEN_HAND    (all fingers extended) — idle/release
 
 These extend KineMouse beyond simple pinch gestures into richer pose detection.
+
+Two classifiers share the same pose rules:
+- classify_pose: stateless, compares fingertip and PIP heights — only valid
+  for an upright hand facing the camera
+- PoseClassifier: finger curl from 3D joint angles (rotation-invariant),
+  with per-finger threshold hysteresis and a per-pose hold time, so the
+  reported pose does not flicker at the boundaries
+
+Usage:
+    classifier = PoseClassifier()
+    pose = classifier.classify(landmarks, features)   # once per frame
 """
 
 from enum import Enum, auto
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from kinemouse.utils.math_utils import euclidean_distance
+import numpy as np
+
+from kinemouse.utils.config import DEFAULT_CONFIG
+from kinemouse.state.hand_features import HandFeatures
 
 
 class HandPose(Enum):
@@ -25,42 +39,122 @@ class HandPose(Enum):
     PINCH      = auto()   # already handled by FSM but included for completeness
 
 
-def _tip_above_pip(landmarks, tip_idx: int, pip_idx: int) -> bool:
-    """Returns True if fingertip is above its PIP joint (finger extended)."""
-    return landmarks[tip_idx].y < landmarks[pip_idx].y
+def _pose_from_flags(thumb_ext: bool, index_ext: bool, middle_ext: bool,
+                     ring_ext: bool, pinky_ext: bool) -> HandPose:
+    """Pose rules shared by both classifiers, from finger-extension flags."""
+    num_extended = index_ext + middle_ext + ring_ext + pinky_ext
+
+    if num_extended == 0 and not thumb_ext:
+        return HandPose.FIST
+
+    if num_extended == 4 and thumb_ext:
+        return HandPose.OPEN_HAND
+
+    if index_ext and middle_ext and not ring_ext and not pinky_ext and not thumb_ext:
+        return HandPose.PEACE
+
+    if thumb_ext and num_extended == 0:
+        return HandPose.THUMBS_UP
 
+    return HandPose.UNKNOWN
 
-def classify_pose(landmarks: List) -> HandPose:
+
+# Pose for each 5-bit extension mask (bit 0 = thumb … bit 4 = pinky)
+_POSE_BY_MASK = tuple(
+    _pose_from_flags(*[bool(mask >> bit & 1) for bit in range(5)]) for mask in range(32)
+)
+_MASK_WEIGHTS = np.array([1, 2, 4, 8, 16])
+
+
+def classify_pose(landmarks: List, features: Optional[HandFeatures] = None) -> HandPose:
     """
     Classify the current hand pose from MediaPipe landmarks.
     Returns a HandPose enum value.
+
+    features: optional HandFeatures for this frame; its extension flags are
+    reused instead of recomputing the tip/PIP comparisons.
     """
     if landmarks is None:
         return HandPose.UNKNOWN
 
-    # Check which fingers are extended (tip above PIP joint in normalized coords)
-    # MediaPipe y: 0 = top of frame, 1 = bottom
-    index_ext  = _tip_above_pip(landmarks, 8,  6)
-    middle_ext = _tip_above_pip(landmarks, 12, 10)
-    ring_ext   = _tip_above_pip(landmarks, 16, 14)
-    pinky_ext  = _tip_above_pip(landmarks, 20, 18)
+    if features is None:
+        features = HandFeatures(landmarks, DEFAULT_CONFIG)
+    return pose_from_features(features)
 
-    # Thumb: compare tip x to MCP x (for right hand, tip.x < mcp.x = extended)
-    thumb_ext  = abs(landmarks[4].x - landmarks[2].x) > 0.04
 
-    extended = [index_ext, middle_ext, ring_ext, pinky_ext]
-    num_extended = sum(extended)
+def pose_from_features(features: HandFeatures) -> HandPose:
+    """classify_pose for a frame whose HandFeatures are already built."""
+    # Extension flags: tip above PIP joint (MediaPipe y: 0 = top of frame);
+    # thumb compares tip x to MCP x
+    return _pose_from_flags(*features.extended)
 
-    if num_extended == 0 and not thumb_ext:
-        return HandPose.FIST
 
-    if num_extended == 4 and thumb_ext:
-        return HandPose.OPEN_HAND
+class PoseClassifier:
+    """
+    Rotation-invariant pose classifier with hysteresis.
 
-    if index_ext and middle_ext and not ring_ext and not pinky_ext and not thumb_ext:
-        return HandPose.PEACE
+    A finger becomes extended when its curl drops below extend_below and
+    curled when it rises above curl_above; in between it keeps its previous
+    state. Thresholds are per finger [thumb, index, middle, ring, pinky],
+    in degrees of total flexion (see HandFeatures.curl).
 
-    if thumb_ext and num_extended == 0:
-        return HandPose.THUMBS_UP
+    A newly detected pose is reported only after it has been seen for
+    hold_frames consecutive frames (per-pose overrides in pose_hold_frames).
+    """
 
-    return HandPose.UNKNOWN
+    def __init__(
+        self,
+        extend_below=(35.0, 70.0, 70.0, 70.0, 70.0),
+        curl_above=(60.0, 110.0, 110.0, 110.0, 110.0),
+        hold_frames: int = 3,
+        pose_hold_frames: Optional[Dict[HandPose, int]] = None,
+    ):
+        self.extend_below = np.asarray(extend_below, dtype=np.float64)
+        self.curl_above = np.asarray(curl_above, dtype=np.float64)
+        self.hold_frames = hold_frames
+        self.pose_hold_frames = pose_hold_frames or {}
+        self.reset()
+
+    def reset(self):
+        self._extended: Optional[np.ndarray] = None
+        self._pose = HandPose.UNKNOWN
+        self._candidate = HandPose.UNKNOWN
+        self._count = 0
+
+    @property
+    def pose(self) -> HandPose:
+        """Last reported pose."""
+        return self._pose
+
+    def extended(self, curl: np.ndarray) -> np.ndarray:
+        """Update and return the per-finger extension flags from a (5,) curl vector."""
+        if self._extended is None:
+            # First frame: split at the middle of each hysteresis band
+            self._extended = curl < (self.extend_below + self.curl_above) / 2
+        else:
+            self._extended = np.where(
+                curl < self.extend_below, True,
+                np.where(curl > self.curl_above, False, self._extended),
+            )
+        return self._extended
+
+    def classify(self, landmarks, features: Optional[HandFeatures] = None) -> HandPose:
+        """Feed one frame (None = no hand) and return the debounced pose."""
+        if landmarks is None:
+            self.reset()
+            return HandPose.UNKNOWN
+        if features is None:
+            features = HandFeatures(landmarks, DEFAULT_CONFIG)
+
+        mask = int(self.extended(features.curl) @ _MASK_WEIGHTS)
+        pose = _POSE_BY_MASK[mask]
+
+        if pose == self._pose:
+            self._count = 0
+        elif pose == self._candidate:
+            self._count += 1
+        else:
+            self._candidate, self._count = pose, 1
+        if self._count >= self.pose_hold_frames.get(pose, self.hold_frames):
+            self._pose, self._count = pose, 0
+        return self._pose
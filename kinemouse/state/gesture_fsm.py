@@ -2,134 +2,357 @@
 GestureFSM — Layer 2: State Machine.
 
 Translates raw hand landmarks into MouseEvents using:
-- Dynamic thresholding (D_ref normalization)
-- EMA smoothing
-- Double-pinch state machine (400ms window)
-- Right-click detection (Thumb + Middle)
+- Optional landmark filter bank (all 21 landmarks, before detection)
+- Dynamic thresholding (D_ref normalization), with optional pinch
+  hysteresis and dwell (see pinch_debouncer.py)
+- Optional tremor band-stop on the pinch midpoint, fixed or centred on
+  the user's estimated tremor frequency (see tremor_filter.py)
+- EMA or One Euro (speed-adaptive) smoothing
+- Optional latency compensation (damped velocity extrapolation)
+- Screen mapping via SensitivityController (sensitivity modes, relative
+  clutch pointing, speed-dependent pointer acceleration)
+- Table-driven gesture state machine (see gesture_table.py): the built-in
+  double-pinch map (400ms window, or learned per user with
+  adaptive_double_pinch — see adaptive_timing.py), the speculative map (click on release,
+  drag by pinch-and-hold), or a custom hot-reloaded map
+- Right-click detection (Thumb + Middle), edge-triggered
+- Ring/pinky pinch and hand-pose guards for maps that use them
+- Suppression of MOVE events that repeat the last screen position
+
+Timing uses the frame's capture timestamp when one is passed to process(),
+otherwise the injected clock (time.monotonic by default). Replaying recorded
+timestamps therefore reproduces live timing exactly, at any speed.
 """
 
 import time
 from enum import Enum, auto
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 from kinemouse.utils.config import KineMouseConfig
-from kinemouse.utils.math_utils import (
-    compute_dref, is_pinching, midpoint, ema_smooth, map_to_screen
-)
-from kinemouse.state.events import (
-    MouseEvent, EventType,
-    idle_event, move_event, click_event,
-    mouse_down_event, mouse_up_event, right_click_event
+from kinemouse.utils.math_utils import ema_smooth, OneEuroFilter
+from kinemouse.state.hand_features import HandFeatures, landmarks_to_array
+from kinemouse.state.latency_predictor import LatencyPredictor
+from kinemouse.state.adaptive_timing import DoublePinchLearner
+from kinemouse.state.pinch_debouncer import PinchDebouncer
+from kinemouse.state.tremor_filter import TremorFilter
+from kinemouse.state.edge_trigger import EdgeTrigger
+from kinemouse.state.sensitivity import SensitivityController
+from kinemouse.vision.landmark_filter import LandmarkFilterBank
+from kinemouse.state.gesture_classifier import pose_from_features
+from kinemouse.state.gesture_table import (
+    GestureTableSource, PINCH_INDEX, PINCH_MIDDLE, MIDDLE_HELD, RIGHT_CLICK, TIMEOUT, MOVED,
+    PINCH_RING, PINCH_PINKY,
 )
+from kinemouse.state.events import MouseEvent, EventType, idle_event, mouse_up_event, scroll_event
 
 
 class FSMState(Enum):
-    """Internal states of the double-pinch state machine."""
+    """States of the built-in gesture maps (kinemouse/state/gesture_maps/)."""
     IDLE         = auto()   # Waiting — hand open
     PINCH_1      = auto()   # First pinch detected — cursor moves
-    RELEASE_WAIT = auto()   # Pinch released — waiting for 2nd within 400ms
+    RELEASE_WAIT = auto()   # Pinch released — waiting for 2nd within 400ms (double_pinch mode)
     DRAG_MODE    = auto()   # Drag active — mouse button held
 
 
+def pinch_debounced(config: KineMouseConfig) -> bool:
+    """True if pinch hysteresis or dwell is configured (otherwise the single threshold applies)."""
+    return config.pinch_release_threshold > config.pinch_threshold or config.pinch_dwell_frames > 1
+
+
 class GestureFSM:
     """
     Core state machine that processes one HandFrame worth of landmarks
     and returns a MouseEvent for the OS backend to execute.
     """
 
-    def __init__(self, config: KineMouseConfig, screen_resolution: Tuple[int, int]):
+    def __init__(
+        self,
+        config: KineMouseConfig,
+        screen_resolution: Tuple[int, int],
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.config = config
         self.screen_res = screen_resolution
+        self._clock = clock   # Fallback time source when frames carry no timestamp
 
-        # FSM internals
-        self._state = FSMState.IDLE
-        self._release_time: Optional[float] = None   # Timestamp of first pinch release
+        # FSM internals — states and transitions come from a compiled gesture map
+        self._tables = GestureTableSource()
+        self._table = self._tables.get(config, 0.0)
+        self._state_idx = self._table.initial
+        self._entered_at = 0.0                       # Timestamp the current state was entered
+        self._entered_pos: Tuple[int, int] = (0, 0)  # Cursor position when it was entered
+        self._moved = False                          # Cursor left move_radius_px since then
+        self._right_click = EdgeTrigger()
+        self._last_pos: Optional[Tuple[int, int]] = None   # Last position sent to the OS
 
-        # EMA state
+        # Smoothing state
         self._smoothed: Optional[Tuple[float, float]] = None
+        self._smoothing = config.smoothing
+        self._one_euro = OneEuroFilter()
+        self._landmark_filter = LandmarkFilterBank()
+        self._landmark_filter_on = config.landmark_filter
+        self._predictor = LatencyPredictor()
+        self.sensitivity = SensitivityController(config)
+        self.double_pinch = DoublePinchLearner(reliability=config.adaptive_double_pinch_reliability)
+        self._pinch = PinchDebouncer()
+        self.tremor = TremorFilter(config.tremor_center_hz, config.tremor_bandwidth_hz, config.tremor_adaptive,
+                                   fs=config.capture_fps, window=config.tremor_window_frames)
+        self._tremor_on = config.tremor_filter
 
-    def process(self, landmarks) -> MouseEvent:
+    def process(
+        self,
+        landmarks,
+        features: Optional[HandFeatures] = None,
+        timestamp: Optional[float] = None,
+    ) -> MouseEvent:
         """
         Process one frame of landmarks and return the appropriate MouseEvent.
         Call this once per captured frame.
+
+        features: optional HandFeatures already built for this frame (via
+        features_for), so other consumers (scroll, pose classifier) share the
+        same computations.
+        timestamp: frame capture time in seconds (HandFrame.timestamp); the
+        injected clock is used when omitted.
         """
         if landmarks is None:
-            self._state = FSMState.IDLE
-            self._smoothed = None
-            return idle_event()
+            return self._hand_lost()
 
         cfg = self.config
+        now = self._clock() if timestamp is None else timestamp
+        if features is None:
+            features = self.features_for(landmarks, now)
 
         # --- Layer 1 math ---
-        dref = compute_dref(landmarks)
-        if dref == 0:
+        if features.dref == 0:
             return idle_event()
 
-        pinching_index = is_pinching(landmarks, cfg.THUMB_TIP, cfg.INDEX_TIP, dref, cfg.pinch_threshold)
-        pinching_middle = is_pinching(landmarks, cfg.THUMB_TIP, cfg.MIDDLE_TIP, dref, cfg.pinch_threshold)
+        pinching_index = features.pinch_index
+        pinching_middle = features.pinch_middle
 
-        # Raw pinch midpoint
-        thumb = (landmarks[cfg.THUMB_TIP].x, landmarks[cfg.THUMB_TIP].y)
-        index = (landmarks[cfg.INDEX_TIP].x, landmarks[cfg.INDEX_TIP].y)
-        raw_mid = midpoint(thumb, index)
+        # Raw pinch midpoint → smoothed cursor anchor
+        self._smoothed = self._smooth(features.pinch_midpoint, now)
+        anchor = self._predict(self._smoothed, now) if cfg.prediction else self._smoothed
 
-        # EMA smoothing
-        if self._smoothed is None:
-            self._smoothed = raw_mid
+        screen_pos = self.sensitivity.map(anchor, now, pinching_index, self.screen_res)
+
+        return self._transition(pinching_index, pinching_middle, screen_pos, now, features)
+
+    def features_for(self, landmarks, timestamp: Optional[float] = None) -> HandFeatures:
+        """
+        Build this frame's HandFeatures, running the landmark filter bank first
+        when config.landmark_filter is on. Share the result with the other
+        gesture consumers and pass it back into process().
+        """
+        cfg = self.config
+        if cfg.landmark_filter != self._landmark_filter_on:
+            self._landmark_filter_on = cfg.landmark_filter
+            self._landmark_filter.reset()
+        if not cfg.landmark_filter:
+            features = HandFeatures(landmarks, cfg)
         else:
-            self._smoothed = ema_smooth(raw_mid, self._smoothed, cfg.ema_alpha)
+            bank = self._landmark_filter
+            bank.min_cutoff = cfg.landmark_filter_min_cutoff
+            bank.beta = cfg.landmark_filter_beta
+            now = self._clock() if timestamp is None else timestamp
+            features = HandFeatures(bank(landmarks_to_array(landmarks), now), cfg)
 
-        screen_pos = map_to_screen(self._smoothed, cfg.active_box, self.screen_res)
+        if pinch_debounced(cfg) and features.dref != 0:
+            # Debounced flags replace the single-threshold ones for every consumer
+            self._pinch.configure(cfg.pinch_threshold, cfg.pinch_release_threshold, cfg.pinch_dwell_frames)
+            features.set_pinch_mask(self._pinch.update(features.tip_distances, features.dref))
+        return features
 
-        # --- Right click (Thumb + Middle) — checked in any state ---
-        if pinching_middle and not pinching_index:
-            self._state = FSMState.IDLE
-            return right_click_event(*screen_pos)
+    def _smooth(self, raw_mid: Tuple[float, float], now: float) -> Tuple[float, float]:
+        """Apply the configured smoothing filter (re-read every frame for hot-reload)."""
+        cfg = self.config
+        if cfg.smoothing != self._smoothing:
+            # Filter switched at runtime — restart from the raw point
+            self._smoothing = cfg.smoothing
+            self._smoothed = None
+            self._one_euro.reset()
 
-        # --- Double-pinch FSM ---
-        now = time.monotonic()
+        if cfg.tremor_filter != self._tremor_on:
+            self._tremor_on = cfg.tremor_filter
+            self.tremor.reset()
+        if cfg.tremor_filter:
+            self.tremor.configure(cfg)
+            raw_mid = self.tremor(raw_mid, now)
 
-        if self._state == FSMState.IDLE:
-            if pinching_index:
-                self._state = FSMState.PINCH_1
-                return move_event(*screen_pos)
-            return idle_event()
+        if cfg.smoothing == "one_euro":
+            f = self._one_euro
+            f.min_cutoff = cfg.one_euro_min_cutoff
+            f.beta = cfg.one_euro_beta
+            f.d_cutoff = cfg.one_euro_d_cutoff
+            return f(raw_mid, now)
 
-        elif self._state == FSMState.PINCH_1:
-            if pinching_index:
-                return move_event(*screen_pos)
-            else:
-                # Pinch released — start 400ms countdown
-                self._state = FSMState.RELEASE_WAIT
-                self._release_time = now
-                return move_event(*screen_pos)
-
-        elif self._state == FSMState.RELEASE_WAIT:
-            elapsed_ms = (now - self._release_time) * 1000  # type: ignore
-            if pinching_index:
-                # Second pinch before 400ms → enter DRAG
-                self._state = FSMState.DRAG_MODE
-                return mouse_down_event(*screen_pos)
-            elif elapsed_ms > cfg.double_pinch_window_ms:
-                # 400ms expired → single click
-                self._state = FSMState.IDLE
-                self._release_time = None
-                return click_event(*screen_pos)
-            else:
-                return move_event(*screen_pos)
-
-        elif self._state == FSMState.DRAG_MODE:
-            if pinching_index:
-                return move_event(*screen_pos)
-            else:
-                # Released during drag → mouse up
-                self._state = FSMState.IDLE
-                return mouse_up_event(*screen_pos)
+        if self._smoothed is None:
+            return raw_mid
+        return ema_smooth(raw_mid, self._smoothed, cfg.ema_alpha)
+
+    def _predict(self, point: Tuple[float, float], now: float) -> Tuple[float, float]:
+        """Extrapolate the smoothed point forward by the measured pipeline latency."""
+        self._predictor.configure(self.config)
+        if self.config.tremor_filter:
+            self._predictor.filter_lag_s += self.tremor.delay_s()
+        return self._predictor(point, now)
 
+    def observe_latency(self, seconds: float):
+        """Report one measured capture→dispatch latency (used by prediction)."""
+        self._predictor.observe_latency(seconds)
+
+    def _hand_lost(self) -> MouseEvent:
+        """No hand in frame: drop back to IDLE and forget the smoothed point."""
+        self._state_idx = self._table.initial
+        self._smoothed = None
+        self._one_euro.reset()
+        self.tremor.reset()
+        self._landmark_filter.reset()
+        self._predictor.reset()
+        self.sensitivity.release()
+        self.double_pinch.reset()
+        self._pinch.reset()
+        self._right_click.update(False, 0.0)   # A lost frame counts as released
+        self._last_pos = None
         return idle_event()
 
+    def _transition(
+        self,
+        pinching_index: bool,
+        pinching_middle: bool,
+        screen_pos: Tuple[int, int],
+        now: float,
+        features: Optional[HandFeatures] = None,
+    ) -> MouseEvent:
+        """
+        Advance the state machine by one frame from precomputed inputs.
+        Shared by process() and the batch evaluator so both emit identical events.
+        features: the frame's HandFeatures, read only by maps that guard on
+        the ring/pinky pinch or the pose (GestureTable.needs_features).
+        """
+        event = self._advance(pinching_index, pinching_middle, screen_pos, now, features)
+        if event.position is not None:
+            if (event.type == EventType.MOVE and self.config.suppress_repeat_moves
+                    and event.position == self._last_pos):
+                return idle_event()   # Cursor already there
+            self._last_pos = event.position
+        return event
+
+    def _advance(
+        self,
+        pinching_index: bool,
+        pinching_middle: bool,
+        screen_pos: Tuple[int, int],
+        now: float,
+        features: Optional[HandFeatures] = None,
+    ) -> MouseEvent:
+        """One table-driven step: build the input mask, look up the transition."""
+        cfg = self.config
+        table = self._tables.get(cfg, now)
+        if table is not self._table:
+            # Map swapped: restart from its initial state, releasing a held button
+            was_held = self._table.held[self._state_idx]
+            self._table = table
+            self._enter(table.initial, now, screen_pos)
+            if was_held:
+                return mouse_up_event(*screen_pos)
+
+        if cfg.adaptive_double_pinch:
+            self._learn_double_pinch(pinching_index, now)
+
+        middle_held = pinching_middle and not pinching_index
+        trigger = self._right_click
+        trigger.rearm_frames = cfg.right_click_rearm_frames
+        trigger.cooldown_ms = cfg.right_click_cooldown_ms
+
+        mask = 0
+        if pinching_index:
+            mask |= PINCH_INDEX
+        if pinching_middle:
+            mask |= PINCH_MIDDLE
+        if middle_held:
+            mask |= MIDDLE_HELD
+        if trigger.update(middle_held, now):
+            mask |= RIGHT_CLICK
+        pose = 0
+        if table.needs_features and features is not None:
+            pinch = features.pinch_mask
+            if pinch[2]:
+                mask |= PINCH_RING
+            if pinch[3]:
+                mask |= PINCH_PINKY
+            if table.uses_pose:
+                pose = pose_from_features(features).value - 1
+
+        s = self._state_idx
+        timeout_ms = table.timeouts[s]
+        if timeout_ms is not None and (now - self._entered_at) * 1000 > self._param(timeout_ms):
+            mask |= TIMEOUT
+        radius = table.radii[s]
+        if radius is not None and not self._moved:
+            dx = screen_pos[0] - self._entered_pos[0]
+            dy = screen_pos[1] - self._entered_pos[1]
+            self._moved = dx * dx + dy * dy > self._param(radius) ** 2
+        if self._moved:
+            mask |= MOVED
+
+        nxt, emit = table.lookup(s, mask, pose)
+        if nxt != s:
+            self._enter(nxt, now, screen_pos)
+        if emit is None:
+            return idle_event()
+        if emit is EventType.SCROLL:
+            return scroll_event(int(self._param(table.scroll_amount(s, mask, pose))))
+        return MouseEvent(emit, position=screen_pos)
+
+    def _enter(self, state: int, now: float, screen_pos: Tuple[int, int]):
+        """Switch state and restart its timer / movement tracking."""
+        self._state_idx = state
+        self._entered_at = now
+        self._entered_pos = screen_pos
+        self._moved = False
+
+    def _learn_double_pinch(self, pinching_index: bool, now: float):
+        cfg = self.config
+        learner = self.double_pinch
+        if learner.reliability != cfg.adaptive_double_pinch_reliability:
+            learner = self.double_pinch = DoublePinchLearner(reliability=cfg.adaptive_double_pinch_reliability)
+        learner.min_ms = cfg.adaptive_double_pinch_min_ms
+        learner.max_ms = cfg.adaptive_double_pinch_max_ms
+        learner.update(pinching_index, now)
+
+    def _param(self, value) -> float:
+        """
+        A gesture-map parameter: a number, or the name of a config field.
+        double_pinch_window_ms is the learned window when adaptive_double_pinch is on.
+        """
+        if not isinstance(value, str):
+            return value
+        if value == "double_pinch_window_ms" and self.config.adaptive_double_pinch:
+            return self.double_pinch.window_ms(self.config.double_pinch_window_ms)
+        return getattr(self.config, value)
+
+    @property
+    def state(self) -> str:
+        """Name of the current gesture-map state."""
+        return self._table.states[self._state_idx]
+
+    @property
+    def _state(self):
+        """Current state as FSMState when the map uses the built-in names."""
+        name = self.state
+        return FSMState[name] if name in FSMState.__members__ else name
+
     def reset(self):
         """Reset FSM to IDLE (e.g., on hand lost)."""
-        self._state = FSMState.IDLE
-        self._release_time = None
+        self._state_idx = self._table.initial
         self._smoothed = None
+        self._one_euro.reset()
+        self.tremor.reset()
+        self._landmark_filter.reset()
+        self._predictor.reset()
+        self.sensitivity.reset()
+        self.double_pinch.reset()
+        self._pinch.reset()
+        self._right_click.reset()
+        self._last_pos = None
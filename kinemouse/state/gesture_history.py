@@ -5,26 +5,62 @@ Useful for:
 - Debugging gesture detection timing
 - Identifying accidental triggers
 - Building gesture macros (future)
-- Saving recorded sessions to JSON for deterministic testing
+- Saving recorded sessions for deterministic testing
+
+Records live in a NumPy structured-array ring (RECORD_DTYPE) sized for
+all-day sessions: append is O(1) and last_n() is a zero-copy view. The ring
+is stored twice over (slot i and i + capacity are written together), so any
+window of recent records is one contiguous slice, even across the wrap.
+Counts, rates and inter-event intervals are computed on those columns.
+
+With path= the ring is a memory-mapped file: every record lands in the page
+cache as it is written, so a session survives a crash of the process and is
+picked up again by the next GestureHistory opened on the same file.
+A file-backed ring timestamps records with wall-clock time.time() (the
+in-memory one with time.monotonic()), so records from before a reboot
+still sort before new ones and time windows stay correct.
+For months of history, attach a SQLiteHistoryStore (store=): every record
+also goes to its indexed on-disk log.
 
 Usage:
-    history = GestureHistory(max_entries=1000)
+    history = GestureHistory(max_entries=500_000, path="session.kmh")
     history.record(event)
-    history.save("session.json")
+    history.last_n(100)["x"]            # view, no copy
+    history.rates()                     # {"CLICK": 0.4, ...} events/s
+    history.save("session.npz")         # or .json
     history.print_summary()
 """
 
 import json
 import time
-from collections import deque
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional, List, Deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from kinemouse.state.events import MouseEvent, EventType
 
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("event_type", "u1"),    # EventType.value
+    ("x", "<i4"),            # screen position, NO_POSITION where none
+    ("y", "<i4"),
+])
+NO_POSITION = np.iinfo(np.int32).min
+
+_MAX_TYPES = 32   # per-type lifetime totals kept in the file header
+_MAGIC = b"KMHIST01"
+_HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("capacity", "<u8"),
+    ("count", "<u8"),                  # records ever written (not wrapped)
+    ("totals", "<u8", (_MAX_TYPES,)),  # lifetime count per EventType.value
+])
+_NAMES = {t.value: t.name for t in EventType}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class GestureRecord:
     timestamp: float
     event_type: str
@@ -40,53 +76,216 @@ class GestureRecord:
             position_y=event.position[1] if event.position else None,
         )
 
+    @staticmethod
+    def from_row(row) -> "GestureRecord":
+        """Convert one RECORD_DTYPE row."""
+        x, y = int(row["x"]), int(row["y"])
+        has_pos = x != NO_POSITION
+        return GestureRecord(
+            timestamp=float(row["timestamp"]),
+            event_type=_NAMES[int(row["event_type"])],
+            position_x=x if has_pos else None,
+            position_y=y if has_pos else None,
+        )
+
 
 class GestureHistory:
     """
     Rolling buffer of recent gesture events with save/load and summary capabilities.
     """
 
-    def __init__(self, max_entries: int = 1000):
-        self._buffer: Deque[GestureRecord] = deque(maxlen=max_entries)
-        self._counts: dict = {t.name: 0 for t in EventType}
+    def __init__(self, max_entries: int = 1000, path: Optional[str] = None, store=None):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self.store = store   # optional SQLiteHistoryStore fed by record()
+        if path is None:
+            self._header = np.zeros(1, dtype=_HEADER_DTYPE)
+            self._header[0]["magic"] = _MAGIC
+            self._header[0]["capacity"] = max_entries
+            self._data = np.zeros(2 * max_entries, dtype=RECORD_DTYPE)
+        else:
+            self._header, self._data = _open_mapped(Path(path), max_entries)
+        self._head = self._header[0]
+        self._totals = self._head["totals"]
+        self.max_entries = int(self._head["capacity"])
+        self._count = int(self._head["count"])
+        # monotonic restarts at boot, so a ring that outlives the process uses wall-clock time
+        self._clock = time.monotonic if path is None else time.time
+
+    def __len__(self) -> int:
+        return min(self._count, self.max_entries)
 
-    def record(self, event: MouseEvent):
+    def record(self, event: MouseEvent, timestamp: Optional[float] = None):
         """Record a gesture event."""
         if event.type == EventType.IDLE:
             return  # Skip idle noise
-        self._buffer.append(GestureRecord.from_event(event))
-        self._counts[event.type.name] = self._counts.get(event.type.name, 0) + 1
+        if event.position is None:
+            x = y = NO_POSITION
+        else:
+            x, y = event.position
+        row = (self._clock() if timestamp is None else timestamp, event.type.value, x, y)
+        slot = self._count % self.max_entries
+        data = self._data
+        data[slot] = row
+        data[slot + self.max_entries] = row
+        self._count += 1
+        self._head["count"] = self._count
+        self._totals[event.type.value] += 1
+        if self.store is not None:
+            self.store.record(event)
+
+    def last_n(self, n: int) -> np.ndarray:
+        """
+        The last n records (oldest first) as a RECORD_DTYPE view into the ring.
+        It is overwritten as new events arrive; copy() it to keep it.
+        """
+        n = max(0, min(n, len(self)))
+        start = (self._count - n) % self.max_entries
+        return self._data[start:start + n]
+
+    def records(self, n: Optional[int] = None) -> List[GestureRecord]:
+        """The last n records (all when omitted) as GestureRecord objects."""
+        return [GestureRecord.from_row(r) for r in self.last_n(len(self) if n is None else n)]
+
+    # --- Vectorized statistics over the records in the ring ---
+
+    def counts(self) -> Dict[str, int]:
+        """Event frequency by EventType name over the records in the ring."""
+        window = self.last_n(len(self))
+        bins = np.bincount(window["event_type"], minlength=_MAX_TYPES)
+        return {name: int(bins[v]) for v, name in _NAMES.items() if bins[v]}
+
+    def rates(self, window_s: Optional[float] = None) -> Dict[str, float]:
+        """
+        Events per second by type, over the last window_s seconds of records
+        (the whole ring when omitted).
+        """
+        records = self._window(window_s)
+        if len(records) < 2:
+            return {}
+        span = window_s if window_s is not None else float(records["timestamp"][-1] - records["timestamp"][0])
+        if span <= 0:
+            return {}
+        bins = np.bincount(records["event_type"], minlength=_MAX_TYPES)
+        return {name: float(bins[v]) / span for v, name in _NAMES.items() if bins[v]}
+
+    def intervals(self, event_type: Optional[EventType] = None, window_s: Optional[float] = None) -> np.ndarray:
+        """Seconds between consecutive events (of one type, if given)."""
+        records = self._window(window_s)
+        ts = records["timestamp"]
+        if event_type is not None:
+            ts = ts[records["event_type"] == event_type.value]
+        return np.diff(ts)
+
+    def interval_stats(self, event_type: Optional[EventType] = None) -> Dict[str, float]:
+        """Mean / median / p95 / min of intervals() in seconds; empty if fewer than two events."""
+        gaps = self.intervals(event_type)
+        if len(gaps) == 0:
+            return {}
+        p50, p95 = np.percentile(gaps, [50, 95])
+        return {"mean": float(gaps.mean()), "median": float(p50), "p95": float(p95), "min": float(gaps.min())}
+
+    def _window(self, window_s: Optional[float]) -> np.ndarray:
+        records = self.last_n(len(self))
+        if window_s is None or len(records) == 0:
+            return records
+        ts = records["timestamp"]
+        return records[np.searchsorted(ts, ts[-1] - window_s, side="left"):]
+
+    # --- Persistence ---
 
     def save(self, path: str):
-        """Save session history to a JSON file."""
-        records = [asdict(r) for r in self._buffer]
-        with open(path, "w") as f:
-            json.dump({"records": records, "counts": self._counts}, f, indent=2)
+        """Save the ring to .json (portable) or .npz (compact, fast)."""
+        records = self.last_n(len(self))
+        if _format(path) == ".json":
+            out = [asdict(r) for r in self.records()]
+            with open(path, "w") as f:
+                json.dump({"records": out, "counts": self.totals()}, f)
+        else:
+            np.savez(path, records=records, totals=self._totals)
 
     def load(self, path: str):
-        """Load history from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
-        self._buffer.clear()
-        for r in data.get("records", []):
-            self._buffer.append(GestureRecord(**r))
-        self._counts = data.get("counts", {})
+        """Load history saved by save() (.json or .npz), replacing the current contents."""
+        if _format(path) == ".json":
+            with open(path) as f:
+                records, totals = records_from_json(json.load(f))
+        else:
+            with np.load(path) as data:
+                records = data["records"]
+                totals = data["totals"]
+        self._fill(records[-self.max_entries:])
+        self._totals[:] = totals
+
+    def flush(self):
+        """Force a memory-mapped history to disk (no-op in memory)."""
+        if self.path is not None:
+            self._header.flush()
+            self._data.flush()
+
+    def _fill(self, records: np.ndarray):
+        n = len(records)
+        self._data[:n] = records
+        self._data[self.max_entries:self.max_entries + n] = records
+        self._count = n
+        self._head["count"] = n
+
+    def totals(self) -> Dict[str, int]:
+        """Lifetime event counts by type, including records evicted from the ring."""
+        return {name: int(self._totals[v]) for v, name in _NAMES.items()}
 
     def print_summary(self):
         """Print event frequency summary to stdout."""
-        total = sum(self._counts.values())
+        counts = self.totals()
+        total = sum(counts.values())
         print(f"\n--- Gesture Session Summary ({total} events) ---")
-        for name, count in sorted(self._counts.items(), key=lambda x: -x[1]):
+        for name, count in sorted(counts.items(), key=lambda x: -x[1]):
             if count > 0:
                 pct = (count / total * 100) if total else 0
                 print(f"  {name:<15} {count:>5}  ({pct:.1f}%)")
         print()
 
-    def last_n(self, n: int) -> List[GestureRecord]:
-        """Return last n recorded events."""
-        items = list(self._buffer)
-        return items[-n:]
-
     def clear(self):
-        self._buffer.clear()
-        self._counts = {t.name: 0 for t in EventType}
+        self._count = 0
+        self._head["count"] = 0
+        self._totals[:] = 0
+
+
+def records_from_json(data: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """(RECORD_DTYPE records, lifetime totals by EventType.value) from parsed save() JSON."""
+    rows = [
+        (r["timestamp"], EventType[r["event_type"]].value,
+         NO_POSITION if r["position_x"] is None else r["position_x"],
+         NO_POSITION if r["position_y"] is None else r["position_y"])
+        for r in data.get("records", [])
+    ]
+    totals = np.zeros(_MAX_TYPES, dtype=np.uint64)
+    for name, count in data.get("counts", {}).items():
+        totals[EventType[name].value] = count
+    return np.array(rows, dtype=RECORD_DTYPE), totals
+
+
+def _format(path: str) -> str:
+    """The save/load format from the file suffix (np.savez would append .npz to anything else)."""
+    suffix = Path(path).suffix
+    if suffix not in (".json", ".npz"):
+        raise ValueError(f"{path}: history files must end in .json or .npz")
+    return suffix
+
+
+def _open_mapped(path: Path, capacity: int):
+    """Open (or create) a ring file; an existing file keeps its own capacity."""
+    if path.exists() and path.stat().st_size >= _HEADER_DTYPE.itemsize:
+        header = np.memmap(path, dtype=_HEADER_DTYPE, mode="r+", shape=(1,))
+        if header[0]["magic"] != _MAGIC:
+            raise ValueError(f"{path} is not a gesture history file")
+        capacity = int(header[0]["capacity"])
+    else:
+        with open(path, "wb") as f:
+            f.truncate(_HEADER_DTYPE.itemsize + 2 * capacity * RECORD_DTYPE.itemsize)
+        header = np.memmap(path, dtype=_HEADER_DTYPE, mode="r+", shape=(1,))
+        header[0]["magic"] = _MAGIC
+        header[0]["capacity"] = capacity
+    data = np.memmap(path, dtype=RECORD_DTYPE, mode="r+",
+                     offset=_HEADER_DTYPE.itemsize, shape=(2 * capacity,))
+    return header, data
@@ -0,0 +1,282 @@
+"""
+GestureTable — declarative gesture state machines compiled to a dense table.
+
+A gesture map (JSON, or TOML on Python 3.11+) lists states and ordered
+transition rules. Each rule has a source state ("*" = any), a guard on
+boolean per-frame inputs and optionally on the hand pose, a target state
+and the event to emit:
+
+    {"from": "RELEASE_WAIT", "when": {"timeout": true}, "to": "IDLE", "emit": "CLICK"}
+    {"from": "IDLE", "pose": "PEACE", "when": {"pinch_ring": true}, "emit": "SCROLL", "amount": -120}
+
+Rules are tried in file order; the first match wins and a state with no
+matching rule stays put and emits IDLE. At load time every (state, input
+combination) pair is resolved once, so the runtime step is a single list
+lookup regardless of how many rules the map has.
+
+Inputs (bits of the per-frame input mask):
+    pinch_index   thumb–index pinch
+    pinch_middle  thumb–middle pinch
+    middle_held   thumb–middle pinch without the index (right-click pose)
+    right_click   middle_held rising edge (see EdgeTrigger)
+    timeout       time in the current state exceeds the state's timeout_ms
+    moved         cursor left the state's move_radius_px since the state was entered
+    pinch_ring    thumb–ring pinch
+    pinch_pinky   thumb–pinky pinch
+
+"pose" takes a HandPose name or a list of them (see classify_pose). A map
+that guards on it gets a pose column in its table; maps that do not pay
+nothing for it. pinch_ring overlaps the built-in ring-pinch scroll
+(ScrollGesture), so turn that off when a map uses it.
+
+Emits are EventType names. SCROLL takes an "amount" in hi-res wheel units
+(120 per notch, + = up; default 120), a number or a config field name.
+MOTION_GESTURE cannot be emitted from a map.
+
+State options timeout_ms / move_radius_px take a number or the name of a
+KineMouseConfig field, read on every frame so config hot-reload applies.
+
+A state entered by MOUSE_DOWN holds the button until a MOUSE_UP leaves it
+(GestureTable.held); the FSM releases it if the map is swapped mid-drag.
+
+The built-in maps live in kinemouse/state/gesture_maps/ (one per click_mode).
+
+Usage:
+    table = load_gesture_map("my_gestures.json")
+    next_state, emit = table.lookup(state, mask)
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from kinemouse.state.events import EventType
+from kinemouse.state.gesture_classifier import HandPose
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+BUILTIN_DIR = Path(__file__).resolve().parent / "gesture_maps"
+
+INPUTS = ("pinch_index", "pinch_middle", "middle_held", "right_click", "timeout", "moved",
+          "pinch_ring", "pinch_pinky")
+INPUT_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(INPUTS)}
+N_MASKS = 1 << len(INPUTS)
+
+PINCH_INDEX = INPUT_BITS["pinch_index"]
+PINCH_MIDDLE = INPUT_BITS["pinch_middle"]
+MIDDLE_HELD = INPUT_BITS["middle_held"]
+RIGHT_CLICK = INPUT_BITS["right_click"]
+TIMEOUT = INPUT_BITS["timeout"]
+MOVED = INPUT_BITS["moved"]
+PINCH_RING = INPUT_BITS["pinch_ring"]
+PINCH_PINKY = INPUT_BITS["pinch_pinky"]
+
+# Inputs that need the frame's HandFeatures (not just the index/middle pinch flags)
+FEATURE_INPUTS = PINCH_RING | PINCH_PINKY
+N_POSES = len(HandPose)
+DEFAULT_SCROLL_UNITS = 120
+
+_MAP_CHECK_INTERVAL = 1.0   # seconds between mtime checks of a custom map
+
+Param = Union[None, float, str]   # number, config field name, or unset
+
+
+class GestureTable:
+    """A compiled gesture map: dense [state × input mask] transition table."""
+
+    def __init__(self, data: dict, source: str = "<dict>"):
+        self.name: str = data.get("name", source)
+        self.source = source
+
+        states = data.get("states")
+        if not states:
+            raise ValueError(f"{source}: gesture map defines no states")
+        self.states: List[str] = list(states)
+        index = {name: i for i, name in enumerate(self.states)}
+        initial = data.get("initial", self.states[0])
+        if initial not in index:
+            raise ValueError(f"{source}: unknown initial state {initial!r}")
+        self.initial: int = index[initial]
+
+        self.timeouts: List[Param] = [(states[s] or {}).get("timeout_ms") for s in self.states]
+        self.radii: List[Param] = [(states[s] or {}).get("move_radius_px") for s in self.states]
+
+        rules = [self._compile_rule(r, index, source) for r in data.get("transitions", [])]
+        self.uses_pose = any(rule[2] is not None for rule in rules)
+        self.needs_features = self.uses_pose or any(rule[1] & FEATURE_INPUTS for rule in rules)
+        self._poses = N_POSES if self.uses_pose else 1
+        self._row = self._poses * N_MASKS
+
+        # Dense table: row per state, column per (pose, input mask) → (next state, emit)
+        self._table: List[Tuple[int, Optional[EventType]]] = []
+        self._amounts: Dict[int, Param] = {}   # table index → SCROLL amount
+        for s in range(len(self.states)):
+            for pose in range(self._poses):
+                for mask in range(N_MASKS):
+                    entry = (s, None)
+                    for sources, care, poses, value, to, emit, amount in rules:
+                        if ((sources is None or s in sources) and mask & care == value
+                                and (poses is None or pose in poses)):
+                            entry = (s if to is None else to, emit)
+                            if emit == EventType.SCROLL:
+                                self._amounts[len(self._table)] = amount
+                            break
+                    self._table.append(entry)
+        self.held = self._held_states()
+
+    def _held_states(self) -> List[bool]:
+        """
+        States in which the map holds the mouse button down: entered by a
+        MOUSE_DOWN, or reached from such a state without a MOUSE_UP.
+        """
+        held = [False] * len(self.states)
+        for s in range(len(self.states)):
+            for to, emit in self._table[s * self._row:(s + 1) * self._row]:
+                if emit == EventType.MOUSE_DOWN:
+                    held[to] = True
+        changed = True
+        while changed:
+            changed = False
+            for s in range(len(self.states)):
+                if not held[s]:
+                    continue
+                for to, emit in self._table[s * self._row:(s + 1) * self._row]:
+                    if not held[to] and emit != EventType.MOUSE_UP:
+                        held[to] = changed = True
+        return held
+
+    @staticmethod
+    def _compile_rule(rule: dict, index: Dict[str, int], source: str):
+        src = rule.get("from", "*")
+        if src == "*":
+            sources = None
+        else:
+            names = [src] if isinstance(src, str) else list(src)
+            unknown = [n for n in names if n not in index]
+            if unknown:
+                raise ValueError(f"{source}: unknown state(s) {unknown} in rule {rule}")
+            sources = frozenset(index[n] for n in names)
+
+        poses = rule.get("pose")
+        if poses is not None:
+            names = [poses] if isinstance(poses, str) else list(poses)
+            unknown = [n for n in names if n not in HandPose.__members__]
+            if unknown:
+                raise ValueError(f"{source}: unknown pose(s) {unknown} in rule {rule}")
+            poses = frozenset(HandPose[n].value - 1 for n in names)
+
+        care = value = 0
+        for name, wanted in (rule.get("when") or {}).items():
+            if name not in INPUT_BITS:
+                raise ValueError(f"{source}: unknown input {name!r} (expected one of {INPUTS})")
+            care |= INPUT_BITS[name]
+            if wanted:
+                value |= INPUT_BITS[name]
+
+        to = rule.get("to")
+        if to is not None:
+            if to not in index:
+                raise ValueError(f"{source}: unknown target state {to!r}")
+            to = index[to]
+
+        emit_name = rule.get("emit", "IDLE")
+        if emit_name not in EventType.__members__:
+            raise ValueError(f"{source}: unknown event {emit_name!r}")
+        if emit_name == "MOTION_GESTURE":
+            raise ValueError(f"{source}: MOTION_GESTURE cannot be emitted from a gesture map")
+        emit = None if emit_name == "IDLE" else EventType[emit_name]
+        amount = rule.get("amount", DEFAULT_SCROLL_UNITS)
+        return sources, care, poses, value, to, emit, amount
+
+    def lookup(self, state: int, mask: int, pose: int = 0) -> Tuple[int, Optional[EventType]]:
+        """
+        (next state, event type or None for IDLE) for one frame.
+        pose: HandPose.value - 1; ignored unless the map guards on the pose.
+        """
+        if self._poses == 1:
+            return self._table[state * N_MASKS + mask]
+        return self._table[state * self._row + pose * N_MASKS + mask]
+
+    def scroll_amount(self, state: int, mask: int, pose: int = 0) -> Param:
+        """The "amount" of the SCROLL rule lookup() matched for the same inputs."""
+        pose = pose if self._poses > 1 else 0
+        return self._amounts[state * self._row + pose * N_MASKS + mask]
+
+    def index_of(self, state: str) -> int:
+        return self.states.index(state)
+
+
+def load_gesture_map(path: Union[str, Path]) -> GestureTable:
+    """Load and compile a gesture map from a .json or .toml file."""
+    path = Path(path)
+    if path.suffix == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML gesture maps require Python 3.11+ (tomllib)") from None
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(path) as f:
+            data = json.load(f)
+    return GestureTable(data, source=str(path))
+
+
+@lru_cache(maxsize=None)
+def builtin_table(name: str) -> GestureTable:
+    """One of the shipped maps in gesture_maps/ (e.g. "double_pinch")."""
+    path = BUILTIN_DIR / f"{name}.json"
+    if not path.exists():
+        raise ValueError(f"Unknown built-in gesture map {name!r}")
+    return load_gesture_map(path)
+
+
+class GestureTableSource:
+    """
+    Picks the table for the current config: the custom gesture_map file if
+    set, otherwise the built-in map for click_mode. A custom file is
+    re-checked at most once per second and recompiled when it changes;
+    a map that fails to load is logged and the previous table kept.
+    """
+
+    def __init__(self):
+        self._key: Optional[Tuple[str, str]] = None
+        self._table: Optional[GestureTable] = None
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+
+    def get(self, config, now: float) -> GestureTable:
+        key = (config.gesture_map, config.click_mode)
+        if key != self._key:
+            self._key = key
+            self._load(config, now)
+        elif config.gesture_map and now >= self._next_check:
+            self._next_check = now + _MAP_CHECK_INTERVAL
+            try:
+                mtime = os.stat(config.gesture_map).st_mtime
+            except OSError:
+                mtime = self._mtime
+            if mtime != self._mtime:
+                self._load(config, now)
+        return self._table   # type: ignore
+
+    def _load(self, config, now: float):
+        self._next_check = now + _MAP_CHECK_INTERVAL
+        if config.gesture_map:
+            try:
+                self._mtime = os.stat(config.gesture_map).st_mtime
+                self._table = load_gesture_map(config.gesture_map)
+                log.info("Gesture map loaded: %s (%d states)", config.gesture_map, len(self._table.states))
+                return
+            except (OSError, ValueError) as e:
+                log.warning("Failed to load gesture map %s: %s", config.gesture_map, e)
+                if self._table is not None:
+                    return
+        try:
+            self._table = builtin_table(config.click_mode)
+        except ValueError as e:
+            log.warning("%s — using double_pinch", e)
+            self._table = builtin_table("double_pinch")
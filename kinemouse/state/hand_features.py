@@ -0,0 +1,297 @@
+"""
+HandFeatures — per-frame geometric features shared by all gesture consumers.
+
+Built once per frame from the raw landmarks and handed to GestureFSM,
+ScrollGesture and classify_pose, so the same distances are never computed
+twice. Every feature is computed lazily on first access and memoized:
+a frame where nobody asks for finger-extension flags never pays for them.
+
+The per-frame scalars (thumb-to-fingertip distances, D_ref, pinch flags,
+pinch midpoint, extension flags) are plain float math over the few
+landmarks they need: for a handful of points that is far cheaper
+than building and indexing a NumPy array. NumPy is used only where it pays,
+for the 15 finger joint angles used by PoseClassifier and for whole-session
+batch_distances().
+
+Usage:
+    features = HandFeatures(landmarks, config)
+    if features.pinching(config.INDEX_TIP):
+        x, y = features.pinch_midpoint
+"""
+
+import math
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.constants import (
+    WRIST, THUMB_CMC, THUMB_MCP, THUMB_IP, THUMB_TIP,
+    INDEX_MCP, INDEX_PIP, INDEX_DIP, INDEX_TIP,
+    MIDDLE_MCP, MIDDLE_PIP, MIDDLE_DIP, MIDDLE_TIP,
+    RING_MCP, RING_PIP, RING_DIP, RING_TIP,
+    PINKY_MCP, PINKY_PIP, PINKY_DIP, PINKY_TIP, NUM_LANDMARKS,
+)
+
+_PALM_INDICES = (WRIST, INDEX_MCP, MIDDLE_MCP, RING_MCP, PINKY_MCP)
+
+# Thumb extension: |tip.x - mcp.x| above this counts as extended
+_THUMB_EXT_OFFSET = 0.04
+
+
+# Wrist→tip landmark chain of each finger [thumb, index, middle, ring, pinky]
+_FINGER_CHAINS = np.array([
+    [WRIST, THUMB_CMC, THUMB_MCP, THUMB_IP, THUMB_TIP],
+    [WRIST, INDEX_MCP, INDEX_PIP, INDEX_DIP, INDEX_TIP],
+    [WRIST, MIDDLE_MCP, MIDDLE_PIP, MIDDLE_DIP, MIDDLE_TIP],
+    [WRIST, RING_MCP, RING_PIP, RING_DIP, RING_TIP],
+    [WRIST, PINKY_MCP, PINKY_PIP, PINKY_DIP, PINKY_TIP],
+])
+# The 15 joints as rows of (previous, joint, next) landmarks, finger-major
+_JOINT_TRIPLES = np.stack([
+    _FINGER_CHAINS[:, :3].ravel(), _FINGER_CHAINS[:, 1:4].ravel(), _FINGER_CHAINS[:, 2:].ravel(),
+])
+# Joints counted in a finger's curl (the thumb's CMC angle is left out)
+_CURL_WEIGHTS = np.ones((5, 3))
+_CURL_WEIGHTS[0, 0] = 0.0
+
+
+def landmarks_to_array(landmarks) -> np.ndarray:
+    """
+    Convert a MediaPipe landmark list (or any sequence of objects with
+    .x/.y/.z) into a (21, 3) float64 array. Arrays pass through untouched.
+    """
+    if isinstance(landmarks, np.ndarray):
+        return landmarks
+    flat = np.fromiter(
+        chain.from_iterable((p.x, p.y, p.z) for p in landmarks),
+        dtype=np.float64,
+        count=NUM_LANDMARKS * 3,
+    )
+    return flat.reshape(NUM_LANDMARKS, 3)
+
+
+@lru_cache(maxsize=8)
+def _distance_pairs(thumb: int, index: int, middle: int, ring: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Landmark index pairs measured in the single distance pass:
+    thumb→[index, middle, ring, pinky] tips, then wrist→index knuckle (D_ref).
+    """
+    a = np.array([index, middle, ring, PINKY_TIP, INDEX_MCP])
+    b = np.array([thumb, thumb, thumb, thumb, WRIST])
+    return a, b
+
+
+def batch_distances(points: np.ndarray, config: KineMouseConfig) -> np.ndarray:
+    """
+    Same distance pass as HandFeatures, over a whole (N, 21, 3) session.
+    Returns (N, 5): thumb→[index, middle, ring, pinky] tips, then D_ref.
+    """
+    a, b = _distance_pairs(config.THUMB_TIP, config.INDEX_TIP, config.MIDDLE_TIP, config.RING_TIP)
+    d = (points[:, a] - points[:, b])[..., :2]
+    return np.sqrt((d * d).sum(axis=-1))
+
+
+def joint_angles(points: np.ndarray) -> np.ndarray:
+    """
+    Flexion angle in degrees (0 = straight) at the three joints of each
+    finger, from 3D bone vectors — unaffected by hand rotation or tilt.
+    points: (..., 21, 3) → (..., 5, 3); rows [thumb, index, middle, ring,
+    pinky], columns [MCP, PIP, DIP] (thumb: [CMC, MCP, IP]).
+    Zero-length bones read as straight.
+    """
+    t = points[..., _JOINT_TRIPLES, :]                   # (..., 3, 15, 3)
+    bones = t[..., 1:, :, :] - t[..., :-1, :, :]         # (..., 2, 15, 3): into / out of joint
+    sq = (bones * bones).sum(axis=-1)
+    dot = (bones[..., 0, :, :] * bones[..., 1, :, :]).sum(axis=-1)
+    # The epsilon makes zero-length bones read as cos = 1 without a branch
+    cos = (dot + 1e-12) / (np.sqrt(sq[..., 0, :] * sq[..., 1, :]) + 1e-12)
+    angles = np.degrees(np.arccos(np.minimum(np.maximum(cos, -1.0), 1.0)))
+    return angles.reshape(angles.shape[:-1] + (5, 3))
+
+
+def finger_curl(angles: np.ndarray) -> np.ndarray:
+    """
+    Total flexion per finger (degrees) from joint_angles(): the sum of all
+    three joints, except the thumb whose CMC angle is left out (it reflects
+    thumb opposition rather than bending).
+    """
+    return (angles * _CURL_WEIGHTS).sum(axis=-1)
+
+
+class _Row(tuple):
+    """One landmark row (x, y, z) of an array input, readable like a MediaPipe landmark."""
+    __slots__ = ()
+    x = property(itemgetter(0))
+    y = property(itemgetter(1))
+    z = property(itemgetter(2))
+
+
+class _memo:
+    """
+    cached_property without the per-instance lock functools takes on Python
+    < 3.12: features are computed on the camera thread only, and the lock
+    costs more than most of the features it guards.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
+class HandFeatures:
+    """
+    Lazily computed, memoized geometric features for one hand in one frame.
+    Instances are cheap to create; all work happens on first property access.
+    """
+
+    def __init__(self, landmarks, config: KineMouseConfig, dref: Optional[float] = None):
+        self._landmarks = landmarks
+        self.config = config
+        # Scalar features read landmarks as .x/.y; array input (filter bank, replay) converted once
+        self._lm = list(map(_Row, landmarks.tolist())) if isinstance(landmarks, np.ndarray) else landmarks
+        if dref is not None:
+            # Caller already knows D_ref (e.g. legacy ScrollGesture API)
+            self.__dict__["dref"] = dref
+
+    # --- Raw geometry ---
+
+    def xy(self, i: int) -> Tuple[float, float]:
+        """Image-plane (x, y) of landmark i as plain floats."""
+        p = self._lm[i]
+        return p.x, p.y
+
+    @_memo
+    def points(self) -> np.ndarray:
+        """All landmarks as a (21, 3) array of normalized (x, y, z)."""
+        return landmarks_to_array(self._landmarks)
+
+    @_memo
+    def _distances(self) -> Tuple[float, float, float, float, float]:
+        """Thumb→[index, middle, ring, pinky] tip distances and D_ref (same arithmetic as batch_distances)."""
+        cfg = self.config
+        lm = self._lm
+        sqrt = math.sqrt
+        t = lm[cfg.THUMB_TIP]
+        tx, ty = t.x, t.y
+        p = lm[cfg.INDEX_TIP]
+        dx, dy = p.x - tx, p.y - ty
+        d_index = sqrt(dx * dx + dy * dy)
+        p = lm[cfg.MIDDLE_TIP]
+        dx, dy = p.x - tx, p.y - ty
+        d_middle = sqrt(dx * dx + dy * dy)
+        p = lm[cfg.RING_TIP]
+        dx, dy = p.x - tx, p.y - ty
+        d_ring = sqrt(dx * dx + dy * dy)
+        p = lm[PINKY_TIP]
+        dx, dy = p.x - tx, p.y - ty
+        d_pinky = sqrt(dx * dx + dy * dy)
+        w, k = lm[WRIST], lm[INDEX_MCP]
+        dx, dy = k.x - w.x, k.y - w.y
+        dref = sqrt(dx * dx + dy * dy)
+        self.__dict__.setdefault("dref", dref)    # unless overridden in __init__
+        return d_index, d_middle, d_ring, d_pinky, dref
+
+    @_memo
+    def dref(self) -> float:
+        """D_ref: wrist (0) to index knuckle (5) distance."""
+        return self._distances[4]
+
+    @property
+    def tip_distances(self) -> Tuple[float, float, float, float]:
+        """Thumb-tip distance to the index, middle, ring and pinky tips."""
+        return self._distances[:4]
+
+    @_memo
+    def pinch_mask(self) -> Sequence[bool]:
+        """Pinch flags for [index, middle, ring, pinky] against the thumb."""
+        d = self._distances
+        limit = self.config.pinch_threshold * self.dref
+        return (d[0] < limit, d[1] < limit, d[2] < limit, d[3] < limit)
+
+    def set_pinch_mask(self, mask: Sequence[bool]):
+        """
+        Replace the single-threshold pinch flags (e.g. with debounced ones from
+        PinchDebouncer). Must happen before any consumer has read pinch_mask.
+        """
+        if "pinch_mask" in self.__dict__:
+            raise RuntimeError("pinch_mask was already read; set it right after construction")
+        self.__dict__["pinch_mask"] = tuple(bool(v) for v in mask)
+
+    # --- Pinch accessors ---
+
+    def pinching(self, tip: int) -> bool:
+        """True if the thumb is pinching the given fingertip landmark."""
+        cfg = self.config
+        slots = (cfg.INDEX_TIP, cfg.MIDDLE_TIP, cfg.RING_TIP, PINKY_TIP)
+        return self.pinch_mask[slots.index(tip)]
+
+    @property
+    def pinch_index(self) -> bool:
+        return self.pinch_mask[0]
+
+    @property
+    def pinch_middle(self) -> bool:
+        return self.pinch_mask[1]
+
+    @property
+    def pinch_ring(self) -> bool:
+        return self.pinch_mask[2]
+
+    @property
+    def pinch_pinky(self) -> bool:
+        return self.pinch_mask[3]
+
+    @_memo
+    def pinch_midpoint(self) -> Tuple[float, float]:
+        """Midpoint between thumb tip and index tip (cursor anchor)."""
+        lm = self._lm
+        t, i = lm[self.config.THUMB_TIP], lm[self.config.INDEX_TIP]
+        return ((t.x + i.x) / 2.0, (t.y + i.y) / 2.0)
+
+    @_memo
+    def palm_center(self) -> Tuple[float, float]:
+        """Mean of the wrist and the four knuckles — tracks the hand, not the fingers."""
+        lm = self._lm
+        w, i, m, r, p = (lm[j] for j in _PALM_INDICES)
+        return ((w.x + i.x + m.x + r.x + p.x) / 5.0, (w.y + i.y + m.y + r.y + p.y) / 5.0)
+
+    # --- Pose features ---
+
+    @_memo
+    def extended(self) -> Tuple[bool, bool, bool, bool, bool]:
+        """
+        Finger-extension flags [thumb, index, middle, ring, pinky].
+        A finger is extended when its tip is above its PIP joint
+        (MediaPipe y: 0 = top of frame).
+        """
+        lm = self._lm
+        return (
+            abs(lm[THUMB_TIP].x - lm[THUMB_MCP].x) > _THUMB_EXT_OFFSET,
+            lm[INDEX_TIP].y < lm[INDEX_PIP].y,
+            lm[MIDDLE_TIP].y < lm[MIDDLE_PIP].y,
+            lm[RING_TIP].y < lm[RING_PIP].y,
+            lm[PINKY_TIP].y < lm[PINKY_PIP].y,
+        )
+
+    @_memo
+    def joint_angles(self) -> np.ndarray:
+        """Flexion angle (degrees) of every finger joint, shape (5, 3); see joint_angles()."""
+        return joint_angles(self.points)
+
+    @_memo
+    def curl(self) -> np.ndarray:
+        """Total flexion per finger [thumb, index, middle, ring, pinky] in degrees."""
+        return finger_curl(self.joint_angles)
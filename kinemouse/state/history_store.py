@@ -0,0 +1,346 @@
+"""
+SQLiteHistoryStore — append-only, indexed gesture history on disk for
+long-running deployments (months of events per station).
+
+record() only puts a row on a queue. A background thread drains it in
+batches (one transaction per batch_size rows or flush_interval seconds), so
+the camera loop never waits on the disk. The database runs in WAL mode:
+queries from other threads or processes read a consistent snapshot while
+the writer appends.
+
+Rows are (ts, type, x, y, duration_ms). ts is wall-clock time.time(), so
+history stays comparable across restarts. duration_ms is filled on
+MOUSE_UP rows with the time since the matching MOUSE_DOWN, which makes
+"drags shorter than 100 ms" an indexed range query. Indexes on (ts) and
+(type, ts, duration_ms, x, y) keep range queries proportional to the rows
+they return; per-type queries never read the table itself. Counts are also rolled up per type and hour (the hourly table,
+updated in the same transaction as the rows), so counts() and per_bucket()
+with whole-hour buckets read one row per hour and touch the events table
+only for the partial hours at either end of the range.
+
+Attach it to a GestureHistory so one record() call feeds both the in-memory
+ring and the store:
+
+Usage:
+    store = SQLiteHistoryStore("station.db")
+    history = GestureHistory(max_entries=10_000, store=store)
+    history.record(event)
+
+    week_ago = time.time() - 7 * 86400
+    store.per_bucket(EventType.CLICK, start=week_ago)       # clicks per hour
+    store.drags(max_duration_ms=100, start=week_ago)
+    store.close()
+"""
+
+import math
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from kinemouse.state.events import EventType, MouseEvent
+from kinemouse.state.gesture_history import NO_POSITION
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+STORE_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("event_type", "u1"),
+    ("x", "<i4"),             # screen position, NO_POSITION where none
+    ("y", "<i4"),
+    ("duration_ms", "<f8"),   # MOUSE_UP: drag duration; NaN otherwise
+])
+
+_TYPE_INDEX = "CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (type, ts, duration_ms, x, y)"
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS events (
+    ts          REAL    NOT NULL,
+    type        INTEGER NOT NULL,
+    x           INTEGER,
+    y           INTEGER,
+    duration_ms REAL
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts);
+{_TYPE_INDEX};
+CREATE TABLE IF NOT EXISTS hourly (
+    type INTEGER NOT NULL,
+    hour INTEGER NOT NULL,     -- CAST(ts / 3600 AS INTEGER)
+    n    INTEGER NOT NULL,
+    PRIMARY KEY (type, hour)
+) WITHOUT ROWID;
+"""
+_INSERT = "INSERT INTO events (ts, type, x, y, duration_ms) VALUES (?, ?, ?, ?, ?)"
+_ROLLUP = ("INSERT INTO hourly (type, hour, n) VALUES (?, ?, ?) "
+           "ON CONFLICT (type, hour) DO UPDATE SET n = n + excluded.n")
+_SCHEMA_VERSION = 1   # PRAGMA user_version; 1 = hourly rollup, covering per-type index
+_HOUR = 3600
+
+_DOWN = EventType.MOUSE_DOWN.value
+_UP = EventType.MOUSE_UP.value
+_FLUSH = object()   # queue marker: wake the writer and signal the attached event
+_STOP = object()
+
+
+def _range_clause(start: Optional[float], end: Optional[float]) -> Tuple[str, list]:
+    clause, args = "", []
+    if start is not None:
+        clause += " AND ts >= ?"
+        args.append(start)
+    if end is not None:
+        clause += " AND ts < ?"
+        args.append(end)
+    return clause, args
+
+
+def _select(conn: sqlite3.Connection, clause: str, args: list, limit: Optional[int] = None) -> np.ndarray:
+    sql = (f"SELECT ts, type, IFNULL(x, {NO_POSITION}), IFNULL(y, {NO_POSITION}), "
+           f"IFNULL(duration_ms, -1.0) FROM events WHERE 1{clause} ORDER BY ts")
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    rows = np.array(conn.execute(sql, args).fetchall(), dtype=STORE_DTYPE)
+    rows["duration_ms"][rows["duration_ms"] < 0] = np.nan
+    return rows
+
+
+def read_events(path: str, start: Optional[float] = None, end: Optional[float] = None) -> np.ndarray:
+    """
+    Events in [start, end) of a store's database as STORE_DTYPE rows, opened
+    read-only: no writer thread, no schema or journal-mode changes. For
+    offline analysis of a database another process may be writing.
+    """
+    conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        clause, args = _range_clause(start, end)
+        return _select(conn, clause, args)
+    finally:
+        conn.close()
+
+
+class SQLiteHistoryStore:
+    """Indexed on-disk event log with a batched background writer."""
+
+    def __init__(self, path: str, batch_size: int = 512, flush_interval: float = 1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._down_at: Optional[float] = None     # last MOUSE_DOWN, for drag durations
+        self._local = threading.local()           # one read connection per querying thread
+        self._readers: List[sqlite3.Connection] = []   # every thread's, for close()
+        self._readers_lock = threading.Lock()
+
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            # Database from before the rollup (or rows bulk-loaded into events): rebuild it
+            with conn:
+                conn.execute("DROP INDEX IF EXISTS idx_events_type_ts")   # (type, ts, duration_ms) before v1
+                conn.execute(_TYPE_INDEX)
+                conn.execute("DELETE FROM hourly")
+                conn.execute(f"INSERT INTO hourly SELECT type, CAST(ts / {_HOUR} AS INTEGER), COUNT(*) "
+                             f"FROM events GROUP BY 1, 2")
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        conn.close()
+
+        self._thread = threading.Thread(target=self._run, name="kinemouse-history", daemon=True)
+        self._thread.start()
+
+    # --- Writing ---
+
+    def record(self, event: MouseEvent, timestamp: Optional[float] = None):
+        """Queue one event; written by the background thread."""
+        if event.type == EventType.IDLE:
+            return
+        ts = time.time() if timestamp is None else timestamp
+        value = event.type.value
+        duration = None
+        if value == _DOWN:
+            self._down_at = ts
+        elif value == _UP and self._down_at is not None:
+            duration = (ts - self._down_at) * 1000.0
+            self._down_at = None
+        x, y = event.position if event.position is not None else (None, None)
+        self._queue.put((ts, value, x, y, duration))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything recorded so far is committed."""
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self):
+        """Write what is queued, stop the writer thread and close every read connection."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+        self._local = threading.local()
+
+    def __enter__(self) -> "SQLiteHistoryStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA synchronous=NORMAL")   # safe in WAL; fsync at checkpoints
+        pending: list = []
+        waiters: list = []
+        stopping = False
+        while not stopping:
+            deadline = time.monotonic() + self.flush_interval
+            # Gather a batch: up to batch_size rows or until the interval ends
+            while len(pending) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                if item[0] is _FLUSH:
+                    waiters.append(item[1])
+                    break
+                pending.append(item)
+            if pending:
+                try:
+                    hours = Counter((row[1], int(row[0] / _HOUR)) for row in pending)
+                    with conn:
+                        conn.executemany(_INSERT, pending)
+                        conn.executemany(_ROLLUP, [(t, h, n) for (t, h), n in hours.items()])
+                except sqlite3.Error as e:
+                    log.warning("History write failed (%d rows dropped): %s", len(pending), e)
+                pending.clear()
+            for done in waiters:
+                done.set()
+            waiters.clear()
+        conn.close()
+
+    # --- Queries ---
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Used only by this thread, but close() may run on another one
+            conn = self._local.conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def range(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> np.ndarray:
+        """Events in [start, end) (optionally of one type), oldest first, as STORE_DTYPE rows."""
+        clause, args = _range_clause(start, end)
+        if event_type is not None:
+            clause += " AND type = ?"
+            args.append(event_type.value)
+        return self._select(clause, args, limit)
+
+    def _select(self, clause: str, args: list, limit: Optional[int] = None) -> np.ndarray:
+        return _select(self._conn(), clause, args, limit)
+
+    def counts(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, int]:
+        """Event frequency by EventType name in [start, end)."""
+        totals: Counter = Counter()
+        for t, _, n in self._hour_counts(start, end):
+            totals[t] += n
+        return {EventType(t).name: n for t, n in totals.items()}
+
+    def _hour_counts(
+        self,
+        start: Optional[float],
+        end: Optional[float],
+        event_type: Optional[EventType] = None,
+    ) -> List[Tuple[int, int, int]]:
+        """
+        (type, hour, count) rows covering [start, end): whole hours from the
+        rollup, the partial hours at either end counted from events.
+        """
+        type_clause, type_args = ("", []) if event_type is None else (" AND type = ?", [event_type.value])
+        first = None if start is None else math.ceil(start / _HOUR)    # first whole hour
+        last = None if end is None else math.floor(end / _HOUR)        # end of the last whole hour
+        conn = self._conn()
+        if first is not None and last is not None and first >= last:
+            rows: List[Tuple[int, int, int]] = []
+            partial = [(start, end)]                                    # no whole hour inside
+        else:
+            clause, args = "", []
+            if first is not None:
+                clause += " AND hour >= ?"
+                args.append(first)
+            if last is not None:
+                clause += " AND hour < ?"
+                args.append(last)
+            rows = conn.execute(
+                f"SELECT type, hour, n FROM hourly WHERE 1{type_clause}{clause}", type_args + args
+            ).fetchall()
+            partial = []
+            if first is not None and start < first * _HOUR:
+                partial.append((start, first * _HOUR))
+            if last is not None and last * _HOUR < end:
+                partial.append((last * _HOUR, end))
+        for lo, hi in partial:
+            rows += conn.execute(
+                f"SELECT type, CAST(ts / {_HOUR} AS INTEGER), COUNT(*) FROM events "
+                f"WHERE ts >= ? AND ts < ?{type_clause} GROUP BY 1, 2",
+                [lo, hi, *type_args],
+            ).fetchall()
+        return rows
+
+    def per_bucket(
+        self,
+        event_type: EventType,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        bucket_s: float = 3600.0,
+    ) -> List[Tuple[float, int]]:
+        """(bucket start, count) of one event type per bucket_s seconds, e.g. clicks per hour."""
+        hours = bucket_s / _HOUR
+        if hours >= 1 and hours.is_integer():
+            # Whole-hour buckets: sum the hourly rollup
+            per_hour = int(hours)
+            buckets: Counter = Counter()
+            for _, hour, n in self._hour_counts(start, end, event_type):
+                buckets[hour // per_hour] += n
+            return [(b * bucket_s, buckets[b]) for b in sorted(buckets)]
+        clause, args = _range_clause(start, end)
+        rows = self._conn().execute(
+            f"SELECT CAST(ts / ? AS INTEGER) AS b, COUNT(*) FROM events "
+            f"WHERE type = ?{clause} GROUP BY b ORDER BY b",
+            [bucket_s, event_type.value, *args],
+        ).fetchall()
+        return [(b * bucket_s, n) for b, n in rows]
+
+    def drags(
+        self,
+        max_duration_ms: Optional[float] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> np.ndarray:
+        """Completed drags (their MOUSE_UP rows), optionally only those shorter than max_duration_ms."""
+        clause, args = _range_clause(start, end)
+        clause += " AND type = ? AND duration_ms IS NOT NULL"
+        args.append(_UP)
+        if max_duration_ms is not None:
+            clause += " AND duration_ms < ?"
+            args.append(max_duration_ms)
+        return self._select(clause, args)
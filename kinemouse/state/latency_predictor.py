@@ -0,0 +1,106 @@
+"""
+LatencyPredictor — extrapolates the smoothed cursor point to hide pipeline delay.
+
+Camera exposure, MediaPipe inference, the dispatch queue and the smoothing
+filter all add delay, so the cursor trails the hand. The predictor estimates
+the smoothed point's velocity and pushes the cursor forward by the total
+latency:
+
+    predicted = p + gain · v · latency
+
+Prediction is damped so it does not overshoot:
+- gain ramps from 0 at stop_speed to 1 at full_speed, so it fades out as the
+  hand comes to rest;
+- on a direction reversal the velocity estimate restarts from zero instead
+  of carrying the old direction forward.
+
+Latency = fixed part (exposure + display, not measurable in-process)
+        + measured capture→dispatch time (observe_latency)
+        + smoothing lag (EMA group delay, (1 - α) / α frames).
+
+Usage:
+    predictor = LatencyPredictor()
+    predictor.configure(config)
+    predictor.observe_latency(time.monotonic() - frame.timestamp)
+    cursor = predictor(smoothed_point, frame.timestamp)
+"""
+
+import math
+from typing import Optional, Tuple
+
+
+class LatencyPredictor:
+    """Velocity-based, damped forward prediction of a 2D point."""
+
+    def __init__(
+        self,
+        base_latency_ms: float = 40.0,
+        velocity_alpha: float = 0.5,
+        stop_speed: float = 0.05,
+        full_speed: float = 0.4,
+    ):
+        self.base_latency_ms = base_latency_ms
+        self.velocity_alpha = velocity_alpha   # EMA factor of the velocity estimate
+        self.stop_speed = stop_speed           # units/s — no prediction below this
+        self.full_speed = full_speed           # units/s — full prediction above this
+        self.filter_lag_s = 0.0                # smoothing delay, see configure()
+        self._measured_s: Optional[float] = None
+        self.reset()
+
+    def configure(self, config):
+        """Sync parameters from a KineMouseConfig (called every frame for hot-reload)."""
+        self.base_latency_ms = config.prediction_latency_ms
+        self.stop_speed = config.prediction_stop_speed
+        self.full_speed = config.prediction_full_speed
+        if config.smoothing == "ema" and 0 < config.ema_alpha < 1:
+            # EMA group delay at low frequency: (1 - α) / α frames
+            self.filter_lag_s = (1 - config.ema_alpha) / config.ema_alpha / config.capture_fps
+        else:
+            self.filter_lag_s = 0.0
+
+    def reset(self):
+        self._prev: Optional[Tuple[float, float]] = None
+        self._prev_t = 0.0
+        self._vx = 0.0
+        self._vy = 0.0
+
+    def observe_latency(self, seconds: float, alpha: float = 0.1):
+        """Feed one measured capture→dispatch latency sample (running average)."""
+        if self._measured_s is None:
+            self._measured_s = seconds
+        else:
+            self._measured_s += alpha * (seconds - self._measured_s)
+
+    @property
+    def latency_s(self) -> float:
+        """Total latency the prediction compensates, in seconds."""
+        return self.base_latency_ms / 1000.0 + (self._measured_s or 0.0) + self.filter_lag_s
+
+    def __call__(self, point: Tuple[float, float], t: float) -> Tuple[float, float]:
+        """Return the point extrapolated forward by latency_s."""
+        if self._prev is None:
+            self._prev, self._prev_t = point, t
+            return point
+
+        dt = t - self._prev_t
+        if dt <= 0:
+            return point
+        raw_vx = (point[0] - self._prev[0]) / dt
+        raw_vy = (point[1] - self._prev[1]) / dt
+        self._prev, self._prev_t = point, t
+
+        if raw_vx * self._vx + raw_vy * self._vy < 0:
+            # Direction reversal — drop the stale velocity
+            self._vx = self._vy = 0.0
+        a = self.velocity_alpha
+        self._vx = a * raw_vx + (1 - a) * self._vx
+        self._vy = a * raw_vy + (1 - a) * self._vy
+
+        speed = math.sqrt(self._vx * self._vx + self._vy * self._vy)
+        span = max(self.full_speed - self.stop_speed, 1e-9)
+        gain = min(1.0, max(0.0, (speed - self.stop_speed) / span))
+        if gain == 0.0:
+            return point
+
+        lead = gain * self.latency_s
+        return (point[0] + self._vx * lead, point[1] + self._vy * lead)
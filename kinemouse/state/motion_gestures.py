@@ -0,0 +1,188 @@
+"""
+MotionGestureRecognizer — streaming recognition of dynamic hand gestures
+(swipes, circles) against direction templates.
+
+Every frame the palm position goes into a fixed-size ring; its velocity over
+the last few frames gives a unit direction vector (zero while the hand is
+slow). That one feature is matched against all templates at once with a
+streaming subsequence DTW (SPRING-style): only the previous DTW column is
+kept, and a gesture may start at any frame, so nothing is ever realigned.
+
+All templates are stacked into one (T, L) array, padded to the longest.
+Each frame updates every template's column with a fixed number of NumPy
+ops and no Python loop over templates. For a few dozen templates the fixed
+per-op overhead dominates; beyond that the cost grows linearly with
+templates × padded length (about 2× at 10× the built-in set, see
+benchmarks/bench_motion.py).
+Local path steps are (hold the template point | advance one | skip one),
+with at most max_stay holds in a row. This tolerates gestures from twice
+to a quarter of the template speed without the in-column dependency that
+classic DTW has, and stops a long stretch of one direction from diluting
+the mismatch of the rest of a template.
+
+A template matches when its end cell's path cost per template point is
+below the threshold. The match covering the most frames is held until the
+hand stops (settle_frames slow frames in a row), so the first arc of a
+circle is never reported as a swipe. It then fires once, all columns
+restart and the recognizer stays quiet for the cooldown.
+
+Usage:
+    recognizer = MotionGestureRecognizer()
+    name = recognizer.update(features.palm_center, frame.timestamp)
+    if name:
+        queue.put(motion_gesture_event(name))      # e.g. "swipe_left"
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass
+class MotionTemplate:
+    """A named gesture as a sequence of unit direction vectors (L, 2)."""
+    name: str
+    directions: np.ndarray
+
+
+def path_to_directions(points: Sequence[Tuple[float, float]], n: int = 16) -> np.ndarray:
+    """Resample a polyline to n equal-length steps and return their unit directions."""
+    pts = np.asarray(points, dtype=np.float64)
+    seg = np.hypot(*np.diff(pts, axis=0).T)
+    arc = np.concatenate(([0.0], np.cumsum(seg)))
+    s = np.linspace(0.0, arc[-1], n + 1)
+    resampled = np.stack([np.interp(s, arc, pts[:, 0]), np.interp(s, arc, pts[:, 1])], axis=1)
+    d = np.diff(resampled, axis=0)
+    return d / np.maximum(np.hypot(d[:, 0], d[:, 1]), 1e-12)[:, None]
+
+
+def builtin_templates() -> List[MotionTemplate]:
+    """
+    Swipes in four directions and circles both ways, in image coordinates
+    (y down). Each circle gets four start phases, because a circle can begin
+    anywhere on its rim.
+    """
+    templates = [
+        MotionTemplate("swipe_left", path_to_directions([(1, 0), (0, 0)], 8)),
+        MotionTemplate("swipe_right", path_to_directions([(0, 0), (1, 0)], 8)),
+        MotionTemplate("swipe_up", path_to_directions([(0, 1), (0, 0)], 8)),
+        MotionTemplate("swipe_down", path_to_directions([(0, 0), (0, 1)], 8)),
+    ]
+    for name, sign in (("circle_cw", 1.0), ("circle_ccw", -1.0)):
+        for phase in range(4):
+            theta = phase * math.pi / 2 + sign * np.linspace(0.0, 2 * math.pi, 64)
+            ring = np.stack([np.cos(theta), np.sin(theta)], axis=1)   # y down: +θ is clockwise
+            templates.append(MotionTemplate(name, path_to_directions(ring, 20)))
+    return templates
+
+
+class MotionGestureRecognizer:
+    """Streaming, template-vectorized subsequence DTW over palm motion direction."""
+
+    def __init__(
+        self,
+        templates: Optional[List[MotionTemplate]] = None,
+        threshold: float = 0.1,
+        min_speed: float = 0.25,
+        velocity_span: int = 2,
+        ring_size: int = 32,
+        cooldown_ms: float = 600.0,
+        max_stay: int = 3,
+        settle_frames: int = 2,
+    ):
+        self.threshold = threshold          # max path cost per template point (0 = perfect match)
+        self.min_speed = min_speed          # units/s — slower motion counts as "still"
+        self.velocity_span = velocity_span  # frames between the two ring samples used for velocity
+        self.cooldown_ms = cooldown_ms
+        self.max_stay = max_stay            # gestures up to (max_stay + 1)× slower than the template
+        self.settle_frames = settle_frames  # slow frames in a row that end a movement
+        self._ring = np.zeros((ring_size, 3))   # rows: x, y, t
+        self.set_templates(templates if templates is not None else builtin_templates())
+
+    def set_templates(self, templates: List[MotionTemplate]):
+        """Stack templates into padded arrays (T, L, 2) and restart matching."""
+        self.templates = list(templates)
+        self.names = [t.name for t in self.templates]
+        lengths = np.array([len(t.directions) for t in self.templates])
+        width = int(lengths.max())
+        self._dirs = np.zeros((len(self.templates), width, 2))
+        for i, t in enumerate(self.templates):
+            self._dirs[i, :len(t.directions)] = t.directions
+        self._rows = np.arange(len(self.templates))
+        self._end = lengths + 1                 # end column in the padded DTW arrays
+        self._lengths = lengths.astype(np.float64)
+        self._min_frames = lengths // 2
+        self.reset()
+
+    def reset(self):
+        """Forget the motion history (e.g. hand lost or pinching)."""
+        n, width = self._dirs.shape[:2]
+        # Columns 0 and 1 are the free start (cost 0, may begin at any frame)
+        self._cost = np.full((n, width + 2), np.inf)
+        self._cost[:, :2] = 0.0
+        self._frames = np.zeros((n, width + 2))   # input frames along the best path
+        self._held = np.zeros((n, width), dtype=np.int64)   # consecutive stays per cell
+        self._count = 0
+        self._still = 0
+        self._pending: Optional[Tuple[str, float]] = None   # best (name, rank) of this movement
+        self._quiet_until = -math.inf
+
+    def update(self, point: Tuple[float, float], t: float) -> Optional[str]:
+        """Feed one palm position; returns a gesture name on the frame it completes."""
+        size = len(self._ring)
+        self._ring[self._count % size] = (point[0], point[1], t)
+        self._count += 1
+        if self._count <= self.velocity_span:
+            return None
+
+        x0, y0, t0 = self._ring[(self._count - 1 - self.velocity_span) % size]
+        dt = t - t0
+        vx = (point[0] - x0) / dt if dt > 0 else 0.0
+        vy = (point[1] - y0) / dt if dt > 0 else 0.0
+        speed = math.hypot(vx, vy)
+        moving = speed >= self.min_speed
+        u = np.array([vx / speed, vy / speed]) if moving else np.zeros(2)
+
+        # Frame cost against every template point: (1 - cos) / 2; 0.5 when still
+        c = (1.0 - self._dirs @ u) * 0.5
+
+        # One DTW column step for all templates: min over (stay, advance, skip one);
+        # a point may be held for at most max_stay extra frames (slope constraint)
+        d, f, held = self._cost, self._frames, self._held
+        stay = np.where(held < self.max_stay, d[:, 2:], np.inf)
+        adv, skip = d[:, 1:-1], d[:, :-2]
+        move = np.minimum(adv, skip)
+        take_stay = stay <= move
+        frames = np.where(take_stay, f[:, 2:], np.where(adv <= skip, f[:, 1:-1], f[:, :-2]))
+        np.add(np.minimum(stay, move), c, out=d[:, 2:])
+        np.add(frames, 1.0, out=f[:, 2:])
+        np.copyto(held, np.where(take_stay, held + 1, 0))
+
+        if t < self._quiet_until:
+            return None
+        if moving:
+            self._still = 0
+            end_frames = f[self._rows, self._end]
+            score = d[self._rows, self._end] / self._lengths
+            ok = (end_frames >= self._min_frames) & (score <= self.threshold)
+            if ok.any():
+                # Prefer the match explaining the most motion (a circle over its first arc)
+                rank = np.where(ok, end_frames - score, -np.inf)
+                i = int(np.argmax(rank))
+                if self._pending is None or rank[i] >= self._pending[1]:
+                    self._pending = (self.names[i], rank[i])
+            return None
+        self._still += 1
+        if self._pending is None or self._still < self.settle_frames:
+            return None
+
+        # Motion stopped after a match: fire once, then restart every alignment
+        name = self._pending[0]
+        d[:, 2:] = np.inf
+        f[:, 2:] = 0.0
+        self._held[:] = 0
+        self._pending = None
+        self._quiet_until = t + self.cooldown_ms / 1000.0
+        return name
@@ -0,0 +1,108 @@
+"""
+PinchDebouncer — hysteresis and dwell for the thumb-to-fingertip pinches.
+
+With a single cutoff a fingertip resting near threshold * D_ref flickers
+between pinched and open every frame, and each flicker walks the gesture
+map through a full pinch / release / re-pinch (spurious MOUSE_DOWN/UP
+pairs). The debouncer gives every finger two thresholds: a pinch starts
+below enter * D_ref but only ends above exit * D_ref (exit ≥ enter). With
+dwell_frames > 1 a change must also be seen on that many consecutive
+frames before it is reported.
+
+The same rule is applied to the index, middle, ring and pinky flags of
+HandFeatures.pinch_mask, so the FSM, scrolling and motion gestures all see
+debounced pinches. debounce_series() applies it to a whole recorded
+session at once (the batch evaluator and the churn report use it).
+
+Usage:
+    debouncer = PinchDebouncer(enter=0.15, exit=0.20, dwell_frames=2)
+    mask = debouncer.update(features.tip_distances, features.dref)
+    debouncer.reset()          # hand lost
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+class PinchDebouncer:
+    """Per-finger two-threshold pinch state with an optional dwell."""
+
+    def __init__(self, enter: float = 0.15, exit: float = 0.20, dwell_frames: int = 1, fingers: int = 4):
+        self.enter = enter
+        self.exit = exit
+        self.dwell_frames = dwell_frames
+        self.state = np.zeros(fingers, dtype=bool)
+        self._pending = np.zeros(fingers, dtype=np.int64)   # consecutive frames disagreeing with state
+
+    def configure(self, enter: float, exit: float, dwell_frames: int):
+        self.enter = enter
+        self.exit = max(exit, enter)
+        self.dwell_frames = dwell_frames
+
+    def reset(self):
+        self.state[:] = False
+        self._pending[:] = 0
+
+    def update(self, tip_distances: Sequence[float], dref: float) -> np.ndarray:
+        """Feed one frame's thumb-to-tip distances; returns the debounced pinch flags."""
+        tip_distances = np.asarray(tip_distances)
+        raw = np.where(self.state, tip_distances < self.exit * dref, tip_distances < self.enter * dref)
+        if self.dwell_frames <= 1:
+            self.state = raw
+            return raw
+        changed = raw != self.state
+        self._pending = np.where(changed, self._pending + 1, 0)
+        flip = self._pending >= self.dwell_frames
+        if flip.any():
+            self.state = self.state ^ flip
+            self._pending[flip] = 0
+        return self.state.copy()
+
+
+def debounce_series(
+    distances: np.ndarray,
+    dref: np.ndarray,
+    enter: float,
+    exit: float,
+    dwell_frames: int = 1,
+    restart: Optional[np.ndarray] = None,
+    hold: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    PinchDebouncer over a whole session.
+    distances: (N, F) thumb-to-tip distances per frame and finger
+    dref: (N,) D_ref per frame
+    restart: (N,) True where the state starts over as released (hand found again)
+    hold: (N,) True on frames that must not change the state (e.g. D_ref == 0)
+    """
+    n, fingers = distances.shape
+    exit = max(exit, enter)
+    restart = np.zeros(n, dtype=bool) if restart is None else np.asarray(restart, dtype=bool)
+    hold = np.zeros(n, dtype=bool) if hold is None else np.asarray(hold, dtype=bool)
+
+    if dwell_frames > 1:
+        d = PinchDebouncer(enter, exit, dwell_frames, fingers)
+        out = np.zeros((n, fingers), dtype=bool)
+        for i in range(n):
+            if restart[i]:
+                d.reset()
+            if not hold[i]:
+                d.update(distances[i], dref[i])
+            out[i] = d.state
+        return out
+
+    # Without dwell the state is set by the last frame outside the hysteresis
+    # band (below enter → pinched, not below exit → released) since the restart
+    below = distances < (enter * dref)[:, None]
+    decisive = (below | ~(distances < (exit * dref)[:, None])) & ~hold[:, None]
+    rows = np.arange(n)[:, None]
+    last = np.maximum.accumulate(np.where(decisive, rows, -1), axis=0)
+    start = np.maximum.accumulate(np.where(restart, np.arange(n), 0))[:, None]
+    return (last >= start) & below[np.maximum(last, 0), np.arange(fingers)]
+
+
+def pinch_toggles(mask: np.ndarray) -> int:
+    """Number of pinch on/off changes in an (N,) or (N, F) series."""
+    mask = np.asarray(mask, dtype=bool)
+    return int((mask[1:] != mask[:-1]).sum())
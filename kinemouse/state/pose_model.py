@@ -0,0 +1,191 @@
+"""
+PoseModel — trainable static-pose classifier (pure NumPy).
+
+Landmarks are normalized into a hand-centred frame before classification:
+origin at the wrist, y axis towards the middle knuckle, x axis across the
+knuckles (index → pinky side), z the palm normal, scaled by the
+wrist→middle-knuckle length. The resulting 63-d vector does not change when
+the hand moves, rotates or changes distance to the camera.
+
+Two model types, both trained in one vectorized pass:
+- "centroid": one mean vector per pose (tiny artifact, fastest)
+- "knn":      k nearest stored samples vote (more flexible poses)
+
+A frame farther from its predicted pose's centroid than that pose's
+rejection radius (a quantile of its training distances, with margin)
+is UNKNOWN.
+
+Models are trained offline with tools/train_pose_model.py and saved as a
+small .npz. PoseModel.classify is a drop-in for classify_pose: it returns
+a HandPose when the label names one, otherwise the custom label string.
+
+Usage:
+    model = PoseModel.load("poses.npz")
+    pose = model.classify(landmarks)             # HandPose.FIST or e.g. "ROCK_ON"
+"""
+
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from kinemouse.utils.constants import WRIST, INDEX_MCP, MIDDLE_MCP, PINKY_MCP, NUM_LANDMARKS
+from kinemouse.state.hand_features import HandFeatures, landmarks_to_array
+from kinemouse.state.gesture_classifier import HandPose
+
+FEATURE_DIM = NUM_LANDMARKS * 3
+UNKNOWN = "UNKNOWN"
+
+# Component orders for the cross product (np.cross is slow on tiny arrays)
+_ROT1 = np.array([1, 2, 0])
+_ROT2 = np.array([2, 0, 1])
+
+
+def normalize_landmarks(points: np.ndarray) -> np.ndarray:
+    """(..., 21, 3) landmarks → (..., 63) hand-frame feature vectors."""
+    p = points - points[..., WRIST:WRIST + 1, :]
+    up = p[..., MIDDLE_MCP, :]
+    scale = np.sqrt((up * up).sum(axis=-1, keepdims=True)) + 1e-12
+    y = up / scale
+    across = p[..., INDEX_MCP, :] - p[..., PINKY_MCP, :]
+    across = across - (across * y).sum(axis=-1, keepdims=True) * y
+    x = across / (np.sqrt((across * across).sum(axis=-1, keepdims=True)) + 1e-12)
+    z = x[..., _ROT1] * y[..., _ROT2] - x[..., _ROT2] * y[..., _ROT1]   # x × y
+    basis = np.stack([x, y, z], axis=-2)                    # (..., 3, 3) rows = axes
+    local = np.einsum("...ij,...kj->...ki", basis, p) / scale[..., None]
+    return local.reshape(local.shape[:-2] + (FEATURE_DIM,))
+
+
+class PoseModel:
+    """Nearest-centroid or k-NN classifier over normalized landmark vectors."""
+
+    def __init__(
+        self,
+        classes: Sequence[str],
+        centroids: np.ndarray,
+        reject_radius: np.ndarray,
+        samples: Optional[np.ndarray] = None,
+        sample_labels: Optional[np.ndarray] = None,
+        k: int = 0,
+    ):
+        self.classes: List[str] = list(classes)
+        self.centroids = np.asarray(centroids, dtype=np.float64)
+        self.reject_radius = np.asarray(reject_radius, dtype=np.float64)
+        self.samples = samples
+        self.sample_labels = sample_labels
+        self.k = k if samples is not None else 0
+        # Cached squared norms for the distance expansion
+        self._centroid_sq = (self.centroids * self.centroids).sum(axis=1)
+        if self.k:
+            self._sample_sq = (samples * samples).sum(axis=1)
+            self._one_hot = np.eye(len(self.classes))
+        self._poses = [HandPose[c] if c in HandPose.__members__ else c for c in self.classes]
+
+    @property
+    def method(self) -> str:
+        return "knn" if self.k else "centroid"
+
+    # --- Training ---
+
+    @classmethod
+    def fit(
+        cls,
+        points: np.ndarray,
+        labels: Sequence[str],
+        method: str = "centroid",
+        k: int = 5,
+        max_per_class: int = 500,
+        reject_quantile: float = 0.99,
+        reject_margin: float = 1.5,
+        seed: int = 0,
+    ) -> "PoseModel":
+        """
+        Train from (N, 21, 3) landmarks and N pose labels.
+        max_per_class caps the samples kept per pose for k-NN.
+        """
+        if method not in ("centroid", "knn"):
+            raise ValueError(f"Unknown pose model method {method!r}")
+        features = normalize_landmarks(np.asarray(points, dtype=np.float64))
+        labels = np.asarray(labels)
+        classes, y = np.unique(labels, return_inverse=True)
+
+        counts = np.bincount(y, minlength=len(classes))
+        centroids = np.zeros((len(classes), FEATURE_DIM))
+        np.add.at(centroids, y, features)
+        centroids /= counts[:, None]
+
+        dist = np.linalg.norm(features - centroids[y], axis=1)
+        radius = np.array([
+            np.quantile(dist[y == c], reject_quantile) * reject_margin for c in range(len(classes))
+        ])
+
+        if method == "centroid":
+            return cls(classes.tolist(), centroids, radius)
+
+        rng = np.random.default_rng(seed)
+        keep = np.concatenate([
+            rng.permutation(np.flatnonzero(y == c))[:max_per_class] for c in range(len(classes))
+        ])
+        return cls(classes.tolist(), centroids, radius, features[keep], y[keep].astype(np.int32), k)
+
+    # --- Inference ---
+
+    def predict(self, points: np.ndarray) -> np.ndarray:
+        """Class indices for (N, 21, 3) landmarks; -1 where rejected."""
+        x = normalize_landmarks(np.asarray(points, dtype=np.float64))
+        return self._predict_features(x.reshape(-1, FEATURE_DIM))
+
+    def _predict_features(self, x: np.ndarray) -> np.ndarray:
+        # Squared distances via |x|² - 2x·c + |c|² (one matrix product);
+        # |x|² is the same for every candidate, so it only matters for rejection
+        x_sq = (x * x).sum(axis=1)[:, None]
+        to_centroids = x_sq - 2.0 * (x @ self.centroids.T) + self._centroid_sq
+        if self.k:
+            to_samples = self._sample_sq - 2.0 * (x @ self.samples.T)
+            k = min(self.k, to_samples.shape[1])
+            nearest = np.argpartition(to_samples, k - 1, axis=1)[:, :k]
+            votes = self._one_hot[self.sample_labels[nearest]].sum(axis=1)
+            pred = votes.argmax(axis=1)
+        else:
+            pred = to_centroids.argmin(axis=1)
+        d = np.sqrt(np.maximum(to_centroids[np.arange(len(x)), pred], 0.0))
+        return np.where(d <= self.reject_radius[pred], pred, -1)
+
+    def predict_label(self, landmarks) -> str:
+        """Pose label for one frame (UNKNOWN when rejected)."""
+        idx = int(self._predict_features(normalize_landmarks(landmarks_to_array(landmarks))[None])[0])
+        return self.classes[idx] if idx >= 0 else UNKNOWN
+
+    def classify(self, landmarks, features: Optional[HandFeatures] = None) -> Union[HandPose, str]:
+        """Drop-in for classify_pose: HandPose for built-in names, else the custom label."""
+        if landmarks is None:
+            return HandPose.UNKNOWN
+        points = features.points if features is not None else landmarks_to_array(landmarks)
+        idx = int(self._predict_features(normalize_landmarks(points)[None])[0])
+        return self._poses[idx] if idx >= 0 else HandPose.UNKNOWN
+
+    # --- Persistence ---
+
+    def save(self, path: Union[str, Path]):
+        arrays = dict(
+            classes=np.asarray(self.classes, dtype=str),
+            centroids=self.centroids,
+            reject_radius=self.reject_radius,
+            k=np.asarray(self.k),
+        )
+        if self.k:
+            arrays.update(samples=self.samples.astype(np.float32), sample_labels=self.sample_labels)
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PoseModel":
+        with np.load(path) as data:
+            k = int(data["k"])
+            return cls(
+                data["classes"].tolist(),
+                data["centroids"],
+                data["reject_radius"],
+                data["samples"].astype(np.float64) if k else None,
+                data["sample_labels"] if k else None,
+                k,
+            )
@@ -4,19 +4,27 @@ ScrollGesture — detects Ring+Thumb pinch and maps hand elevation to scroll eve
 PRD Phase 2 feature: Pinching Ring Finger (16) + Thumb (4), then moving hand
 up/down triggers scroll up/down.
 
+Two outputs per frame:
+- ScrollEvent ticks, at most every scroll_interval_ms (legacy coarse scrolling)
+- velocity: continuous scroll speed in notches/s (+ = up), proportional to
+  the elevation past the dead zone, for SmoothScroller
+
 Usage:
     scroller = ScrollGesture(config)
     result = scroller.process(landmarks, dref)
-    # result is ScrollEvent or None
+    # result is ScrollEvent or None; scroller.active / scroller.velocity every frame
+
+    # Or share the frame's HandFeatures with GestureFSM:
+    result = scroller.process(landmarks, features.dref, features=features)
 """
 
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from kinemouse.utils.config import KineMouseConfig
-from kinemouse.utils.math_utils import is_pinching
+from kinemouse.state.hand_features import HandFeatures
 
 
 class ScrollDirection(Enum):
@@ -24,10 +32,11 @@ class ScrollDirection(Enum):
     DOWN = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScrollEvent:
     direction: ScrollDirection
-    magnitude: int = 1   # scroll ticks
+    magnitude: int = 1     # scroll ticks
+    velocity: float = 0.0  # continuous speed at this frame, notches/s (+ = up)
 
 
 class ScrollGesture:
@@ -36,36 +45,54 @@ class ScrollGesture:
     Fires scroll events at a fixed interval to prevent scroll spam.
     """
 
-    def __init__(self, config: KineMouseConfig, scroll_interval_ms: int = 120):
+    def __init__(
+        self,
+        config: KineMouseConfig,
+        scroll_interval_ms: int = 120,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.config = config
         self._interval = scroll_interval_ms / 1000.0
-        self._last_fire = 0.0
+        self._clock = clock   # Fallback time source when frames carry no timestamp
+        self._last_fire: Optional[float] = None
         self._baseline_y: Optional[float] = None   # Y when pinch started
         self._pinching = False
-
-    def process(self, landmarks: List, dref: float) -> Optional[ScrollEvent]:
+        self.velocity = 0.0   # notches/s (+ = up); 0 outside the gesture
+
+    @property
+    def active(self) -> bool:
+        """True while the scroll pinch is held."""
+        return self._pinching
+
+    def process(
+        self,
+        landmarks: List,
+        dref: float,
+        features: Optional[HandFeatures] = None,
+        timestamp: Optional[float] = None,
+    ) -> Optional[ScrollEvent]:
         """
         Call each frame. Returns ScrollEvent if scrolling, else None.
         landmarks: MediaPipe landmark list
         dref: precomputed D_ref for this frame
+        features: optional HandFeatures shared with the other gesture consumers
+        timestamp: frame capture time in seconds; the injected clock is used when omitted
         """
         if landmarks is None or dref == 0:
             self._reset()
             return None
 
-        ring_pinch = is_pinching(
-            landmarks,
-            self.config.THUMB_TIP,
-            self.config.RING_TIP,
-            dref,
-            self.config.pinch_threshold
-        )
+        if features is None:
+            features = HandFeatures(landmarks, self.config, dref=dref)
+
+        # Pinch flags come from one vectorized pass over all fingertips
+        ring_pinch = features.pinch_ring
 
         # Also ensure index/middle are NOT pinching to avoid conflicts
-        index_pinch = is_pinching(landmarks, self.config.THUMB_TIP, self.config.INDEX_TIP, dref, self.config.pinch_threshold)
+        index_pinch = features.pinch_index
 
         if ring_pinch and not index_pinch:
-            thumb_y = landmarks[self.config.THUMB_TIP].y
+            thumb_y = features.xy(self.config.THUMB_TIP)[1]
 
             if not self._pinching:
                 # Pinch just started — record baseline
@@ -78,16 +105,21 @@ class ScrollGesture:
             dead_zone = 0.02  # 2% of frame height, ignore tiny jitter
 
             if abs(delta) < dead_zone:
+                self.velocity = 0.0
                 return None
 
-            now = time.monotonic()
-            if now - self._last_fire < self._interval:
+            # Continuous speed grows linearly past the dead zone (4% per scroll_speed)
+            excess = (abs(delta) - dead_zone) / 0.04
+            self.velocity = self.config.scroll_speed * excess * (1.0 if delta > 0 else -1.0)
+
+            now = self._clock() if timestamp is None else timestamp
+            if self._last_fire is not None and now - self._last_fire < self._interval:
                 return None
 
             self._last_fire = now
             direction = ScrollDirection.UP if delta > 0 else ScrollDirection.DOWN
             magnitude = max(1, int(abs(delta) / 0.04))  # scale: 4% per tick
-            return ScrollEvent(direction=direction, magnitude=magnitude)
+            return ScrollEvent(direction=direction, magnitude=magnitude, velocity=self.velocity)
 
         else:
             self._reset()
@@ -96,3 +128,4 @@ class ScrollGesture:
     def _reset(self):
         self._pinching = False
         self._baseline_y = None
+        self.velocity = 0.0
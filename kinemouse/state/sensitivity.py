@@ -10,16 +10,30 @@ Sensitivity is applied as a multiplier on the screen coordinate mapping,
 effectively scaling the active_box to change how much hand movement
 maps to screen movement.
 
+It also maps the smoothed hand point to the screen for GestureFSM:
+- pointer_mode "absolute": the (adjusted) active box covers the screen
+- pointer_mode "relative": a clutch — the cursor moves by hand deltas only
+  while the index pinch is held, so a small box can cover any desktop
+- pointer_accel: deltas are scaled by a speed-dependent gain (slow, deliberate
+  movement = fine precision, fast sweeps = long distance). In absolute mode
+  each stroke starts at the absolute position and then moves by gained deltas.
+  The curve is precomputed into a lookup table, so a frame costs one index.
+
 Usage:
     sens = SensitivityController(config)
     sens.set_mode("slow")
     adjusted_box = sens.adjusted_active_box
+    screen_pos = sens.map(point, now, engaged=pinching, screen_res=(1920, 1080))
 """
 
+import math
 from enum import Enum, auto
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import map_to_screen
 
 
 class SensitivityMode(Enum):
@@ -35,6 +49,50 @@ _MODE_SCALE = {
 }
 
 
+class AccelerationCurve:
+    """
+    Pointer gain as a function of hand speed (normalized units/s), tabulated.
+
+    Parametric form: min_gain up to low_speed, max_gain from high_speed, and
+    min + (max - min) * t**exponent in between. Alternatively pass explicit
+    (speed, gain) points, interpolated linearly. Speeds past the table end
+    use the last gain.
+    """
+
+    SIZE = 256
+
+    def __init__(
+        self,
+        min_gain: float = 0.4,
+        max_gain: float = 2.5,
+        low_speed: float = 0.05,
+        high_speed: float = 0.8,
+        exponent: float = 1.5,
+        points: Sequence[Tuple[float, float]] = (),
+    ):
+        if points:
+            pts = sorted((float(sp), float(g)) for sp, g in points)
+            top = pts[-1][0] or 1.0
+            speeds = np.linspace(0.0, top, self.SIZE)
+            gains = np.interp(speeds, [p[0] for p in pts], [p[1] for p in pts])
+        else:
+            top = max(high_speed, 1e-6)
+            speeds = np.linspace(0.0, top, self.SIZE)
+            t = np.clip((speeds - low_speed) / max(high_speed - low_speed, 1e-9), 0.0, 1.0)
+            gains = min_gain + (max_gain - min_gain) * t ** exponent
+        self._table: List[float] = gains.tolist()
+        self._inv_step = (self.SIZE - 1) / top
+
+    def gain(self, speed: float) -> float:
+        i = int(speed * self._inv_step)
+        return self._table[i] if i < self.SIZE else self._table[-1]
+
+
+def _curve_key(cfg: KineMouseConfig) -> tuple:
+    return (cfg.accel_min_gain, cfg.accel_max_gain, cfg.accel_low_speed,
+            cfg.accel_high_speed, cfg.accel_exponent, tuple(map(tuple, cfg.accel_curve)))
+
+
 class SensitivityController:
     """
     Adjusts the effective active_box size to control cursor sensitivity.
@@ -46,6 +104,12 @@ class SensitivityController:
         self._mode = SensitivityMode.NORMAL
         self._custom_scale: float = 1.0
 
+        # Pointer mapping state (relative / accelerated modes)
+        self._curve_key: Optional[tuple] = None
+        self._curve: Optional[AccelerationCurve] = None
+        self._cursor: Optional[List[float]] = None             # float screen position
+        self._last: Optional[Tuple[float, float, float]] = None  # (x, y, t) of the last engaged frame
+
     @property
     def mode(self) -> SensitivityMode:
         return self._mode
@@ -74,6 +138,8 @@ class SensitivityController:
         Return an active_box scaled around its center.
         Larger scale = wider box = slower (more precise) cursor.
         """
+        if self.scale == 1.0:
+            return self._config.active_box   # Exact: no rounding from re-centering
         x_min, y_min, x_max, y_max = self._config.active_box
         cx = (x_min + x_max) / 2
         cy = (y_min + y_max) / 2
@@ -86,3 +152,71 @@ class SensitivityController:
             min(1.0, cx + half_w),
             min(1.0, cy + half_h),
         )
+
+    # --- Pointer mapping ---
+
+    @property
+    def curve(self) -> AccelerationCurve:
+        """The acceleration curve for the current config (rebuilt when it changes)."""
+        key = _curve_key(self._config)
+        if key != self._curve_key:
+            self._curve_key = key
+            cfg = self._config
+            self._curve = AccelerationCurve(
+                cfg.accel_min_gain, cfg.accel_max_gain, cfg.accel_low_speed,
+                cfg.accel_high_speed, cfg.accel_exponent, cfg.accel_curve,
+            )
+        return self._curve   # type: ignore
+
+    def map(
+        self,
+        point: Tuple[float, float],
+        now: float,
+        engaged: bool,
+        screen_res: Tuple[int, int],
+    ) -> Tuple[int, int]:
+        """
+        Screen position for this frame's smoothed hand point.
+        engaged: the clutch (index pinch) is held — only then does the cursor
+        move in relative / accelerated modes.
+        """
+        cfg = self._config
+        box = self.adjusted_active_box
+        if cfg.pointer_mode != "relative" and not cfg.pointer_accel:
+            return map_to_screen(point, box, screen_res)
+
+        if not engaged:
+            self._last = None   # Clutch open — the hand can move freely
+            if self._cursor is None:
+                return map_to_screen(point, box, screen_res)
+            return (int(self._cursor[0]), int(self._cursor[1]))
+
+        if self._last is None:
+            # Clutch engages: absolute mode re-anchors, relative continues
+            if self._cursor is None or cfg.pointer_mode != "relative":
+                sx, sy = map_to_screen(point, box, screen_res)
+                self._cursor = [float(sx), float(sy)]
+            self._last = (point[0], point[1], now)
+            return (int(self._cursor[0]), int(self._cursor[1]))
+
+        lx, ly, lt = self._last
+        dx, dy = point[0] - lx, point[1] - ly
+        self._last = (point[0], point[1], now)
+        gain = 1.0
+        if cfg.pointer_accel and now > lt:
+            gain = self.curve.gain(math.hypot(dx, dy) / (now - lt))
+
+        cursor = self._cursor
+        w, h = screen_res
+        cursor[0] = min(max(cursor[0] + dx * gain * w / (box[2] - box[0]), 0.0), w - 1.0)
+        cursor[1] = min(max(cursor[1] + dy * gain * h / (box[3] - box[1]), 0.0), h - 1.0)
+        return (int(cursor[0]), int(cursor[1]))
+
+    def release(self):
+        """Hand lost: open the clutch (the cursor position is kept)."""
+        self._last = None
+
+    def reset(self):
+        """Forget the cursor position too."""
+        self._last = None
+        self._cursor = None
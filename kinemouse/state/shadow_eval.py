@@ -0,0 +1,179 @@
+"""
+ShadowEvaluator — run candidate GestureFSM configs on the live frames.
+
+Tuning a filter or the gesture map normally means recording a session and
+replaying it. Shadow mode instead feeds every live frame's landmarks to
+one or more extra GestureFSM instances, each with its own config, and
+compares what they would have done with what the active FSM did. Shadow
+events never reach the OS: they go to an optional JSON-lines log and into
+divergence statistics.
+
+The camera loop only calls submit(), which puts a reference to the frame
+on a bounded queue (put_nowait; a full queue drops the frame for the
+shadows and counts it). All shadow processing runs on a worker thread.
+Shadows use the frame timestamps, so their timers behave as they would
+live however far the worker lags.
+
+Divergence per shadow, relative to the active instance:
+- agreement: share of frames where both emitted the same event type
+- divergences: runs of consecutive disagreeing frames
+- cursor error: mean / max distance (px) between the two cursor positions
+  on frames where both placed the cursor
+- counts of discrete events (clicks, right clicks, presses, releases) for
+  each side
+
+Usage:
+    shadows = ShadowEvaluator(config, screen_res, {"one_euro": {"smoothing": "one_euro"}})
+    shadows.start()
+    shadows.submit(hand_frame.landmarks, hand_frame.timestamp, event)   # every frame
+    shadows.stop()
+    shadows.report()      # {"one_euro": {"agreement": 0.97, "cursor_error_px": 3.1, ...}}
+"""
+
+import json
+import math
+import queue
+import threading
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Optional, Tuple
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import apply_overrides
+from kinemouse.state.events import EventType, MouseEvent
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_DISCRETE = (EventType.CLICK, EventType.RIGHT_CLICK, EventType.MOUSE_DOWN, EventType.MOUSE_UP)
+_STOP = object()
+
+
+@dataclass
+class ShadowStats:
+    """Divergence of one shadow from the active FSM."""
+    frames: int = 0
+    agreed: int = 0
+    divergences: int = 0
+    position_frames: int = 0
+    position_error_sum: float = 0.0
+    position_error_max: float = 0.0
+    active_counts: Dict[str, int] = field(default_factory=dict)
+    shadow_counts: Dict[str, int] = field(default_factory=dict)
+    _diverging: bool = False
+
+    def observe(self, active: Tuple[int, Optional[Tuple[int, int]]], shadow: MouseEvent):
+        active_type, active_pos = active
+        self.frames += 1
+        same = active_type == shadow.type.value
+        if same:
+            self.agreed += 1
+        elif not self._diverging:
+            self.divergences += 1
+        self._diverging = not same
+        if active_pos is not None and shadow.position is not None:
+            err = math.hypot(active_pos[0] - shadow.position[0], active_pos[1] - shadow.position[1])
+            self.position_frames += 1
+            self.position_error_sum += err
+            self.position_error_max = max(self.position_error_max, err)
+        for kind, counts in ((EventType(active_type), self.active_counts), (shadow.type, self.shadow_counts)):
+            if kind in _DISCRETE:
+                counts[kind.name] = counts.get(kind.name, 0) + 1
+
+    def to_dict(self) -> dict:
+        data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+        data["agreement"] = self.agreed / self.frames if self.frames else None
+        data["cursor_error_px"] = (self.position_error_sum / self.position_frames
+                                   if self.position_frames else None)
+        return data
+
+
+class ShadowEvaluator:
+    """Candidate FSM configs evaluated on live frames by a background worker."""
+
+    def __init__(
+        self,
+        config: KineMouseConfig,
+        screen_res: Tuple[int, int],
+        shadows: Dict[str, dict],
+        queue_size: int = 256,
+        log_path: str = "",
+    ):
+        """
+        shadows: name → config overrides applied on top of config
+        queue_size: frames buffered for the worker before new ones are dropped
+        log_path: JSON-lines file for the shadows' non-idle events ("" = none)
+        """
+        self.fsms = {name: GestureFSM(apply_overrides(config, overrides), screen_res)
+                     for name, overrides in shadows.items()}
+        self.stats = {name: ShadowStats() for name in self.fsms}
+        self.log_path = log_path
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="kinemouse-shadow", daemon=True)
+            self._thread.start()
+
+    def submit(self, landmarks, timestamp: float, event: MouseEvent):
+        """Hand one frame (landmarks or None) and the active FSM's event to the shadows. Never blocks."""
+        try:
+            self._queue.put_nowait((landmarks, timestamp, event.type.value, event.position))
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self):
+        """Process what is queued, then stop the worker."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+
+    def process(self, landmarks, timestamp: float, active: Tuple[int, Optional[Tuple[int, int]]]) -> Dict[str, MouseEvent]:
+        """Run every shadow on one frame (the worker's step; callable directly in tests)."""
+        events = {}
+        with self._lock:
+            for name, fsm in self.fsms.items():
+                event = fsm.process(landmarks, timestamp=timestamp)
+                self.stats[name].observe(active, event)
+                events[name] = event
+        return events
+
+    def report(self) -> Dict[str, dict]:
+        with self._lock:
+            out = {name: s.to_dict() for name, s in self.stats.items()}
+        for entry in out.values():
+            entry["dropped"] = self.dropped
+        return out
+
+    def print_summary(self):
+        for name, r in self.report().items():
+            log.info("Shadow %-16s agreement=%s divergences=%d cursor_error=%s px events %s vs active %s (dropped %d)",
+                     name, "-" if r["agreement"] is None else f"{r['agreement']:.3f}", r["divergences"],
+                     "-" if r["cursor_error_px"] is None else f"{r['cursor_error_px']:.1f}",
+                     r["shadow_counts"], r["active_counts"], r["dropped"])
+
+    def _run(self):
+        out = open(self.log_path, "a") if self.log_path else None
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                landmarks, t, active_type, active_pos = item
+                events = self.process(landmarks, t, (active_type, active_pos))
+                if out is None:
+                    continue
+                for name, event in events.items():
+                    if event.type != EventType.IDLE:
+                        x, y = event.position if event.position is not None else (None, None)
+                        out.write(json.dumps({"shadow": name, "t": t, "type": event.type.name,
+                                              "x": x, "y": y, "active": EventType(active_type).name}) + "\n")
+        except Exception as e:
+            log.error("Shadow worker stopped: %s", e)
+        finally:
+            if out is not None:
+                out.close()
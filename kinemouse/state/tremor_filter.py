@@ -0,0 +1,220 @@
+"""
+TremorFilter — streaming band-stop for physiological / pathological tremor.
+
+Hand tremor sits in roughly 4–12 Hz, while deliberate pointing is mostly
+below 2–3 Hz. A low-pass EMA cannot separate the two: an alpha small enough
+to remove the tremor lags every deliberate movement. A band-stop (notch)
+biquad removes the tremor band instead and leaves the low frequencies
+nearly untouched, so it adds only a few milliseconds of delay at pointing
+speeds. delay_s() reports that group delay for the current design. Latency
+prediction adds it to its compensation.
+
+The notch is an RBJ band-stop biquad (transposed direct form II, two
+floats of state per axis) designed for the measured frame rate. It is
+primed to the first sample, so the cursor does not swing in from the origin.
+
+In adaptive mode a TremorEstimator follows the user's own tremor frequency
+and the notch is re-centred on it. A narrower notch on the right frequency
+removes as much tremor with less delay. The estimator is a sliding DFT over
+the last window frames of the midpoint's frame-to-frame motion. Each frame
+updates every bin in O(1) (one complex multiply-add per bin), so the
+per-frame cost is fixed. No FFT is recomputed over the window. Every
+estimate_every frames the strongest bin in the tremor band is refined by
+parabolic interpolation. It is only trusted when it carries a clear share
+of the motion energy. The learned centre is persisted per profile.
+
+Usage:
+    tremor = TremorFilter(center_hz=8.0, bandwidth_hz=6.0, adaptive=True)
+    point = tremor(raw_midpoint, timestamp)     # every frame
+    tremor.reset()                               # hand lost
+    tremor.center_hz, tremor.delay_s()           # learned frequency, added delay
+"""
+
+import cmath
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+TREMOR_BAND_HZ = (4.0, 12.0)
+
+
+def notch_coefficients(center_hz: float, bandwidth_hz: float, fs: float) -> Tuple[float, float, float, float, float]:
+    """Normalized RBJ band-stop biquad (b0, b1, b2, a1, a2) for sample rate fs."""
+    f0 = min(max(center_hz, 0.5), 0.45 * fs)
+    w0 = 2 * math.pi * f0 / fs
+    alpha = math.sin(w0) * bandwidth_hz / (2 * f0)   # sin(w0) / (2Q), Q = f0 / bandwidth
+    a0 = 1 + alpha
+    c = -2 * math.cos(w0) / a0
+    return 1 / a0, c, 1 / a0, c, (1 - alpha) / a0
+
+
+def biquad_response(coeffs, freq_hz: float, fs: float) -> complex:
+    """Complex frequency response H(e^jw) of a biquad at freq_hz."""
+    b0, b1, b2, a1, a2 = coeffs
+    z1 = cmath.exp(-2j * math.pi * freq_hz / fs)
+    z2 = z1 * z1
+    return (b0 + b1 * z1 + b2 * z2) / (1 + a1 * z1 + a2 * z2)
+
+
+class TremorEstimator:
+    """Dominant tremor frequency from a sliding DFT of 2D frame-to-frame motion."""
+
+    def __init__(self, window: int = 64, band: Tuple[float, float] = TREMOR_BAND_HZ,
+                 min_share: float = 0.3, r: float = 0.9999):
+        self.window = window
+        self.band = band
+        self.min_share = min_share        # peak share of the motion energy needed to trust it
+        self._k = np.arange(1, window // 2 + 1)
+        self._twiddle = r * np.exp(2j * np.pi * self._k / window)
+        self._r_n = r ** window           # damping keeps the recursion numerically stable
+        self._spectrum = np.zeros((2, len(self._k)), dtype=np.complex128)
+        self._ring = np.zeros((window, 2))
+        self._step = np.zeros((2, 1))
+        self.reset()
+
+    def reset(self):
+        self._spectrum[:] = 0
+        self._ring[:] = 0
+        self._pos = 0
+        self._filled = 0
+
+    def update(self, dx: float, dy: float):
+        """Add one frame of motion (O(window / 2), independent of history)."""
+        old = self._ring[self._pos]
+        step = self._step
+        step[0, 0] = dx - self._r_n * old[0]
+        step[1, 0] = dy - self._r_n * old[1]
+        self._spectrum *= self._twiddle
+        self._spectrum += step
+        old[0], old[1] = dx, dy
+        self._pos = (self._pos + 1) % self.window
+        self._filled = min(self._filled + 1, self.window)
+
+    def estimate(self, fs: float) -> Optional[float]:
+        """Peak frequency (Hz) in the tremor band, or None if no clear tremor."""
+        if self._filled < self.window:
+            return None
+        parts = self._spectrum.view(np.float64)       # interleaved re, im
+        power = np.einsum("ij,ij->j", parts, parts).reshape(-1, 2).sum(axis=1)
+        total = float(power.sum())
+        lo = max(math.ceil(self.band[0] * self.window / fs), 1) - 1     # bin k is power[k - 1]
+        hi = min(math.floor(self.band[1] * self.window / fs), len(power))
+        if total <= 0 or hi <= lo:
+            return None
+        i = lo + int(np.argmax(power[lo:hi]))
+        if float(power[max(i - 1, 0):i + 2].sum()) < self.min_share * total:
+            return None
+        shift = 0.0
+        if 0 < i < len(power) - 1:
+            left, mid, right = float(power[i - 1]), float(power[i]), float(power[i + 1])
+            denom = left - 2 * mid + right
+            if denom < 0:
+                shift = 0.5 * (left - right) / denom
+        return (i + 1 + shift) * fs / self.window
+
+
+class TremorFilter:
+    """2D band-stop on the pinch midpoint, optionally centred on the user's estimated tremor."""
+
+    def __init__(
+        self,
+        center_hz: float = 8.0,
+        bandwidth_hz: float = 6.0,
+        adaptive: bool = False,
+        fs: float = 30.0,
+        window: int = 64,
+        learn_rate: float = 0.05,
+        estimate_every: int = 4,
+    ):
+        self.center_hz = center_hz
+        self.bandwidth_hz = bandwidth_hz
+        self.adaptive = adaptive
+        self.fs = fs                       # running estimate of the frame rate
+        self.learn_rate = learn_rate       # EMA factor moving the centre toward each estimate
+        self.estimate_every = estimate_every   # frames between peak searches (the DFT updates every frame)
+        self.estimator = TremorEstimator(window)
+        self._design = (0.0, 0.0, 0.0)
+        self._coeffs = notch_coefficients(center_hz, bandwidth_hz, fs)
+        self.reset()
+
+    def configure(self, config):
+        """Sync parameters from a KineMouseConfig (called every frame for hot-reload)."""
+        self.bandwidth_hz = config.tremor_bandwidth_hz
+        if config.tremor_adaptive != self.adaptive:
+            self.adaptive = config.tremor_adaptive
+            self.estimator.reset()
+        if not self.adaptive:
+            self.center_hz = config.tremor_center_hz
+
+    def reset(self):
+        """Forget the signal (e.g. hand lost); the learned centre is kept."""
+        self._prev: Optional[Tuple[float, float]] = None
+        self._prev_t = 0.0
+        self._zx = [0.0, 0.0]
+        self._zy = [0.0, 0.0]
+        self._frames = 0
+        self.estimator.reset()
+
+    def _redesign(self):
+        design = (self.center_hz, self.bandwidth_hz, self.fs)
+        if (abs(design[0] - self._design[0]) > 0.05 or design[1] != self._design[1]
+                or abs(design[2] - self._design[2]) > 0.02 * design[2]):
+            self._design = design
+            self._coeffs = notch_coefficients(*design)
+
+    def _prime(self, point: Tuple[float, float]):
+        """Steady state for a constant input (the notch has unit DC gain)."""
+        b0, b1, b2, a1, a2 = self._coeffs
+        for z, v in ((self._zx, point[0]), (self._zy, point[1])):
+            z[1] = (b2 - a2) * v
+            z[0] = (b1 - a1) * v + z[1]
+
+    def __call__(self, point: Tuple[float, float], t: float) -> Tuple[float, float]:
+        """Filter one sample taken at time t (seconds); returns the filtered point."""
+        if self._prev is None:
+            self._redesign()
+            self._prime(point)
+            self._prev, self._prev_t = point, t
+            return point
+
+        dt = t - self._prev_t
+        if dt <= 0:
+            return point
+        self.fs += 0.05 * (1.0 / dt - self.fs)
+        if self.adaptive:
+            self.estimator.update(point[0] - self._prev[0], point[1] - self._prev[1])
+            self._frames += 1
+            if self._frames % self.estimate_every == 0:
+                found = self.estimator.estimate(self.fs)
+                if found is not None:
+                    self.center_hz += self.learn_rate * (found - self.center_hz)
+        self._prev, self._prev_t = point, t
+        self._redesign()
+
+        b0, b1, b2, a1, a2 = self._coeffs
+        out = []
+        for z, x in ((self._zx, point[0]), (self._zy, point[1])):
+            y = b0 * x + z[0]
+            z[0] = b1 * x - a1 * y + z[1]
+            z[1] = b2 * x - a2 * y
+            out.append(y)
+        return (out[0], out[1])
+
+    def gain(self, freq_hz: float) -> float:
+        """Amplitude response of the current notch at freq_hz."""
+        return abs(biquad_response(self._coeffs, freq_hz, self.fs))
+
+    def delay_s(self, freq_hz: float = 1.0) -> float:
+        """Group delay (seconds) the notch adds at freq_hz — deliberate movement speed."""
+        df = 0.01
+        lo = cmath.phase(biquad_response(self._coeffs, freq_hz - df, self.fs))
+        hi = cmath.phase(biquad_response(self._coeffs, freq_hz + df, self.fs))
+        return -(hi - lo) / (2 * math.pi * 2 * df)
+
+    def state(self) -> dict:
+        return {"center_hz": self.center_hz}
+
+    def load_state(self, state: Optional[dict]):
+        if state and "center_hz" in state:
+            self.center_hz = float(state["center_hz"])
@@ -4,7 +4,7 @@ All tuneable parameters in one place.
 """
 
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Dict, Tuple
 
 
 @dataclass
@@ -19,10 +19,85 @@ class KineMouseConfig:
 
     # --- Gesture Thresholds ---
     pinch_threshold: float = 0.15       # % of D_ref for pinch activation
+    pinch_release_threshold: float = 0.15  # % of D_ref a pinch must open past to end (> threshold = hysteresis)
+    pinch_dwell_frames: int = 1         # frames a pinch change must persist before it counts
     double_pinch_window_ms: int = 400   # ms window for double-pinch detection
+    adaptive_double_pinch: bool = False # learn the window from the user's own re-pinch timing
+    adaptive_double_pinch_reliability: float = 0.95  # share of re-pinches the window must catch
+    adaptive_double_pinch_min_ms: int = 200          # safe bounds for the learned window
+    adaptive_double_pinch_max_ms: int = 600
+    profile: str = "default"            # name under ~/.kinemouse/profiles/ for learned per-user state
+    click_mode: str = "double_pinch"    # "double_pinch" or "speculative" (click on release)
+    gesture_map: str = ""               # path to a custom gesture map (.json/.toml); overrides click_mode
+    drag_hold_ms: int = 500             # speculative: pinch held still this long starts a drag
+    drag_hold_radius_px: int = 12       # speculative: max cursor travel while holding
+    right_click_rearm_frames: int = 2   # frames released before right-click can fire again
+    right_click_cooldown_ms: int = 250  # min time between two right-clicks
+    suppress_repeat_moves: bool = True  # drop MOVE events that repeat the last position
+
+    # --- Pointer mapping ---
+    pointer_mode: str = "absolute"      # "absolute" (box → screen) or "relative" (clutch: moves while pinching)
+    pointer_accel: bool = False         # speed-dependent gain: slow = precise, fast = far
+    accel_min_gain: float = 0.4         # gain at/below accel_low_speed
+    accel_max_gain: float = 2.5         # gain at/above accel_high_speed
+    accel_low_speed: float = 0.05       # units/s
+    accel_high_speed: float = 0.8       # units/s
+    accel_exponent: float = 1.5         # curve shape between the two (1 = linear)
+    accel_curve: Tuple[Tuple[float, float], ...] = ()   # (speed, gain) points; overrides the above
 
     # --- Smoothing ---
+    smoothing: str = "ema"              # "ema" (fixed alpha) or "one_euro" (speed-adaptive)
     ema_alpha: float = 0.25             # EMA smoothing factor (lower = smoother, more lag)
+    one_euro_min_cutoff: float = 1.0    # Hz — cutoff at rest (lower = less jitter)
+    one_euro_beta: float = 10.0         # cutoff gain per unit/s of hand speed (higher = less lag)
+    one_euro_d_cutoff: float = 1.0      # Hz — cutoff for the speed estimate
+
+    # --- Latency compensation (extrapolate the cursor by the pipeline delay) ---
+    prediction: bool = False
+    prediction_latency_ms: float = 40.0       # fixed delay not measurable in-process (exposure, display)
+    prediction_stop_speed: float = 0.05       # units/s — prediction fades out below this
+    prediction_full_speed: float = 0.4        # units/s — full prediction above this
+
+    # --- Cursor interpolation (display-rate MOVEs between camera-rate targets) ---
+    cursor_interpolation: bool = False
+    cursor_output_hz: int = 120               # interpolated MOVEs per second while the cursor moves
+
+    # --- Scrolling (ring + thumb pinch, move hand up/down) ---
+    smooth_scroll: bool = True          # continuous hi-res scrolling with momentum (False = 120ms ticks)
+    scroll_speed: float = 6.0           # notches/s per 4% of frame height past the dead zone
+    scroll_friction_ms: float = 350.0   # momentum decay time constant after release (0 = none)
+    scroll_rate_hz: int = 120           # wheel events per second while scrolling
+
+    # --- Motion gestures (swipes, circles of the open hand → keyboard shortcuts) ---
+    motion_gestures: bool = False
+    motion_gesture_threshold: float = 0.1     # max DTW cost per template point (lower = stricter)
+    motion_gesture_cooldown_ms: int = 600     # quiet time after a gesture fires
+    motion_gesture_actions: Dict[str, str] = field(default_factory=lambda: {
+        "swipe_left":  "alt+left",
+        "swipe_right": "alt+right",
+        "circle_ccw":  "ctrl+z",
+        "circle_cw":   "ctrl+shift+z",
+    })
+
+    # --- Tremor suppression (band-stop on the pinch midpoint, before smoothing) ---
+    tremor_filter: bool = False
+    tremor_center_hz: float = 8.0       # notch centre (starting point when adaptive)
+    tremor_bandwidth_hz: float = 6.0    # stop-band width (narrower = less delay)
+    tremor_adaptive: bool = False       # follow the user's own tremor frequency (sliding DFT)
+    tremor_window_frames: int = 64      # estimation window, ~2 s at 30 FPS
+
+    # --- Landmark filtering (all 21 landmarks, before pinch/pose detection) ---
+    landmark_filter: bool = False
+    landmark_filter_min_cutoff: float = 1.5   # Hz at rest
+    landmark_filter_beta: float = 5.0         # cutoff gain per unit/s of coordinate speed
+
+    # --- Gesture history ---
+    history_db: str = ""                # SQLite file logging every dispatched event ("" = off)
+
+    # --- Shadow evaluation (candidate configs run on live frames, never dispatched) ---
+    shadow_configs: Dict[str, dict] = field(default_factory=dict)   # name → config overrides
+    shadow_queue_size: int = 256        # frames buffered for the shadow worker before dropping
+    shadow_log: str = ""                # JSON-lines file of shadow events ("" = stats only)
 
     # --- Performance ---
     max_num_hands: int = 1
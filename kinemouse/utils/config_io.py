@@ -5,6 +5,7 @@ Allows users to persist their calibration, alpha, thresholds etc.
 without changing source code.
 
 Default config path: ~/.kinemouse/config.json
+Per-profile learned state: ~/.kinemouse/profiles/<profile>.json
 
 Usage:
     from kinemouse.utils.config_io import load_config, save_config
@@ -12,6 +13,11 @@ Usage:
     config = load_config()          # loads from default or creates defaults
     config.ema_alpha = 0.15
     save_config(config)             # persists to disk
+
+    candidate = apply_overrides(config, {"smoothing": "one_euro"})
+
+    state = load_profile(config.profile)          # {} for a new profile
+    save_profile(config.profile, {**state, "double_pinch": learner.state()})
 """
 
 import json
@@ -23,6 +29,7 @@ from kinemouse.utils.config import KineMouseConfig
 
 
 _DEFAULT_CONFIG_PATH = Path.home() / ".kinemouse" / "config.json"
+_PROFILE_DIR = Path.home() / ".kinemouse" / "profiles"
 
 
 def _config_to_dict(config: KineMouseConfig) -> dict:
@@ -32,8 +39,60 @@ def _config_to_dict(config: KineMouseConfig) -> dict:
         "flip_horizontal":         config.flip_horizontal,
         "active_box":              list(config.active_box),
         "pinch_threshold":         config.pinch_threshold,
+        "pinch_release_threshold": config.pinch_release_threshold,
+        "pinch_dwell_frames":      config.pinch_dwell_frames,
         "double_pinch_window_ms":  config.double_pinch_window_ms,
+        "adaptive_double_pinch":   config.adaptive_double_pinch,
+        "adaptive_double_pinch_reliability": config.adaptive_double_pinch_reliability,
+        "adaptive_double_pinch_min_ms": config.adaptive_double_pinch_min_ms,
+        "adaptive_double_pinch_max_ms": config.adaptive_double_pinch_max_ms,
+        "profile":                 config.profile,
+        "click_mode":              config.click_mode,
+        "gesture_map":             config.gesture_map,
+        "drag_hold_ms":            config.drag_hold_ms,
+        "drag_hold_radius_px":     config.drag_hold_radius_px,
+        "right_click_rearm_frames": config.right_click_rearm_frames,
+        "right_click_cooldown_ms": config.right_click_cooldown_ms,
+        "suppress_repeat_moves":   config.suppress_repeat_moves,
+        "pointer_mode":            config.pointer_mode,
+        "pointer_accel":           config.pointer_accel,
+        "accel_min_gain":          config.accel_min_gain,
+        "accel_max_gain":          config.accel_max_gain,
+        "accel_low_speed":         config.accel_low_speed,
+        "accel_high_speed":        config.accel_high_speed,
+        "accel_exponent":          config.accel_exponent,
+        "accel_curve":             [list(p) for p in config.accel_curve],
+        "smoothing":               config.smoothing,
         "ema_alpha":               config.ema_alpha,
+        "one_euro_min_cutoff":     config.one_euro_min_cutoff,
+        "one_euro_beta":           config.one_euro_beta,
+        "one_euro_d_cutoff":       config.one_euro_d_cutoff,
+        "prediction":              config.prediction,
+        "prediction_latency_ms":   config.prediction_latency_ms,
+        "prediction_stop_speed":   config.prediction_stop_speed,
+        "prediction_full_speed":   config.prediction_full_speed,
+        "cursor_interpolation":    config.cursor_interpolation,
+        "cursor_output_hz":        config.cursor_output_hz,
+        "smooth_scroll":           config.smooth_scroll,
+        "scroll_speed":            config.scroll_speed,
+        "scroll_friction_ms":      config.scroll_friction_ms,
+        "scroll_rate_hz":          config.scroll_rate_hz,
+        "motion_gestures":         config.motion_gestures,
+        "motion_gesture_threshold": config.motion_gesture_threshold,
+        "motion_gesture_cooldown_ms": config.motion_gesture_cooldown_ms,
+        "motion_gesture_actions":  dict(config.motion_gesture_actions),
+        "tremor_filter":           config.tremor_filter,
+        "tremor_center_hz":        config.tremor_center_hz,
+        "tremor_bandwidth_hz":     config.tremor_bandwidth_hz,
+        "tremor_adaptive":         config.tremor_adaptive,
+        "tremor_window_frames":    config.tremor_window_frames,
+        "landmark_filter":         config.landmark_filter,
+        "landmark_filter_min_cutoff": config.landmark_filter_min_cutoff,
+        "landmark_filter_beta":    config.landmark_filter_beta,
+        "history_db":              config.history_db,
+        "shadow_configs":          {k: dict(v) for k, v in config.shadow_configs.items()},
+        "shadow_queue_size":       config.shadow_queue_size,
+        "shadow_log":              config.shadow_log,
         "max_num_hands":           config.max_num_hands,
         "min_detection_confidence": config.min_detection_confidence,
         "min_tracking_confidence":  config.min_tracking_confidence,
@@ -49,14 +108,76 @@ def _dict_to_config(data: dict) -> KineMouseConfig:
     if ab and len(ab) == 4:
         cfg.active_box = tuple(ab)
     cfg.pinch_threshold         = data.get("pinch_threshold",         cfg.pinch_threshold)
+    cfg.pinch_release_threshold = data.get("pinch_release_threshold", cfg.pinch_release_threshold)
+    cfg.pinch_dwell_frames      = data.get("pinch_dwell_frames",      cfg.pinch_dwell_frames)
     cfg.double_pinch_window_ms  = data.get("double_pinch_window_ms",  cfg.double_pinch_window_ms)
+    cfg.adaptive_double_pinch   = data.get("adaptive_double_pinch",   cfg.adaptive_double_pinch)
+    cfg.adaptive_double_pinch_reliability = data.get("adaptive_double_pinch_reliability", cfg.adaptive_double_pinch_reliability)
+    cfg.adaptive_double_pinch_min_ms = data.get("adaptive_double_pinch_min_ms", cfg.adaptive_double_pinch_min_ms)
+    cfg.adaptive_double_pinch_max_ms = data.get("adaptive_double_pinch_max_ms", cfg.adaptive_double_pinch_max_ms)
+    cfg.profile                 = data.get("profile",                 cfg.profile)
+    cfg.click_mode              = data.get("click_mode",              cfg.click_mode)
+    cfg.gesture_map             = data.get("gesture_map",             cfg.gesture_map)
+    cfg.drag_hold_ms            = data.get("drag_hold_ms",            cfg.drag_hold_ms)
+    cfg.drag_hold_radius_px     = data.get("drag_hold_radius_px",     cfg.drag_hold_radius_px)
+    cfg.right_click_rearm_frames = data.get("right_click_rearm_frames", cfg.right_click_rearm_frames)
+    cfg.right_click_cooldown_ms = data.get("right_click_cooldown_ms", cfg.right_click_cooldown_ms)
+    cfg.suppress_repeat_moves   = data.get("suppress_repeat_moves",   cfg.suppress_repeat_moves)
+    cfg.pointer_mode            = data.get("pointer_mode",            cfg.pointer_mode)
+    cfg.pointer_accel           = data.get("pointer_accel",           cfg.pointer_accel)
+    cfg.accel_min_gain          = data.get("accel_min_gain",          cfg.accel_min_gain)
+    cfg.accel_max_gain          = data.get("accel_max_gain",          cfg.accel_max_gain)
+    cfg.accel_low_speed         = data.get("accel_low_speed",         cfg.accel_low_speed)
+    cfg.accel_high_speed        = data.get("accel_high_speed",        cfg.accel_high_speed)
+    cfg.accel_exponent          = data.get("accel_exponent",          cfg.accel_exponent)
+    cfg.accel_curve             = tuple(tuple(p) for p in data.get("accel_curve", cfg.accel_curve))
+    cfg.smoothing               = data.get("smoothing",               cfg.smoothing)
     cfg.ema_alpha               = data.get("ema_alpha",               cfg.ema_alpha)
+    cfg.one_euro_min_cutoff     = data.get("one_euro_min_cutoff",     cfg.one_euro_min_cutoff)
+    cfg.one_euro_beta           = data.get("one_euro_beta",           cfg.one_euro_beta)
+    cfg.one_euro_d_cutoff       = data.get("one_euro_d_cutoff",       cfg.one_euro_d_cutoff)
+    cfg.prediction              = data.get("prediction",              cfg.prediction)
+    cfg.prediction_latency_ms   = data.get("prediction_latency_ms",   cfg.prediction_latency_ms)
+    cfg.prediction_stop_speed   = data.get("prediction_stop_speed",   cfg.prediction_stop_speed)
+    cfg.prediction_full_speed   = data.get("prediction_full_speed",   cfg.prediction_full_speed)
+    cfg.cursor_interpolation    = data.get("cursor_interpolation",    cfg.cursor_interpolation)
+    cfg.cursor_output_hz        = data.get("cursor_output_hz",        cfg.cursor_output_hz)
+    cfg.smooth_scroll           = data.get("smooth_scroll",           cfg.smooth_scroll)
+    cfg.scroll_speed            = data.get("scroll_speed",            cfg.scroll_speed)
+    cfg.scroll_friction_ms      = data.get("scroll_friction_ms",      cfg.scroll_friction_ms)
+    cfg.scroll_rate_hz          = data.get("scroll_rate_hz",          cfg.scroll_rate_hz)
+    cfg.motion_gestures         = data.get("motion_gestures",         cfg.motion_gestures)
+    cfg.motion_gesture_threshold = data.get("motion_gesture_threshold", cfg.motion_gesture_threshold)
+    cfg.motion_gesture_cooldown_ms = data.get("motion_gesture_cooldown_ms", cfg.motion_gesture_cooldown_ms)
+    cfg.motion_gesture_actions  = data.get("motion_gesture_actions",  cfg.motion_gesture_actions)
+    cfg.tremor_filter           = data.get("tremor_filter",           cfg.tremor_filter)
+    cfg.tremor_center_hz        = data.get("tremor_center_hz",        cfg.tremor_center_hz)
+    cfg.tremor_bandwidth_hz     = data.get("tremor_bandwidth_hz",     cfg.tremor_bandwidth_hz)
+    cfg.tremor_adaptive         = data.get("tremor_adaptive",         cfg.tremor_adaptive)
+    cfg.tremor_window_frames    = data.get("tremor_window_frames",    cfg.tremor_window_frames)
+    cfg.landmark_filter         = data.get("landmark_filter",         cfg.landmark_filter)
+    cfg.landmark_filter_min_cutoff = data.get("landmark_filter_min_cutoff", cfg.landmark_filter_min_cutoff)
+    cfg.landmark_filter_beta    = data.get("landmark_filter_beta",    cfg.landmark_filter_beta)
+    cfg.history_db              = data.get("history_db",              cfg.history_db)
+    cfg.shadow_configs          = data.get("shadow_configs",          cfg.shadow_configs)
+    cfg.shadow_queue_size       = data.get("shadow_queue_size",       cfg.shadow_queue_size)
+    cfg.shadow_log              = data.get("shadow_log",              cfg.shadow_log)
     cfg.max_num_hands           = data.get("max_num_hands",           cfg.max_num_hands)
     cfg.min_detection_confidence = data.get("min_detection_confidence", cfg.min_detection_confidence)
     cfg.min_tracking_confidence  = data.get("min_tracking_confidence",  cfg.min_tracking_confidence)
     return cfg
 
 
+def apply_overrides(config: KineMouseConfig, overrides: dict) -> KineMouseConfig:
+    """A copy of config with the given JSON-style keys replaced."""
+    data = _config_to_dict(config)
+    unknown = set(overrides) - set(data)
+    if unknown:
+        raise ValueError(f"Unknown config keys: {', '.join(sorted(unknown))}")
+    data.update(overrides)
+    return _dict_to_config(data)
+
+
 def load_config(path: Optional[Path] = None) -> KineMouseConfig:
     """Load config from JSON file. Returns defaults if file doesn't exist."""
     p = path or _DEFAULT_CONFIG_PATH
@@ -76,3 +197,31 @@ def save_config(config: KineMouseConfig, path: Optional[Path] = None):
     p.parent.mkdir(parents=True, exist_ok=True)
     with open(p, "w") as f:
         json.dump(_config_to_dict(config), f, indent=2)
+
+
+def _profile_path(name: str, directory: Optional[Path]) -> Path:
+    if not name or any(c in name for c in "/\\") or name.startswith("."):
+        raise ValueError(f"invalid profile name {name!r}")
+    return (directory or _PROFILE_DIR) / f"{name}.json"
+
+
+def load_profile(name: str, directory: Optional[Path] = None) -> dict:
+    """Learned per-user state of a profile; {} if none saved (or unreadable)."""
+    p = _profile_path(name, directory)
+    if p.exists():
+        try:
+            with open(p) as f:
+                return json.load(f)
+        except Exception:
+            pass
+    return {}
+
+
+def save_profile(name: str, data: dict, directory: Optional[Path] = None):
+    """Persist a profile's learned state (written atomically)."""
+    p = _profile_path(name, directory)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, p)
@@ -26,6 +26,8 @@ PINKY_PIP       = 18
 PINKY_DIP       = 19
 PINKY_TIP       = 20
 
+NUM_LANDMARKS   = 21
+
 # --- Gesture defaults ---
 DEFAULT_PINCH_THRESHOLD      = 0.15   # 15% of D_ref
 DEFAULT_DOUBLE_PINCH_WINDOW  = 400    # ms
@@ -25,8 +25,8 @@ _WATCH_INTERVAL = 2.0  # seconds
 class GestureConfigLoader:
     """
     Watches ~/.kinemouse/config.json and hot-reloads tuneable parameters
-    (ema_alpha, pinch_threshold, double_pinch_window_ms, active_box)
-    into the live KineMouseConfig object without restarting the app.
+    (ema_alpha, smoothing, one_euro_*, pinch_threshold, double_pinch_window_ms,
+    active_box) into the live KineMouseConfig object without restarting the app.
     """
 
     def __init__(self, config: KineMouseConfig):
@@ -0,0 +1,102 @@
+"""
+PeriodicTimer — drift-free periodic wakeups for dispatch-side loops that must
+run faster than the camera (smooth scrolling, cursor interpolation).
+
+On Linux the timer is a kernel timerfd (CLOCK_MONOTONIC) driven through
+ctypes: wakeups are scheduled on absolute deadlines by the kernel and a late
+reader learns how many ticks it missed. Elsewhere it falls back to sleeping
+until the next absolute deadline, which also never accumulates drift.
+
+Usage:
+    timer = PeriodicTimer(1 / 120)
+    while running:
+        ticks = timer.wait()      # ≥ 1; > 1 if the loop fell behind
+        step(ticks * timer.period)
+    timer.close()
+"""
+
+import ctypes
+import os
+import struct
+import sys
+import time
+from typing import Optional
+
+from kinemouse.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+_CLOCK_MONOTONIC = 1
+_TFD_CLOEXEC = 0o2000000
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def _timespec(seconds: float) -> _Timespec:
+    sec = int(seconds)
+    return _Timespec(sec, int(round((seconds - sec) * 1e9)))
+
+
+def _open_timerfd(period: float) -> Optional[int]:
+    """A periodic timerfd, or None when unavailable (non-Linux, old libc, sandbox)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.timerfd_create(_CLOCK_MONOTONIC, _TFD_CLOEXEC)
+        if fd < 0:
+            return None
+        spec = _Itimerspec(_timespec(period), _timespec(period))
+        if libc.timerfd_settime(fd, 0, ctypes.byref(spec), None) != 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError) as e:
+        log.debug("timerfd unavailable: %s", e)
+        return None
+
+
+class PeriodicTimer:
+    """Blocks in wait() until the next period boundary; reports missed ticks."""
+
+    def __init__(self, period: float, use_timerfd: bool = True):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+        self._fd = _open_timerfd(period) if use_timerfd else None
+        self._deadline = time.monotonic() + period
+
+    @property
+    def kernel_timer(self) -> bool:
+        """True when backed by a timerfd."""
+        return self._fd is not None
+
+    def wait(self) -> int:
+        """Sleep until the next tick; returns the number of elapsed periods (≥ 1)."""
+        if self._fd is not None:
+            return struct.unpack("=Q", os.read(self._fd, 8))[0]
+
+        delay = self._deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        now = time.monotonic()
+        ticks = 1 + max(0, int((now - self._deadline) / self.period))
+        self._deadline += ticks * self.period
+        return ticks
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "PeriodicTimer":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
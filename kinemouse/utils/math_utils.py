@@ -5,12 +5,14 @@ Provides:
 - Distance calculations between hand landmarks
 - Dynamic reference distance (D_ref) normalization
 - Exponential Moving Average (EMA) smoothing
+- One Euro speed-adaptive smoothing (low jitter at rest, low lag on sweeps)
 - Screen coordinate mapping
+- Whole-session (array) variants of the above for batch evaluation
 """
 
 import math
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 
 def euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
@@ -55,6 +57,61 @@ def ema_smooth(current: Tuple[float, float], previous: Tuple[float, float], alph
     return (sx, sy)
 
 
+def _one_euro_alpha(dt: float, cutoff: float) -> float:
+    """Smoothing factor of a first-order low-pass with the given cutoff (Hz)."""
+    r = 2 * math.pi * cutoff * dt
+    return r / (r + 1)
+
+
+class OneEuroFilter:
+    """
+    One Euro filter (Casiez et al., CHI 2012) for a 2D point.
+
+    A low-pass whose cutoff rises with speed: cutoff = min_cutoff + beta * |v|.
+    At rest it smooths heavily (min_cutoff, Hz); on fast sweeps the cutoff
+    opens up and lag drops. |v| is the low-passed speed in normalized
+    units per second, filtered at d_cutoff Hz.
+
+    Parameters are plain attributes so they can be changed between calls
+    (e.g. by config hot-reload) without losing the filter state.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 10.0, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self._prev: Optional[Tuple[float, float]] = None
+        self._prev_t = 0.0
+        self._dx = 0.0
+        self._dy = 0.0
+
+    def __call__(self, point: Tuple[float, float], t: float) -> Tuple[float, float]:
+        """Filter one sample taken at time t (seconds); returns the smoothed point."""
+        if self._prev is None:
+            self._prev = (point[0], point[1])
+            self._prev_t = t
+            return self._prev
+
+        dt = t - self._prev_t
+        if dt <= 0:
+            return self._prev
+        px, py = self._prev
+
+        # Low-passed velocity drives the adaptive cutoff
+        a_d = _one_euro_alpha(dt, self.d_cutoff)
+        self._dx = a_d * (point[0] - px) / dt + (1 - a_d) * self._dx
+        self._dy = a_d * (point[1] - py) / dt + (1 - a_d) * self._dy
+        speed = math.sqrt(self._dx * self._dx + self._dy * self._dy)
+
+        a = _one_euro_alpha(dt, self.min_cutoff + self.beta * speed)
+        self._prev = (a * point[0] + (1 - a) * px, a * point[1] + (1 - a) * py)
+        self._prev_t = t
+        return self._prev
+
+
 def map_to_screen(
     point: Tuple[float, float],
     active_box: Tuple[float, float, float, float],
@@ -73,3 +130,37 @@ def map_to_screen(
     sx = int(((nx - x_min) / (x_max - x_min)) * screen_res[0])
     sy = int(((ny - y_min) / (y_max - y_min)) * screen_res[1])
     return (sx, sy)
+
+
+def ema_smooth_series(points: np.ndarray, alpha: float, restart: np.ndarray) -> np.ndarray:
+    """
+    EMA over a whole (N, 2) trajectory, restarting wherever restart[i] is True.
+    The recurrence is inherently sequential, so it runs as a tight scalar loop
+    with exactly the same arithmetic as ema_smooth (bit-identical results).
+    """
+    beta = 1 - alpha
+    out = []
+    sx = sy = 0.0
+    for (x, y), r in zip(points.tolist(), restart.tolist()):
+        if r:
+            sx, sy = x, y
+        else:
+            sx = alpha * x + beta * sx
+            sy = alpha * y + beta * sy
+        out.append((sx, sy))
+    return np.array(out, dtype=np.float64).reshape(-1, 2)
+
+
+def map_to_screen_array(
+    points: np.ndarray,
+    active_box: Tuple[float, float, float, float],
+    screen_res: Tuple[int, int]
+) -> np.ndarray:
+    """Vectorized map_to_screen for an (N, 2) array; returns (N, 2) int pixels."""
+    x_min, y_min, x_max, y_max = active_box
+    nx = np.clip(points[:, 0], x_min, x_max)
+    ny = np.clip(points[:, 1], y_min, y_max)
+    out = np.empty((len(points), 2), dtype=np.int64)
+    out[:, 0] = ((nx - x_min) / (x_max - x_min)) * screen_res[0]
+    out[:, 1] = ((ny - y_min) / (y_max - y_min)) * screen_res[1]
+    return out
@@ -0,0 +1,261 @@
+"""
+Gesture-quality analytics for recorded sessions and event histories.
+
+Replays a session through BatchGestureEvaluator with the config under test
+and measures, with whole-array NumPy operations:
+
+- hover jitter: RMS frame-to-frame cursor step (px) while pinching and the
+  hand is still
+- sweep lag: median delay (ms) of the cursor behind the intended hand
+  position while sweeping (absolute pointer mode only)
+- accidental clicks: clicks whose pinch was shorter than min_click_pinch_ms
+  or moved the cursor more than click_travel_px
+- broken drags: drags cut short by tracking loss, or released and grabbed
+  again at the same spot within drag_rejoin_ms
+
+Event histories (GestureHistory / SQLiteHistoryStore rows) have no
+landmarks; they get the event-based metrics only (counts, drags).
+
+Reports are plain dataclasses; to_dict() is JSON-ready, and aggregate()
+combines many reports weighted by their sample counts.
+
+Usage:
+    report = analyze_session(load_session("session.json"), config)
+    report.to_dict()      # {"hover_jitter_px": 0.8, "accidental_clicks": 1, ...}
+    aggregate([report, ...])
+"""
+
+from dataclasses import dataclass, asdict, field
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from kinemouse.state.batch_fsm import BatchGestureEvaluator, BatchResult
+from kinemouse.state.events import EventType
+from kinemouse.state.hand_features import batch_distances
+from kinemouse.state.pinch_debouncer import debounce_series
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import map_to_screen_array
+from kinemouse.utils.session_io import RecordedSession
+from kinemouse.utils import signal_metrics as sm
+
+_CLICK = EventType.CLICK.value
+_DOWN = EventType.MOUSE_DOWN.value
+_UP = EventType.MOUSE_UP.value
+
+
+@dataclass
+class AnalysisThresholds:
+    still_speed: float = 0.03          # normalized units/s — below this the hand counts as still
+    sweep_speed: float = 0.3           # normalized units/s — above this the hand counts as sweeping
+    min_click_pinch_ms: float = 80.0   # shorter pinches that click are accidental
+    click_travel_px: float = 25.0      # cursor travel during a clicking pinch that makes it accidental
+    drag_rejoin_ms: float = 400.0      # release + re-grab within this time …
+    drag_rejoin_px: float = 60.0       # … and distance counts as one broken drag
+
+
+@dataclass
+class SessionReport:
+    """Quality metrics of one session (None where a metric does not apply)."""
+    name: str
+    frames: int = 0
+    duration_s: float = 0.0
+    tracked_ratio: Optional[float] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+    hover_jitter_px: Optional[float] = None
+    jitter_samples: int = 0
+    sweep_lag_ms: Optional[float] = None
+    lag_samples: int = 0
+    clicks: int = 0
+    accidental_clicks: Optional[int] = None
+    drags: int = 0
+    broken_drags: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def analyze_session(
+    session: RecordedSession,
+    config: KineMouseConfig,
+    thresholds: Optional[AnalysisThresholds] = None,
+    result: Optional[BatchResult] = None,
+) -> SessionReport:
+    """Replay one recorded session with config and measure its gesture quality."""
+    th = thresholds or AnalysisThresholds()
+    if result is None:
+        result = BatchGestureEvaluator(config).evaluate_session(session)
+    n = len(session)
+    t = np.asarray(session.timestamps, dtype=np.float64)
+    found = np.asarray(session.found, dtype=bool)
+    types = result.event_types.astype(np.int64)
+    report = SessionReport(
+        name=session.name,
+        frames=n,
+        duration_s=float(t[-1] - t[0]) if n > 1 else 0.0,
+        tracked_ratio=float(found.mean()) if n else None,
+        counts=_counts(types),
+    )
+    if n == 0:
+        return report
+
+    # Cursor track: last emitted position, held while the FSM suppresses repeats
+    pos = result.positions.astype(np.float64)
+    has_pos = pos[:, 0] >= 0
+    last = np.maximum.accumulate(np.where(has_pos, np.arange(n), -1))
+    cursor_known = last >= 0
+    cursor = pos[np.maximum(last, 0)]
+
+    # Pinch masks and the intended hand position (zero-lag, offline only)
+    pts = np.where(found[:, None, None], session.landmarks, 0.0)
+    dist = batch_distances(pts, config)
+    usable = found & (dist[:, 4] != 0)
+    pinch = usable & debounce_series(
+        dist[:, :1], dist[:, 4], config.pinch_threshold, config.pinch_release_threshold,
+        config.pinch_dwell_frames, restart=sm.segment_restarts(found), hold=~usable,
+    )[:, 0]
+    idx = np.flatnonzero(found)
+    restart = sm.segment_restarts(found)[idx]
+    raw = (pts[idx, config.THUMB_TIP, :2] + pts[idx, config.INDEX_TIP, :2]) / 2.0
+    intent = sm.intent_trajectory(raw, restart)
+    speed = np.full(n, np.nan)
+    speed[idx] = sm.speed(intent, t[idx], restart)
+    first = np.zeros(n, dtype=bool)
+    first[idx] = restart
+
+    # Hover jitter: cursor steps between consecutive still, pinching frames
+    step = np.hypot(*np.diff(cursor, axis=0, prepend=cursor[:1]).T)
+    still = pinch & np.concatenate(([False], pinch[:-1])) & ~first & cursor_known & (speed < th.still_speed)
+    if still.any():
+        report.jitter_samples = int(still.sum())
+        report.hover_jitter_px = float(np.sqrt(np.mean(step[still] ** 2)))
+
+    # Sweep lag: distance behind the intent over its speed (absolute mapping only)
+    if config.pointer_mode == "absolute" and not config.pointer_accel:
+        box = config.active_box
+        px_per_unit = session.screen_res[0] / (box[2] - box[0])
+        target = np.full((n, 2), np.nan)
+        target[idx] = map_to_screen_array(intent, box, session.screen_res)
+        inside = np.zeros(n, dtype=bool)   # the cursor is pinned while the hand is outside the box
+        inside[idx] = ((intent[:, 0] > box[0]) & (intent[:, 0] < box[2])
+                       & (intent[:, 1] > box[1]) & (intent[:, 1] < box[3]))
+        sweeping = pinch & inside & cursor_known & (speed > th.sweep_speed)
+        if sweeping.any():
+            gap = np.hypot(*(cursor[sweeping] - target[sweeping]).T)
+            report.lag_samples = int(sweeping.sum())
+            report.sweep_lag_ms = float(np.median(gap / (speed[sweeping] * px_per_unit)) * 1000.0)
+
+    report.clicks = int((types == _CLICK).sum())
+    report.accidental_clicks = _accidental_clicks(types, pinch, cursor, t, th)
+    report.drags, report.broken_drags = _drags(types, found, pos, t, th)
+    return report
+
+
+def _counts(types: np.ndarray) -> Dict[str, int]:
+    bins = np.bincount(types[types >= 0], minlength=max(e.value for e in EventType) + 1)
+    return {e.name: int(bins[e.value]) for e in EventType if e != EventType.IDLE and bins[e.value]}
+
+
+def _accidental_clicks(types, pinch, cursor, t, th: AnalysisThresholds) -> int:
+    """Clicks whose preceding pinch was too short or wandered too far."""
+    clicks = np.flatnonzero(types == _CLICK)
+    prev = np.concatenate(([False], pinch[:-1]))
+    nxt = np.concatenate((pinch[1:], [False]))
+    starts = np.flatnonzero(pinch & ~prev)
+    ends = np.flatnonzero(pinch & ~nxt)
+    if len(clicks) == 0 or len(starts) == 0:
+        return 0
+    run = np.searchsorted(starts, clicks, side="right") - 1
+    has_run = run >= 0
+    run = run[has_run]
+
+    # Pinch length: start to the first released frame
+    release = np.minimum(ends + 1, len(t) - 1)
+    duration_ms = (t[release] - t[starts]) * 1000.0
+    # Cursor travel: farthest point from where the pinch began
+    run_of_frame = np.cumsum(pinch & ~prev) - 1
+    origin = cursor[starts[np.maximum(run_of_frame, 0)]]
+    away = np.where(pinch, np.hypot(*(cursor - origin).T), 0.0)
+    travel = np.maximum.reduceat(away, starts)
+
+    accidental = (duration_ms[run] < th.min_click_pinch_ms) | (travel[run] > th.click_travel_px)
+    return int(accidental.sum())
+
+
+def _drags(types, found, pos, t, th: AnalysisThresholds):
+    """(drags, broken drags): lost tracking mid-drag, or released and re-grabbed on the spot."""
+    n = len(types)
+    downs = np.flatnonzero(types == _DOWN)
+    ups = np.flatnonzero(types == _UP)
+    if len(downs) == 0:
+        return 0, 0
+
+    broken = 0
+    if found is not None:
+        lost = np.flatnonzero(~found)
+        up_after = np.append(ups, n)[np.searchsorted(ups, downs)]
+        lost_after = np.append(lost, n)[np.searchsorted(lost, downs)]
+        broken += int((lost_after < up_after).sum())
+
+    if len(ups):
+        k = np.searchsorted(downs, ups, side="right")
+        again = k < len(downs)
+        u, d = ups[again], downs[k[again]]
+        gap_ms = (t[d] - t[u]) * 1000.0
+        dist = np.hypot(*(pos[d] - pos[u]).T)
+        broken += int(((gap_ms < th.drag_rejoin_ms) & (dist < th.drag_rejoin_px)).sum())
+    return len(downs), broken
+
+
+def analyze_history(
+    records: np.ndarray,
+    name: str = "",
+    thresholds: Optional[AnalysisThresholds] = None,
+) -> SessionReport:
+    """Event-based metrics of GestureHistory / SQLiteHistoryStore rows (no landmarks)."""
+    th = thresholds or AnalysisThresholds()
+    t = np.asarray(records["timestamp"], dtype=np.float64)
+    types = np.asarray(records["event_type"], dtype=np.int64)
+    pos = np.stack([records["x"], records["y"]], axis=1).astype(np.float64)
+    drags, broken = _drags(types, None, pos, t, th)
+    return SessionReport(
+        name=name,
+        duration_s=float(t[-1] - t[0]) if len(t) > 1 else 0.0,
+        counts=_counts(types),
+        clicks=int((types == _CLICK).sum()),
+        drags=drags,
+        broken_drags=broken,
+    )
+
+
+def aggregate(reports: Iterable[SessionReport]) -> dict:
+    """Corpus totals; jitter and lag averaged over all their samples, rates over all events."""
+    reports = list(reports)
+    counts: Dict[str, int] = {}
+    for r in reports:
+        for k, v in r.counts.items():
+            counts[k] = counts.get(k, 0) + v
+
+    def weighted(value: str, weight: str) -> Optional[float]:
+        pairs = [(getattr(r, value), getattr(r, weight)) for r in reports if getattr(r, value) is not None]
+        total = sum(w for _, w in pairs)
+        return sum(v * w for v, w in pairs) / total if total else None
+
+    jitter_sq = [(r.hover_jitter_px ** 2, r.jitter_samples) for r in reports if r.hover_jitter_px is not None]
+    jitter_n = sum(w for _, w in jitter_sq)
+    judged = [r for r in reports if r.accidental_clicks is not None]
+    judged_clicks = sum(r.clicks for r in judged)
+    drags = sum(r.drags for r in reports)
+    return {
+        "sessions": len(reports),
+        "frames": sum(r.frames for r in reports),
+        "duration_s": sum(r.duration_s for r in reports),
+        "counts": counts,
+        "hover_jitter_px": float(np.sqrt(sum(v * w for v, w in jitter_sq) / jitter_n)) if jitter_n else None,
+        "sweep_lag_ms": weighted("sweep_lag_ms", "lag_samples"),
+        "clicks": sum(r.clicks for r in reports),
+        "accidental_click_rate": (sum(r.accidental_clicks for r in judged) / judged_clicks
+                                  if judged_clicks else None),
+        "drags": drags,
+        "broken_drag_rate": sum(r.broken_drags for r in reports) / drags if drags else None,
+    }
@@ -0,0 +1,93 @@
+"""
+Recorded session I/O — load sessions saved by examples/record_session.py
+into dense NumPy arrays for offline evaluation.
+
+JSON sessions are slow to parse; convert once to a compact .npz and reuse it:
+
+Usage:
+    from kinemouse.utils.session_io import load_session, save_session_npz
+
+    session = load_session("session.json")
+    session.landmarks.shape      # (N, 21, 3), NaN where no hand was found
+    save_session_npz(session, "session.npz")
+    session = load_session("session.npz")
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from kinemouse.utils.constants import NUM_LANDMARKS
+
+
+@dataclass
+class RecordedSession:
+    """A whole recorded session as arrays (one row per captured frame)."""
+    timestamps: np.ndarray            # (N,) seconds since recording start
+    landmarks: np.ndarray             # (N, 21, 3) normalized x, y, z
+    found: np.ndarray                 # (N,) bool — hand detected in frame
+    screen_res: Tuple[int, int] = (1920, 1080)
+    name: str = ""
+    labels: Optional[np.ndarray] = None   # (N,) str — ground-truth pose per frame, "" = unlabeled
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+def _from_json(path: Path) -> RecordedSession:
+    return session_from_json(json.loads(path.read_text()), path.stem)
+
+
+def session_from_json(data: dict, name: str = "") -> RecordedSession:
+    """Build a session from already-parsed record_session.py JSON."""
+    frames = data["frames"]
+    n = len(frames)
+    timestamps = np.empty(n)
+    landmarks = np.full((n, NUM_LANDMARKS, 3), np.nan)
+    found = np.zeros(n, dtype=bool)
+    labels = [frame.get("label") or "" for frame in frames]
+    for i, frame in enumerate(frames):
+        timestamps[i] = frame["t"]
+        lm = frame.get("landmarks") or []
+        if frame.get("found") and len(lm) == NUM_LANDMARKS:
+            found[i] = True
+            landmarks[i] = [(p["x"], p["y"], p["z"]) for p in lm]
+    screen_res = tuple(data.get("config", {}).get("screen_res", [1920, 1080]))
+    return RecordedSession(timestamps, landmarks, found, screen_res, name,
+                           np.array(labels) if any(labels) else None)
+
+
+def _from_npz(path: Path) -> RecordedSession:
+    with np.load(path) as data:
+        return RecordedSession(
+            timestamps=data["timestamps"],
+            landmarks=data["landmarks"],
+            found=data["found"],
+            screen_res=tuple(int(v) for v in data["screen_res"]),
+            name=path.stem,
+            labels=data["labels"] if "labels" in data.files else None,
+        )
+
+
+def load_session(path: Union[str, Path]) -> RecordedSession:
+    """Load a recorded session from .json (record_session.py) or .npz."""
+    p = Path(path)
+    if p.suffix == ".npz":
+        return _from_npz(p)
+    return _from_json(p)
+
+
+def save_session_npz(session: RecordedSession, path: Union[str, Path]):
+    """Save a session as compressed .npz for fast repeated loading."""
+    arrays = dict(
+        timestamps=session.timestamps,
+        landmarks=session.landmarks,
+        found=session.found,
+        screen_res=np.asarray(session.screen_res),
+    )
+    if session.labels is not None:
+        arrays["labels"] = np.asarray(session.labels, dtype=str)
+    np.savez_compressed(path, **arrays)
@@ -0,0 +1,140 @@
+"""
+Signal quality metrics for cursor filters, computed on recorded sessions.
+
+All functions take whole trajectories as NumPy arrays:
+    points      (N, 2) normalized positions
+    timestamps  (N,)   seconds
+    restart     (N,)   bool — True where a new tracking segment starts
+
+Provides:
+- Segment restart flags from a hand-found mask
+- Running any streaming 2D filter over a trajectory
+- "Intent" trajectory (zero-lag, centered moving average of the raw signal)
+- Stillness jitter, tracking lag and overshoot of a filtered trajectory
+- Time-shifting a trajectory (compare output against where the hand will be)
+"""
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+def segment_restarts(found: np.ndarray) -> np.ndarray:
+    """True on every found frame that follows a lost (or no) frame."""
+    found = np.asarray(found, dtype=bool)
+    return found & ~np.concatenate(([False], found[:-1]))
+
+
+def run_filter(
+    points: np.ndarray,
+    timestamps: np.ndarray,
+    restart: np.ndarray,
+    make_filter: Callable[[], Callable[[Tuple[float, float], float], Tuple[float, float]]],
+) -> np.ndarray:
+    """
+    Run a streaming filter over a trajectory, building a fresh filter at each
+    segment restart. make_filter() returns a callable f(point, t) -> point.
+    """
+    out = []
+    f = None
+    for (x, y), t, r in zip(points.tolist(), timestamps.tolist(), restart.tolist()):
+        if r or f is None:
+            f = make_filter()
+        out.append(f((x, y), t))
+    return np.array(out, dtype=np.float64).reshape(-1, 2)
+
+
+def intent_trajectory(points: np.ndarray, restart: np.ndarray, window: int = 9) -> np.ndarray:
+    """
+    Centered moving average of the raw trajectory within each segment:
+    an estimate of where the hand really was, with tremor/noise removed
+    and no lag (it looks ahead, so it is only usable offline).
+    """
+    out = np.empty_like(points, dtype=np.float64)
+    starts = np.flatnonzero(restart).tolist() + [len(points)]
+    if not starts or starts[0] != 0:
+        starts = [0] + starts
+    kernel = np.ones(window) / window
+    for a, b in zip(starts[:-1], starts[1:]):
+        seg = points[a:b]
+        if len(seg) < window:
+            out[a:b] = seg
+            continue
+        pad = window // 2
+        padded = np.pad(seg, ((pad, pad), (0, 0)), mode="edge")
+        for axis in range(2):
+            out[a:b, axis] = np.convolve(padded[:, axis], kernel, mode="valid")
+    return out
+
+
+def speed(points: np.ndarray, timestamps: np.ndarray, restart: np.ndarray) -> np.ndarray:
+    """Per-frame speed (units/s); 0 on segment starts."""
+    d = np.diff(points, axis=0, prepend=points[:1])
+    dt = np.diff(timestamps, prepend=timestamps[:1])
+    v = np.hypot(d[:, 0], d[:, 1]) / np.where(dt > 0, dt, np.inf)
+    v[restart] = 0.0
+    return v
+
+
+def stillness_jitter(filtered: np.ndarray, restart: np.ndarray, still: np.ndarray) -> float:
+    """RMS frame-to-frame displacement of the filtered output while the hand is still."""
+    d = np.diff(filtered, axis=0, prepend=filtered[:1])
+    mask = still & ~restart
+    if not mask.any():
+        return 0.0
+    step = np.hypot(d[mask, 0], d[mask, 1])
+    return float(np.sqrt(np.mean(step * step)))
+
+
+def tracking_lag_ms(
+    filtered: np.ndarray,
+    intent: np.ndarray,
+    intent_speed: np.ndarray,
+    moving: np.ndarray,
+) -> float:
+    """
+    Median time the filtered output trails the intended position while moving:
+    distance behind the intent divided by the intent speed.
+    """
+    if not moving.any():
+        return 0.0
+    gap = np.hypot(*(filtered[moving] - intent[moving]).T)
+    return float(np.median(gap / intent_speed[moving]) * 1000.0)
+
+
+def shift_trajectory(points: np.ndarray, timestamps: np.ndarray, offset_s: float) -> np.ndarray:
+    """Resample a trajectory at t + offset_s (linear interpolation, clamped at the ends)."""
+    t = np.asarray(timestamps, dtype=np.float64)
+    return np.stack([np.interp(t + offset_s, t, points[:, axis]) for axis in range(2)], axis=1)
+
+
+def overshoot(
+    filtered: np.ndarray,
+    intent: np.ndarray,
+    timestamps: np.ndarray,
+    restart: np.ndarray,
+    moving: np.ndarray,
+    settle_s: float = 0.3,
+) -> float:
+    """
+    Mean overshoot at stops: after each moving→not-moving transition, the
+    largest distance the output travels past the rest point (intent at the
+    end of the settle_s window) along the direction of the preceding motion.
+    """
+    stops = np.flatnonzero(~moving[1:] & moving[:-1] & ~restart[1:]) + 1
+    t = np.asarray(timestamps, dtype=np.float64)
+    seg_id = np.cumsum(restart)
+    values = []
+    for i in stops.tolist():
+        direction = intent[i] - intent[max(i - 3, 0)]
+        norm = np.hypot(*direction)
+        if norm == 0:
+            continue
+        direction /= norm
+        end = int(np.searchsorted(t, t[i] + settle_s, side="right"))
+        idx = np.arange(i, end)
+        idx = idx[seg_id[idx] == seg_id[i]]
+        rest = intent[idx[-1]]
+        past = (filtered[idx] - rest) @ direction
+        values.append(max(float(past.max()), 0.0))
+    return float(np.mean(values)) if values else 0.0
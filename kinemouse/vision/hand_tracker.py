@@ -7,6 +7,8 @@ Responsibilities:
 - Expose a clean per-frame result object to Layer 2
 """
 
+import time
+
 import cv2
 import mediapipe as mp
 import numpy as np
@@ -16,13 +18,17 @@ from typing import Optional, List, Tuple
 from kinemouse.utils.config import KineMouseConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HandFrame:
     """Result of processing one camera frame."""
     landmarks: Optional[List] = None   # MediaPipe NormalizedLandmarkList
     raw_frame: Optional[np.ndarray] = None
     annotated_frame: Optional[np.ndarray] = None
     found: bool = False
+    timestamp: Optional[float] = None  # time.monotonic() right after capture
+
+
+_NO_FRAME = HandFrame()   # shared result for "camera closed / read failed"
 
 
 class HandTracker:
@@ -63,11 +69,12 @@ class HandTracker:
         Returns a HandFrame with landmarks if a hand is detected.
         """
         if not self._cap or not self._cap.isOpened():
-            return HandFrame()
+            return _NO_FRAME
 
         ret, frame = self._cap.read()
         if not ret:
-            return HandFrame()
+            return _NO_FRAME
+        timestamp = time.monotonic()
 
         if self.config.flip_horizontal:
             frame = cv2.flip(frame, 1)
@@ -97,6 +104,7 @@ class HandTracker:
             raw_frame=frame,
             annotated_frame=annotated,
             found=found,
+            timestamp=timestamp,
         )
 
     def __enter__(self):
@@ -0,0 +1,82 @@
+"""
+LandmarkFilterBank — One Euro filtering of all 21 hand landmarks at once.
+
+GestureFSM only smooths the pinch midpoint, so pinch detection and pose
+classification otherwise see raw, noisy fingertips and flicker near their
+thresholds. This stage filters all 63 coordinates (21 landmarks × x, y, z)
+before any feature extraction, as a handful of in-place NumPy operations on
+preallocated buffers — not 63 Python filter objects.
+
+Each coordinate is an independent One Euro filter: its cutoff rises with
+that coordinate's own speed, so still fingers are smoothed hard while a
+moving fingertip keeps up.
+
+Usage:
+    bank = LandmarkFilterBank(min_cutoff=1.5, beta=5.0)
+    filtered = bank(landmarks_to_array(landmarks), timestamp)   # (21, 3)
+"""
+
+import math
+
+import numpy as np
+
+from kinemouse.utils.constants import NUM_LANDMARKS
+
+_TWO_PI = 2 * math.pi
+
+
+class LandmarkFilterBank:
+    """Vectorized per-coordinate One Euro filter over a (21, 3) landmark array."""
+
+    def __init__(self, min_cutoff: float = 1.5, beta: float = 5.0, d_cutoff: float = 1.0,
+                 shape=(NUM_LANDMARKS, 3)):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._x = np.zeros(shape)      # filtered positions
+        self._dx = np.zeros(shape)     # filtered velocities
+        self._tmp = np.zeros(shape)
+        self._rate = np.zeros(shape)
+        self._t = 0.0
+        self._primed = False
+
+    def reset(self):
+        """Forget the filter state (e.g. hand lost); next frame passes through."""
+        self._primed = False
+
+    def __call__(self, points: np.ndarray, t: float) -> np.ndarray:
+        """Filter one frame of landmarks captured at time t; returns a new (21, 3) array."""
+        x, dx, tmp, rate = self._x, self._dx, self._tmp, self._rate
+        if not self._primed:
+            np.copyto(x, points)
+            dx.fill(0.0)
+            self._t = t
+            self._primed = True
+            return x.copy()
+
+        dt = t - self._t
+        if dt <= 0:
+            return x.copy()
+        self._t = t
+
+        # Velocity estimate, low-passed at d_cutoff: dx += a_d * ((p - x) / dt - dx)
+        r_d = _TWO_PI * self.d_cutoff * dt
+        a_d = r_d / (r_d + 1)
+        np.subtract(points, x, out=tmp)
+        tmp *= 1.0 / dt
+        tmp -= dx
+        tmp *= a_d
+        dx += tmp
+
+        # Per-coordinate cutoff → alpha = r / (r + 1), r = 2π·(min_cutoff + beta·|dx|)·dt
+        np.abs(dx, out=rate)
+        rate *= _TWO_PI * self.beta * dt
+        rate += _TWO_PI * self.min_cutoff * dt
+        np.add(rate, 1.0, out=tmp)
+        rate /= tmp
+
+        # x += alpha * (p - x)
+        np.subtract(points, x, out=tmp)
+        tmp *= rate
+        x += tmp
+        return x.copy()
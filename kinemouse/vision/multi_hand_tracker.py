@@ -7,6 +7,8 @@ Left hand  → secondary actions (scroll, modifier gestures)
 Each hand is identified by MediaPipe's handedness label.
 """
 
+import time
+
 import cv2
 import mediapipe as mp
 import numpy as np
@@ -16,7 +18,7 @@ from typing import Optional, List, Dict
 from kinemouse.utils.config import KineMouseConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiHandFrame:
     """Result of processing one camera frame with up to 2 hands."""
     right_landmarks: Optional[List] = None
@@ -25,6 +27,7 @@ class MultiHandFrame:
     raw_frame:       Optional[np.ndarray] = None
     right_found:     bool = False
     left_found:      bool = False
+    timestamp:       Optional[float] = None  # time.monotonic() right after capture
 
     @property
     def any_found(self) -> bool:
@@ -69,6 +72,7 @@ class MultiHandTracker:
         ret, frame = self._cap.read()
         if not ret:
             return MultiHandFrame()
+        timestamp = time.monotonic()
 
         if self.config.flip_horizontal:
             frame = cv2.flip(frame, 1)
@@ -79,7 +83,7 @@ class MultiHandTracker:
         rgb.flags.writeable = True
 
         annotated = frame.copy()
-        result = MultiHandFrame(raw_frame=frame, annotated_frame=annotated)
+        result = MultiHandFrame(raw_frame=frame, annotated_frame=annotated, timestamp=timestamp)
 
         if results.multi_hand_landmarks and results.multi_handedness:
             for hand_lm, handedness in zip(
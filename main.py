@@ -4,21 +4,30 @@ KineMouse — main entry point.
 Orchestrates all 3 layers:
     Layer 1 (HandTracker) → Layer 2 (GestureFSM) → Layer 3 (OS Backend)
 
-Runs at 30 FPS. OS dispatch runs on a separate async thread.
+Runs at 30 FPS. OS dispatch runs on a separate thread (CoalescingDispatcher):
+MOVEs are coalesced to the latest position, button and scroll events are
+never dropped.
 """
 
 import sys
-import threading
-import queue
 import time
 
 import cv2
 
 from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_profile, save_profile
 from kinemouse.vision.hand_tracker import HandTracker
 from kinemouse.backends import get_backend
+from kinemouse.backends.dispatcher import CoalescingDispatcher
+from kinemouse.backends.cursor_interpolator import CursorInterpolator
 from kinemouse.state.gesture_fsm import GestureFSM
-from kinemouse.state.events import EventType
+from kinemouse.state.motion_gestures import MotionGestureRecognizer
+from kinemouse.state.scroll_gesture import ScrollGesture, ScrollDirection
+from kinemouse.backends.smooth_scroll import SmoothScroller
+from kinemouse.state.gesture_history import GestureHistory
+from kinemouse.state.history_store import SQLiteHistoryStore
+from kinemouse.state.shadow_eval import ShadowEvaluator
+from kinemouse.state.events import EventType, motion_gesture_event, scroll_event
 
 
 def run(config: KineMouseConfig = None, show_preview: bool = True):
@@ -31,26 +40,41 @@ def run(config: KineMouseConfig = None, show_preview: bool = True):
     screen_res = backend.get_screen_resolution()
     print(f"[KineMouse] Screen resolution: {screen_res[0]}x{screen_res[1]}")
 
-    # --- Event queue for async OS dispatch ---
-    event_queue: queue.Queue = queue.Queue(maxsize=4)
-
-    def dispatcher_thread():
-        """Consume events from queue and dispatch to OS backend."""
-        while True:
-            event = event_queue.get()
-            if event is None:
-                break  # Shutdown signal
-            try:
-                backend.dispatch(event)
-            except Exception as e:
-                print(f"[Dispatcher] Error: {e}", file=sys.stderr)
-            event_queue.task_done()
-
-    dispatcher = threading.Thread(target=dispatcher_thread, daemon=True)
+    # --- Async OS dispatch: latest MOVE wins, button/scroll events are never dropped ---
+    dispatcher = CoalescingDispatcher(backend)
     dispatcher.start()
 
+    # Optional display-rate cursor: MOVEs are interpolated between camera frames
+    interpolator = None
+    sink = dispatcher
+    if config.cursor_interpolation:
+        interpolator = CursorInterpolator(dispatcher, config)
+        interpolator.start()
+        sink = interpolator
+
+    # High-rate scroll runs on its own timer, not the camera loop; its events share the dispatcher
+    smooth_scroller = SmoothScroller(sink, config)
+    smooth_scroller.start()
+
+    # Optional long-term event log (batched to SQLite off the camera loop)
+    history = GestureHistory(store=SQLiteHistoryStore(config.history_db)) if config.history_db else None
+
     # --- Layer 2: State Machine ---
     fsm = GestureFSM(config, screen_res)
+    profile_state = load_profile(config.profile)
+    fsm.double_pinch.load_state(profile_state.get("double_pinch"))
+    fsm.tremor.load_state(profile_state.get("tremor"))
+    # Optional shadow FSMs: candidate configs on the same frames, logged, never dispatched
+    shadows = None
+    if config.shadow_configs:
+        shadows = ShadowEvaluator(config, screen_res, config.shadow_configs,
+                                  queue_size=config.shadow_queue_size, log_path=config.shadow_log)
+        shadows.start()
+    scroller = ScrollGesture(config)
+    motion = MotionGestureRecognizer(
+        threshold=config.motion_gesture_threshold,
+        cooldown_ms=config.motion_gesture_cooldown_ms,
+    )
 
     # --- Layer 1: Hand Tracker ---
     print("[KineMouse] Starting webcam capture... Press 'q' to quit.")
@@ -58,7 +82,14 @@ def run(config: KineMouseConfig = None, show_preview: bool = True):
 
     if not tracker.start():
         print("[KineMouse] ERROR: Could not open webcam.", file=sys.stderr)
-        event_queue.put(None)
+        smooth_scroller.stop()
+        if interpolator is not None:
+            interpolator.stop()
+        dispatcher.stop()
+        if history is not None:
+            history.store.close()
+        if shadows is not None:
+            shadows.stop()
         return
 
     frame_delay = 1.0 / config.capture_fps
@@ -71,14 +102,53 @@ def run(config: KineMouseConfig = None, show_preview: bool = True):
             hand_frame = tracker.next_frame()
 
             # Layer 2: translate landmarks → MouseEvent
-            event = fsm.process(hand_frame.landmarks if hand_frame.found else None)
+            features = None
+            if hand_frame.found:
+                features = fsm.features_for(hand_frame.landmarks, hand_frame.timestamp)
+            event = fsm.process(
+                hand_frame.landmarks if hand_frame.found else None,
+                features=features,
+                timestamp=hand_frame.timestamp,
+            )
 
             # Layer 3: async dispatch
             if event.type != EventType.IDLE:
-                try:
-                    event_queue.put_nowait(event)
-                except queue.Full:
-                    pass  # Drop frame — OS busy, keep real-time feel
+                if history is not None:
+                    history.record(event)
+                sink.submit(event)
+            if shadows is not None:
+                shadows.submit(hand_frame.landmarks if hand_frame.found else None, hand_frame.timestamp, event)
+
+            # Scrolling (ring + thumb pinch): velocity to the smooth scroller, or ticks
+            tick = scroller.process(
+                hand_frame.landmarks if features is not None else None,
+                features.dref if features is not None else 0,
+                features=features,
+                timestamp=hand_frame.timestamp,
+            )
+            if config.smooth_scroll:
+                if scroller.active:
+                    smooth_scroller.set_velocity(scroller.velocity)
+                else:
+                    smooth_scroller.release()
+            elif tick is not None:
+                sign = 1 if tick.direction == ScrollDirection.UP else -1
+                sink.submit(scroll_event(sign * tick.magnitude * 120))
+
+            # Motion gestures only while the hand is open (pinches are cursor control / scroll)
+            if (config.motion_gestures and features is not None
+                    and not features.pinch_index and not scroller.active):
+                gesture = motion.update(features.palm_center, hand_frame.timestamp)
+                if gesture:
+                    if history is not None:
+                        history.record(motion_gesture_event(gesture))
+                    sink.submit(motion_gesture_event(gesture))
+            elif config.motion_gestures:
+                motion.reset()
+
+            # Capture→dispatch latency feeds the cursor predictor (no timestamp on a dropped frame)
+            if hand_frame.found:
+                fsm.observe_latency(time.monotonic() - hand_frame.timestamp)
 
             # Optional preview window
             if show_preview and hand_frame.annotated_frame is not None:
@@ -105,7 +175,25 @@ def run(config: KineMouseConfig = None, show_preview: bool = True):
         print("\n[KineMouse] Interrupted by user.")
     finally:
         tracker.stop()
-        event_queue.put(None)
+        learned = {}
+        if config.adaptive_double_pinch:
+            learned["double_pinch"] = fsm.double_pinch.state()
+        if config.tremor_filter and config.tremor_adaptive:
+            learned["tremor"] = fsm.tremor.state()
+        if learned:
+            save_profile(config.profile, {**profile_state, **learned})
+        smooth_scroller.stop()         # its last scroll events still go through the dispatcher
+        if interpolator is not None:
+            interpolator.stop()
+        dispatcher.stop()
+        stats = dispatcher.stats()
+        print(f"[KineMouse] Dispatched {stats['dispatched']} events, "
+              f"coalesced {stats['coalesced']} stale moves, {stats['errors']} errors")
+        if history is not None:
+            history.store.close()
+        if shadows is not None:
+            shadows.stop()
+            shadows.print_summary()
         cv2.destroyAllWindows()
         print("[KineMouse] Stopped.")
 
@@ -11,6 +11,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/4shil/kinemouse",
     packages=find_packages(exclude=["tests*"]),
+    package_data={"kinemouse.state": ["gesture_maps/*.json"]},
     python_requires=">=3.10",
     install_requires=[
         "opencv-python>=4.8.0",
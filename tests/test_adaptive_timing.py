@@ -0,0 +1,123 @@
+"""Tests for the adaptive double-pinch window."""
+
+import numpy as np
+import pytest
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_profile, save_profile
+from kinemouse.state.adaptive_timing import DoublePinchLearner, P2Quantile, repinch_intervals
+from kinemouse.state.events import EventType
+from kinemouse.state.gesture_fsm import GestureFSM
+
+
+@pytest.mark.parametrize("q", [0.5, 0.9, 0.95])
+def test_p2_tracks_true_quantile(q):
+    rng = np.random.default_rng(0)
+    data = rng.gamma(4.0, 50.0, size=5000)
+    est = P2Quantile(q)
+    for x in data:
+        est.add(float(x))
+    assert est.value == pytest.approx(np.quantile(data, q), rel=0.03)
+
+
+def test_p2_state_round_trip():
+    a = P2Quantile(0.9)
+    for x in range(100):
+        a.add(float(x % 37))
+    b = P2Quantile(0.9)
+    b.load_state(a.state())
+    a.add(5.0)
+    b.add(5.0)
+    assert b.value == a.value
+
+
+def _feed(learner, gaps_ms, hold_ms=200, t=0.0):
+    """Pinch / release pairs with the given release → re-pinch gaps, at 100 fps."""
+    for gap in gaps_ms:
+        for _ in range(int(hold_ms / 10)):
+            learner.update(True, t)
+            t += 0.01
+        t_release = t
+        while (t - t_release) * 1000 < gap - 1e-9:
+            learner.update(False, t)
+            t += 0.01
+    return t
+
+
+def test_learner_adapts_to_fast_and_slow_users():
+    rng = np.random.default_rng(1)
+    fast, slow = DoublePinchLearner(), DoublePinchLearner()
+    _feed(fast, rng.normal(150, 20, 80).clip(60))
+    _feed(slow, rng.normal(420, 40, 80).clip(60, 590))
+    assert fast.window_ms(400) < 260
+    assert 460 < slow.window_ms(400) <= 600
+
+
+def test_learner_bounds_and_default():
+    learner = DoublePinchLearner(min_ms=200, max_ms=600, min_samples=5)
+    assert learner.window_ms(400) == 400                  # nothing learned yet
+    for _ in range(10):
+        learner.observe(50.0)
+    assert learner.window_ms(400) == 200
+    learner.observe(900.0)                                 # beyond max_ms: a separate gesture
+    assert learner.samples == 10
+
+
+def test_flicker_and_hand_loss_are_ignored():
+    learner = DoublePinchLearner()
+    _feed(learner, [150] * 5, hold_ms=30)                  # second pinch too short to count
+    assert learner.samples == 0
+    learner.update(True, 10.0)
+    learner.update(False, 10.1)
+    learner.reset()                                        # hand lost between the pinches
+    learner.update(True, 10.2)
+    learner.update(True, 10.5)
+    assert learner.samples == 0
+
+
+def test_repinch_intervals_from_session():
+    pinch = np.array([0, 1, 1, 0, 0, 1, 1, 0, 0, 0, 1], dtype=bool)
+    t = np.arange(len(pinch)) * 0.1
+    assert repinch_intervals(pinch, t).tolist() == pytest.approx([200.0, 300.0])
+    found = np.ones(len(pinch), dtype=bool)
+    found[8] = False
+    assert repinch_intervals(pinch, t, found).tolist() == pytest.approx([200.0])
+    # Second re-pinch lasts one frame (0 ms held), the first two frames (100 ms)
+    assert repinch_intervals(pinch, t, min_hold_ms=100.0).tolist() == pytest.approx([200.0])
+
+
+def test_fsm_uses_learned_window():
+    cfg = KineMouseConfig(adaptive_double_pinch=True)
+    fsm = GestureFSM(cfg, (1920, 1080))
+    for _ in range(40):
+        fsm.double_pinch.observe(120.0)
+    assert fsm.double_pinch.window_ms(cfg.double_pinch_window_ms) == 200
+
+    # pinch, release, wait 250 ms: the learned 200 ms window has expired → click
+    t, events = 0.0, []
+    for pinch, frames in ((True, 5), (False, 8), (True, 3)):
+        for _ in range(frames):
+            events.append(fsm._transition(pinch, False, (100, 100), t).type)
+            t += 1 / 30
+    assert EventType.CLICK in events and EventType.MOUSE_DOWN not in events
+
+    cfg.adaptive_double_pinch = False                     # fixed 400 ms window → drag
+    fsm = GestureFSM(cfg, (1920, 1080))
+    t, events = 0.0, []
+    for pinch, frames in ((True, 5), (False, 8), (True, 3)):
+        for _ in range(frames):
+            events.append(fsm._transition(pinch, False, (100, 100), t).type)
+            t += 1 / 30
+    assert EventType.MOUSE_DOWN in events and EventType.CLICK not in events
+
+
+def test_profile_persistence(tmp_path):
+    learner = DoublePinchLearner(min_samples=1)
+    learner.observe(300.0)
+    save_profile("alice", {"double_pinch": learner.state()}, directory=tmp_path)
+    restored = DoublePinchLearner(min_samples=1)
+    restored.load_state(load_profile("alice", directory=tmp_path).get("double_pinch"))
+    assert restored.window_ms(400) == learner.window_ms(400)
+    assert load_profile("bob", directory=tmp_path) == {}
+    with pytest.raises(ValueError):
+        save_profile("../evil", {}, directory=tmp_path)
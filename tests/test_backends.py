@@ -0,0 +1,110 @@
+"""Tests for redundant-move elimination and batched uinput writes in the OS backends."""
+
+import os
+import struct
+
+import pytest
+
+from kinemouse.backends.base_backend import BaseBackend, POSITION_TTL_S
+from kinemouse.backends.linux_wayland_backend import LinuxWaylandBackend
+from kinemouse.state.events import click_event, move_event, scroll_event
+from kinemouse.utils.config import KineMouseConfig
+
+EVENT = struct.Struct("llHHi")
+EV_SYN, EV_KEY, EV_REL, EV_ABS = 0, 1, 2, 3
+
+
+class _Recording(BaseBackend):
+    def __init__(self):
+        super().__init__(KineMouseConfig())
+        self.calls = []
+        self.now = 0.0
+        self._clock = lambda: self.now
+
+    def get_screen_resolution(self):
+        return (1920, 1080)
+
+    def move(self, x, y):
+        self.calls.append(("move", x, y))
+
+    def click(self, x, y):
+        self.calls.append(("click", x, y, self._position_changed(x, y)))
+
+    def right_click(self, x, y): pass
+    def mouse_down(self, x, y): pass
+    def mouse_up(self, x, y): pass
+
+
+def test_repeated_move_skipped():
+    b = _Recording()
+    for _ in range(3):
+        b.dispatch(move_event(10, 20))
+    b.dispatch(move_event(11, 20))
+    assert b.calls == [("move", 10, 20), ("move", 11, 20)]
+    assert b.skipped_moves == 2
+
+
+def test_click_repositions_only_when_needed():
+    b = _Recording()
+    b.dispatch(move_event(10, 20))
+    b.dispatch(click_event(10, 20))
+    b.dispatch(click_event(30, 40))
+    assert b.calls[1:] == [("click", 10, 20, False), ("click", 30, 40, True)]
+
+
+def test_stale_position_is_resent():
+    b = _Recording()
+    b.dispatch(move_event(10, 20))
+    b.now += POSITION_TTL_S + 0.01       # the physical mouse may have moved since
+    b.dispatch(move_event(10, 20))
+    assert len(b.calls) == 2
+
+
+@pytest.fixture
+def wayland():
+    """LinuxWaylandBackend writing into a pipe instead of /dev/uinput."""
+    r, w = os.pipe()
+    b = LinuxWaylandBackend.__new__(LinuxWaylandBackend)
+    BaseBackend.__init__(b, KineMouseConfig())
+    b._screen_res = (1920, 1080)
+    b._device = None
+    b._fd = w
+    b._abs_x = b._abs_y = None
+    writes = []
+    b._write = lambda data: (writes.append(data), os.write(w, data))
+    yield b, writes
+    os.close(r)
+    os.close(w)
+
+
+def _decode(data):
+    return [EVENT.unpack_from(data, i)[2:] for i in range(0, len(data), EVENT.size)]
+
+
+def test_wayland_click_is_one_write(wayland):
+    b, writes = wayland
+    b.dispatch(click_event(100, 200))
+    assert len(writes) == 1
+    assert _decode(writes[0]) == [
+        (EV_ABS, 0, 100), (EV_ABS, 1, 200), (EV_SYN, 0, 0),
+        (EV_KEY, 0x110, 1), (EV_SYN, 0, 0),
+        (EV_KEY, 0x110, 0), (EV_SYN, 0, 0),
+    ]
+
+
+def test_wayland_move_sends_changed_axes_only(wayland):
+    b, writes = wayland
+    b.move(100, 200)
+    b.move(100, 250)
+    b.move(100, 250)
+    assert len(writes) == 2
+    assert _decode(writes[1]) == [(EV_ABS, 1, 250), (EV_SYN, 0, 0)]
+
+
+def test_wayland_scroll_batches_hires_and_notch(wayland):
+    b, writes = wayland
+    b.dispatch(scroll_event(60))
+    b.dispatch(scroll_event(60))
+    assert len(writes) == 2
+    assert _decode(writes[0]) == [(EV_REL, 0x0b, 60), (EV_SYN, 0, 0)]
+    assert _decode(writes[1]) == [(EV_REL, 0x0b, 60), (EV_REL, 0x08, 1), (EV_SYN, 0, 0)]
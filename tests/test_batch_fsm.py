@@ -0,0 +1,92 @@
+"""Equivalence tests: BatchGestureEvaluator vs frame-by-frame GestureFSM."""
+
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.batch_fsm import BatchGestureEvaluator
+from kinemouse.state.events import EventType
+
+SCREEN_RES = (1920, 1080)
+
+
+def make_session(n=600, seed=0):
+    """Random walk hand with pinch bursts (index, middle), dropouts and D_ref==0 frames."""
+    rng = np.random.default_rng(seed)
+    lm = np.tile(rng.uniform(0.3, 0.7, size=(1, 21, 3)), (n, 1, 1))
+    lm[:, :, :2] += np.cumsum(rng.normal(0, 0.004, size=(n, 1, 2)), axis=0)
+    lm[:, 0, :2] = lm[:, 5, :2] + (0.0, 0.2)                  # D_ref = 0.2
+    state = rng.integers(0, 6, size=n // 10).repeat(10)[:n]
+    lm[state == 1, 8, :2] = lm[state == 1, 4, :2] + 0.005     # index pinch
+    lm[state == 2, 12, :2] = lm[state == 2, 4, :2] + 0.005    # middle pinch
+    lm[state == 3, 0, :2] = lm[state == 3, 5, :2]             # degenerate D_ref
+    found = state != 4
+    lm[~found] = np.nan
+    timestamps = np.cumsum(rng.uniform(0.02, 0.05, size=n))
+    return lm, timestamps, found
+
+
+def run_reference(lm, timestamps, found, config):
+    fsm = GestureFSM(config, SCREEN_RES)
+    events = []
+    for i, t in enumerate(timestamps.tolist()):
+        if found[i]:
+            frame = [SimpleNamespace(x=p[0], y=p[1], z=p[2]) for p in lm[i].tolist()]
+            events.append(fsm.process(frame, timestamp=t))
+        else:
+            events.append(fsm.process(None, timestamp=t))
+    return events
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("overrides", [
+    {}, {"smoothing": "one_euro"}, {"landmark_filter": True}, {"prediction": True},
+    {"click_mode": "speculative"}, {"pointer_accel": True}, {"pointer_mode": "relative"},
+    {"adaptive_double_pinch": True}, {"pinch_release_threshold": 0.2},
+    {"pinch_release_threshold": 0.2, "pinch_dwell_frames": 2},
+    {"tremor_filter": True}, {"tremor_filter": True, "tremor_adaptive": True},
+])
+def test_batch_matches_fsm(seed, overrides):
+    config = KineMouseConfig(**overrides)
+    lm, ts, found = make_session(seed=seed)
+    expected = run_reference(lm, ts, found, config)
+    result = BatchGestureEvaluator(config).evaluate(lm, ts, found, SCREEN_RES)
+    got = result.events()
+    assert [(e.type, e.position) for e in got] == [(e.type, e.position) for e in expected]
+
+
+def test_batch_counts_include_clicks():
+    lm, ts, found = make_session(n=2000, seed=3)
+    counts = BatchGestureEvaluator(KineMouseConfig()).evaluate(lm, ts, found).counts()
+    assert counts.get(EventType.MOVE.name, 0) > 0
+    assert sum(counts.values()) == 2000
+
+
+def test_found_derived_from_nan():
+    lm, ts, found = make_session(n=200, seed=4)
+    evaluator = BatchGestureEvaluator(KineMouseConfig())
+    a = evaluator.evaluate(lm, ts, found)
+    b = evaluator.evaluate(lm, ts)
+    assert np.array_equal(a.event_types, b.event_types)
+
+
+def test_session_json_npz_roundtrip(tmp_path):
+    import json
+    from kinemouse.utils.session_io import load_session, save_session_npz
+    frames = [
+        {"t": 0.0, "found": True, "landmarks": [{"x": 0.1 * (i % 10), "y": 0.5, "z": 0.0} for i in range(21)],
+         "label": "FIST"},
+        {"t": 0.033, "found": False, "landmarks": []},
+    ]
+    path = tmp_path / "s.json"
+    path.write_text(json.dumps({"frames": frames, "config": {"screen_res": [800, 600]}}))
+    session = load_session(path)
+    assert session.found.tolist() == [True, False]
+    assert session.screen_res == (800, 600)
+    save_session_npz(session, tmp_path / "s.npz")
+    again = load_session(tmp_path / "s.npz")
+    assert np.array_equal(again.landmarks[0], session.landmarks[0])
+    assert again.screen_res == (800, 600)
+    assert again.labels.tolist() == ["FIST", ""]
@@ -0,0 +1,138 @@
+"""Tests for the display-rate cursor interpolator."""
+
+import time
+
+from kinemouse.backends.cursor_interpolator import CursorInterpolator
+from kinemouse.backends.dispatcher import CoalescingDispatcher
+from kinemouse.state.events import EventType, mouse_down_event, mouse_up_event, move_event, scroll_event
+from kinemouse.utils.config import KineMouseConfig
+
+
+class _Sink:
+    """Stands in for the dispatcher: records submitted events in order."""
+
+    def __init__(self):
+        self.events = []
+
+    def submit(self, event):
+        self.events.append(event)
+
+
+def _interpolator(output_hz=120, fps=30):
+    config = KineMouseConfig(cursor_interpolation=True, cursor_output_hz=output_hz, capture_fps=fps)
+    clock = [0.0]
+    sink = _Sink()
+    return CursorInterpolator(sink, config, clock=lambda: clock[0]), sink, clock
+
+
+def _run(interp, clock, targets, fps=30, output_hz=120):
+    """Feed targets at camera rate and step at output rate; return (time, pos) of emitted MOVEs."""
+    out = []
+    ticks = output_hz // fps
+    for x, y in targets:
+        interp.submit(move_event(x, y))
+        for _ in range(ticks):
+            clock[0] += 1.0 / output_hz
+            pos = interp.step(clock[0])
+            if pos is not None:
+                out.append((clock[0], pos))
+    return out
+
+
+def test_first_target_is_sent_directly():
+    interp, sink, _ = _interpolator()
+    interp.submit(move_event(100, 200))
+    assert [e.position for e in sink.events] == [(100, 200)]
+    assert not interp.gliding
+
+
+def test_intermediate_moves_between_targets():
+    interp, sink, clock = _interpolator()
+    out = _run(interp, clock, [(0, 0), (40, 0), (80, 0)])
+    xs = [p[0] for _, p in out]
+    # 4 output ticks per camera frame, evenly spaced, each target reached exactly
+    assert xs == [10, 20, 30, 40, 50, 60, 70, 80]
+    assert interp.interpolated == 8
+
+
+def test_delay_at_most_one_target_interval():
+    interp, sink, clock = _interpolator()
+    arrivals = {}
+    targets = [(i * 13, 500 - i * 7) for i in range(30)]
+    t = 0.0
+    for i, target in enumerate(targets):
+        arrivals.setdefault(target, t)
+        t += 1.0 / 30
+    out = _run(interp, clock, targets)
+    frame = 1.0 / 30
+    for target, t_arrival in arrivals.items():
+        if target == targets[0]:
+            continue
+        t_reached = next(t for t, pos in out if pos == target)
+        assert t_reached - t_arrival <= frame + 1e-9
+
+
+def test_button_event_ends_glide_in_order():
+    interp, sink, clock = _interpolator()
+    interp.submit(move_event(0, 0))
+    interp.submit(move_event(100, 0))
+    clock[0] += 1.0 / 120
+    interp.step(clock[0])                    # part-way along the glide
+    interp.submit(mouse_down_event(100, 0))
+    clock[0] += 1.0 / 120
+    assert interp.step(clock[0]) is None     # nothing from the old path after the press
+    interp.submit(move_event(140, 0))        # drag continues from the press position
+    clock[0] += 1.0 / 120
+    interp.step(clock[0])
+    types = [(e.type, e.position) for e in sink.events]
+    assert types[:3] == [
+        (EventType.MOVE, (0, 0)),
+        (EventType.MOVE, (25, 0)),
+        (EventType.MOUSE_DOWN, (100, 0)),
+    ]
+    assert types[3][0] == EventType.MOVE and 100 < types[3][1][0] < 140
+
+
+def test_positionless_events_pass_through():
+    interp, sink, clock = _interpolator()
+    interp.submit(move_event(0, 0))
+    interp.submit(move_event(100, 0))
+    interp.submit(scroll_event(120))
+    assert interp.gliding                    # a scroll does not move the cursor
+    assert sink.events[-1].type == EventType.SCROLL
+
+
+def test_stop_lands_on_final_target():
+    interp, sink, clock = _interpolator()
+    interp.submit(move_event(0, 0))
+    interp.submit(move_event(100, 0))
+    interp.stop()
+    assert sink.events[-1].position == (100, 0)
+    assert not interp.gliding
+
+
+class _Backend:
+    def __init__(self):
+        self.events = []
+
+    def dispatch(self, event):
+        self.events.append(event)
+
+
+def test_timer_thread_through_dispatcher():
+    backend = _Backend()
+    dispatcher = CoalescingDispatcher(backend)
+    dispatcher.start()
+    config = KineMouseConfig(cursor_interpolation=True, cursor_output_hz=240)
+    interp = CursorInterpolator(dispatcher, config)
+    interp.start()
+    for i in range(6):
+        interp.submit(move_event(i * 100, 0))
+        time.sleep(1.0 / 30)
+    interp.submit(mouse_up_event(600, 0))
+    interp.stop()
+    dispatcher.stop()
+    positions = [e.position for e in backend.events if e.type == EventType.MOVE]
+    assert len(positions) > 6                # more moves than camera targets
+    assert positions == sorted(positions)    # never steps backwards
+    assert backend.events[-1].type == EventType.MOUSE_UP
@@ -0,0 +1,146 @@
+"""Tests for the coalescing event dispatcher."""
+
+import threading
+import time
+
+from kinemouse.backends.dispatcher import CoalescingDispatcher
+from kinemouse.backends.smooth_scroll import SmoothScroller
+from kinemouse.state.events import (
+    EventType, click_event, idle_event, mouse_down_event, mouse_up_event, move_event, scroll_event,
+)
+from kinemouse.utils.config import KineMouseConfig
+
+
+class _Backend:
+    """Records dispatched events; optionally blocks until released."""
+
+    def __init__(self, block=False, fail_on=None):
+        self.events = []
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        if not block:
+            self.gate.set()
+        self.fail_on = fail_on
+
+    def dispatch(self, event):
+        self.entered.set()
+        self.gate.wait(2.0)
+        if event.type == self.fail_on:
+            raise OSError("backend busy")
+        self.events.append(event)
+
+
+def _blocked_dispatcher():
+    """Dispatcher whose backend is stuck inside a first MOVE."""
+    backend = _Backend(block=True)
+    d = CoalescingDispatcher(backend)
+    d.start()
+    d.submit(move_event(0, 0))
+    assert backend.entered.wait(2.0)
+    return backend, d
+
+
+def test_moves_coalesce_to_latest():
+    backend, d = _blocked_dispatcher()
+    for x in range(1, 50):
+        d.submit(move_event(x, 0))
+    backend.gate.set()
+    d.stop()
+    assert [e.position for e in backend.events] == [(0, 0), (49, 0)]
+    assert d.stats()["coalesced"] == 48
+
+
+def test_button_events_never_dropped():
+    backend, d = _blocked_dispatcher()
+    for i in range(200):
+        d.submit(move_event(i, 0))
+        d.submit(mouse_down_event(i, 0))
+        d.submit(mouse_up_event(i, 1))
+    backend.gate.set()
+    d.stop(timeout=5.0)
+    types = [e.type for e in backend.events]
+    assert types.count(EventType.MOUSE_DOWN) == 200
+    assert types.count(EventType.MOUSE_UP) == 200
+    assert types[1:] == [EventType.MOUSE_DOWN, EventType.MOUSE_UP] * 200
+
+
+def test_order_preserved_across_slot_and_channel():
+    backend, d = _blocked_dispatcher()
+    d.submit(mouse_down_event(1, 1))
+    d.submit(move_event(2, 2))
+    d.submit(move_event(3, 3))
+    d.submit(scroll_event(120))         # no position: the pending MOVE goes first
+    d.submit(move_event(4, 4))
+    d.submit(mouse_up_event(5, 5))      # has a position: supersedes the pending MOVE
+    d.submit(click_event(6, 6))
+    backend.gate.set()
+    d.stop()
+    got = [(e.type, e.position) for e in backend.events[1:]]
+    assert got == [
+        (EventType.MOUSE_DOWN, (1, 1)),
+        (EventType.MOVE, (3, 3)),
+        (EventType.SCROLL, None),
+        (EventType.MOUSE_UP, (5, 5)),
+        (EventType.CLICK, (6, 6)),
+    ]
+    assert d.stats()["coalesced"] == 2
+
+
+def test_idle_ignored_and_errors_counted():
+    backend = _Backend(fail_on=EventType.CLICK)
+    d = CoalescingDispatcher(backend)
+    d.start()
+    d.submit(idle_event())
+    d.submit(click_event(1, 1))
+    d.submit(mouse_down_event(2, 2))
+    d.stop()
+    stats = d.stats()
+    assert stats["submitted"] == 2
+    assert stats["errors"] == 1
+    assert [e.type for e in backend.events] == [EventType.MOUSE_DOWN]
+    assert d.pending == 0
+
+
+def test_scrolls_and_clicks_keep_submission_order():
+    backend, d = _blocked_dispatcher()
+    expected = []
+    for i in range(50):
+        for event in (scroll_event(i + 1), click_event(i, i), scroll_event(-(i + 1)),
+                      mouse_down_event(i, i), mouse_up_event(i, i)):
+            d.submit(event)
+            expected.append((event.type, event.position, event.amount))
+    backend.gate.set()
+    d.stop()
+    assert [(e.type, e.position, e.amount) for e in backend.events[1:]] == expected
+
+
+def test_smooth_scroll_goes_through_dispatcher_in_order():
+    class _Logged(CoalescingDispatcher):
+        """Remembers submission order across the camera and scroll threads."""
+
+        def __init__(self, backend):
+            super().__init__(backend)
+            self.log = []
+            self._log_lock = threading.Lock()
+
+        def submit(self, event):
+            with self._log_lock:
+                self.log.append(event)
+                super().submit(event)
+
+    backend = _Backend()
+    d = _Logged(backend)
+    d.start()
+    scroller = SmoothScroller(d, KineMouseConfig(scroll_friction_ms=0, scroll_rate_hz=240))
+    scroller.start()
+    scroller.set_velocity(30.0)
+    for i in range(20):
+        d.submit(click_event(i, i))
+        time.sleep(0.005)
+    scroller.release()
+    scroller.stop()
+    d.stop()
+    scrolls = [e for e in backend.events if e.type == EventType.SCROLL]
+    assert len(scrolls) > 5
+    assert backend.events == d.log           # nothing dropped, nothing reordered
+    assert d.stats()["dispatched"] == len(d.log)
@@ -0,0 +1,22 @@
+"""Unit tests for EdgeTrigger — rising-edge gesture firing."""
+
+from kinemouse.state.edge_trigger import EdgeTrigger
+
+
+def fire_frames(trigger, frames, dt=1 / 30):
+    return [i for i, active in enumerate(frames) if trigger.update(active, i * dt)]
+
+
+def test_fires_once_while_held():
+    assert fire_frames(EdgeTrigger(), [True] * 5) == [0]
+
+
+def test_rearm_frames():
+    t = EdgeTrigger(rearm_frames=2)
+    assert fire_frames(t, [True, False, True, False, False, True]) == [0, 5]
+
+
+def test_cooldown_swallows_early_press():
+    t = EdgeTrigger(rearm_frames=1, cooldown_ms=200)
+    # Re-pressed after 2 frames (67ms) — inside cooldown, swallowed until released
+    assert fire_frames(t, [True, False, True, True, True, True, True, True, True, False, True]) == [0, 10]
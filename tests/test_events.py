@@ -1,8 +1,12 @@
 """Unit tests for MouseEvent types."""
 
+import dataclasses
+
+import pytest
+
 from kinemouse.state.events import (
-    EventType, move_event, click_event, right_click_event,
-    mouse_down_event, mouse_up_event, idle_event
+    EventType, MouseEvent, EVENT_SIZE, move_event, click_event, right_click_event,
+    mouse_down_event, mouse_up_event, idle_event, motion_gesture_event, scroll_event
 )
 
 def test_move_event():
@@ -23,3 +27,39 @@ def test_right_click_event():
     e = right_click_event(300, 400)
     assert e.type == EventType.RIGHT_CLICK
     assert e.position == (300, 400)
+
+def test_motion_gesture_event():
+    e = motion_gesture_event("swipe_left")
+    assert e.type == EventType.MOTION_GESTURE
+    assert e.gesture == "swipe_left"
+    assert e.position is None
+
+def test_events_are_compact_and_immutable():
+    e = move_event(1, 2)
+    assert not hasattr(e, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        e.position = (3, 4)
+
+def test_constant_events_are_interned():
+    assert idle_event() is idle_event()
+    assert motion_gesture_event("circle_cw") is motion_gesture_event("circle_cw")
+
+@pytest.mark.parametrize("event", [
+    idle_event(), move_event(1919, 0), mouse_up_event(-5, 7),
+    motion_gesture_event("swipe_left"), scroll_event(-360),
+])
+def test_pack_round_trip(event):
+    data = event.pack()
+    assert len(data) == EVENT_SIZE
+    assert MouseEvent.unpack(data) == event
+
+def test_pack_into_buffer_and_interned_idle():
+    buf = bytearray(EVENT_SIZE * 2)
+    click_event(10, 20).pack_into(buf, EVENT_SIZE)
+    idle_event().pack_into(buf)
+    assert MouseEvent.unpack(buf) is idle_event()
+    assert MouseEvent.unpack(buf, EVENT_SIZE) == click_event(10, 20)
+
+def test_pack_rejects_long_gesture_name():
+    with pytest.raises(ValueError):
+        MouseEvent(EventType.MOTION_GESTURE, gesture="x" * 17).pack()
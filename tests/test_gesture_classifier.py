@@ -63,3 +63,84 @@ def test_open_hand_detection():
     lm = make_open_hand()
     pose = classify_pose(lm)
     assert pose == HandPose.OPEN_HAND
+
+
+# --- PoseClassifier (joint angles) ---
+
+import numpy as np
+
+from kinemouse.state.gesture_classifier import PoseClassifier
+from kinemouse.state.hand_features import joint_angles, finger_curl
+
+_BONES = (0.1, 0.05, 0.03, 0.025)    # wrist→knuckle, then three phalanges
+
+
+def posed_hand(curls, roll_deg=0.0, yaw_deg=0.0) -> np.ndarray:
+    """
+    (21, 3) hand with the given total curl (degrees) per finger
+    [thumb, index, middle, ring, pinky], rotated in the image plane (roll)
+    and about the vertical axis (yaw, hand seen from the side).
+    """
+    pts = np.zeros((21, 3))
+    z = np.array([0.0, 0.0, -1.0])          # bend towards the camera-facing palm
+    for finger, curl in enumerate(curls):
+        spread = np.radians(-60 if finger == 0 else -30 + 15 * finger)
+        base = np.array([np.sin(spread), -np.cos(spread), 0.0])
+        joints = 2 if finger == 0 else 3
+        phi, p = 0.0, pts[0].copy()
+        for bone, length in enumerate(_BONES):
+            if bone > 4 - joints - 1:
+                phi += np.radians(curl / joints)
+            d = np.cos(phi) * base + np.sin(phi) * z
+            p = p + length * d
+            pts[1 + finger * 4 + bone] = p
+    r, y = np.radians(roll_deg), np.radians(yaw_deg)
+    roll = np.array([[np.cos(r), -np.sin(r), 0], [np.sin(r), np.cos(r), 0], [0, 0, 1]])
+    yaw = np.array([[np.cos(y), 0, np.sin(y)], [0, 1, 0], [-np.sin(y), 0, np.cos(y)]])
+    return pts @ (yaw @ roll).T + (0.5, 0.6, 0.0)
+
+
+OPEN = (0, 0, 0, 0, 0)
+FIST = (120, 240, 240, 240, 240)
+PEACE = (120, 0, 0, 240, 240)
+THUMBS_UP = (0, 240, 240, 240, 240)
+
+
+def test_joint_angles_recover_curl():
+    curl = finger_curl(joint_angles(posed_hand((30, 60, 90, 120, 150), roll_deg=40, yaw_deg=60)))
+    assert np.allclose(curl, (30, 60, 90, 120, 150))
+
+
+@pytest.mark.parametrize("roll,yaw", [(0, 0), (90, 0), (-60, 0), (30, 70), (180, 0)])
+@pytest.mark.parametrize("curls,expected", [
+    (OPEN, HandPose.OPEN_HAND), (FIST, HandPose.FIST),
+    (PEACE, HandPose.PEACE), (THUMBS_UP, HandPose.THUMBS_UP),
+])
+def test_pose_classifier_rotation_invariant(curls, expected, roll, yaw):
+    classifier = PoseClassifier(hold_frames=1)
+    assert classifier.classify(posed_hand(curls, roll, yaw)) == expected
+
+
+def test_legacy_classifier_fails_when_hand_rotated():
+    """What the angle classifier fixes: tip/PIP height comparisons break sideways."""
+    assert classify_pose(posed_hand(OPEN, roll_deg=90)) != HandPose.OPEN_HAND
+
+
+def test_finger_hysteresis_holds_state_inside_band():
+    classifier = PoseClassifier()
+    curl = np.array([0.0, 0.0, 0.0, 0.0, 0.0])
+    assert classifier.extended(curl).all()
+    curl[1] = 100.0          # inside the index finger's 70–110° band: still extended
+    assert classifier.extended(curl)[1]
+    curl[1] = 115.0
+    assert not classifier.extended(curl)[1]
+    curl[1] = 80.0           # back inside the band: stays curled
+    assert not classifier.extended(curl)[1]
+
+
+def test_pose_switch_needs_hold_frames():
+    classifier = PoseClassifier(hold_frames=3)
+    poses = [classifier.classify(posed_hand(OPEN)) for _ in range(3)]
+    assert poses == [HandPose.UNKNOWN, HandPose.UNKNOWN, HandPose.OPEN_HAND]
+    assert classifier.classify(posed_hand(FIST)) == HandPose.OPEN_HAND   # one-frame blip ignored
+    assert classifier.classify(posed_hand(OPEN)) == HandPose.OPEN_HAND
@@ -63,3 +63,78 @@ def test_right_click_on_middle_pinch():
 def test_fsm_state_starts_idle():
     fsm = GestureFSM(KineMouseConfig(), SCREEN_RES)
     assert fsm._state == FSMState.IDLE
+
+
+PINCH = dict(thumb_x=0.5, thumb_y=0.5, index_x=0.501, index_y=0.5)
+OPEN = dict(thumb_x=0.5, thumb_y=0.5, index_x=0.7, index_y=0.7)
+
+
+def test_click_uses_frame_timestamps():
+    fsm = GestureFSM(KineMouseConfig(), SCREEN_RES, clock=lambda: pytest.fail("clock used"))
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.0).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.1).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.45).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.51).type == EventType.CLICK
+
+
+def test_double_pinch_with_injected_clock():
+    now = [0.0]
+    fsm = GestureFSM(KineMouseConfig(), SCREEN_RES, clock=lambda: now[0])
+    fsm.process(make_landmarks(**PINCH))
+    now[0] = 0.1
+    fsm.process(make_landmarks(**OPEN))
+    now[0] = 0.3
+    assert fsm.process(make_landmarks(**PINCH)).type == EventType.MOUSE_DOWN
+
+
+def test_speculative_click_fires_on_release_frame():
+    fsm = GestureFSM(KineMouseConfig(click_mode="speculative"), SCREEN_RES)
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.0).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.033).type == EventType.CLICK
+    # A quick second pinch is just another pointer move, not a drag
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.1).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.133).type == EventType.CLICK
+
+
+def test_speculative_drag_by_pinch_and_hold():
+    fsm = GestureFSM(KineMouseConfig(click_mode="speculative", drag_hold_ms=500), SCREEN_RES)
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.0).type == EventType.MOVE
+    # Held still: repeated MOVEs to the same position are suppressed
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.3).type == EventType.IDLE
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.51).type == EventType.MOUSE_DOWN
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.6).type == EventType.IDLE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.7).type == EventType.MOUSE_UP
+
+
+def test_speculative_moving_pinch_never_drags():
+    fsm = GestureFSM(KineMouseConfig(click_mode="speculative", ema_alpha=1.0), SCREEN_RES)
+    fsm.process(make_landmarks(**PINCH), timestamp=0.0)
+    moved = dict(PINCH, thumb_x=0.6, index_x=0.601)
+    assert fsm.process(make_landmarks(**moved), timestamp=0.1).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.8).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**OPEN), timestamp=0.9).type == EventType.CLICK
+
+
+RIGHT = dict(thumb_x=0.5, thumb_y=0.5, index_x=0.7, index_y=0.7, middle_x=0.501, middle_y=0.5)
+
+
+def test_right_click_fires_once_per_pinch():
+    fsm = GestureFSM(KineMouseConfig(right_click_cooldown_ms=0), SCREEN_RES)
+    types = [fsm.process(make_landmarks(**RIGHT), timestamp=i / 30).type for i in range(10)]
+    assert types.count(EventType.RIGHT_CLICK) == 1
+    assert types[0] == EventType.RIGHT_CLICK
+
+
+def test_right_click_rearms_after_release():
+    fsm = GestureFSM(KineMouseConfig(right_click_rearm_frames=2, right_click_cooldown_ms=0), SCREEN_RES)
+    seq = [RIGHT, OPEN, RIGHT, OPEN, OPEN, RIGHT]   # one-frame release does not re-arm
+    types = [fsm.process(make_landmarks(**lm), timestamp=i / 30).type for i, lm in enumerate(seq)]
+    assert [i for i, t in enumerate(types) if t == EventType.RIGHT_CLICK] == [0, 5]
+
+
+def test_repeated_move_to_same_position_suppressed():
+    fsm = GestureFSM(KineMouseConfig(ema_alpha=1.0), SCREEN_RES)
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.0).type == EventType.MOVE
+    assert fsm.process(make_landmarks(**PINCH), timestamp=0.033).type == EventType.IDLE
+    moved = dict(PINCH, thumb_x=0.6, index_x=0.601)
+    assert fsm.process(make_landmarks(**moved), timestamp=0.066).type == EventType.MOVE
@@ -0,0 +1,106 @@
+"""Tests for the ring-buffer GestureHistory."""
+
+import numpy as np
+import pytest
+
+from kinemouse.state.events import EventType, click_event, idle_event, move_event, scroll_event
+from kinemouse.state.gesture_history import GestureHistory, NO_POSITION
+
+
+def _fill(history, n, start=0.0, step=0.1):
+    for i in range(n):
+        history.record(move_event(i, 2 * i), timestamp=start + i * step)
+
+
+def test_idle_is_not_recorded():
+    h = GestureHistory(10)
+    h.record(idle_event(), timestamp=0.0)
+    assert len(h) == 0
+
+
+def test_ring_wraps_and_last_n_is_contiguous_view():
+    h = GestureHistory(8)
+    _fill(h, 21)
+    assert len(h) == 8
+    last = h.last_n(5)
+    assert last["x"].tolist() == [16, 17, 18, 19, 20]
+    assert np.shares_memory(last, h.last_n(1))
+    assert h.last_n(100)["x"].tolist() == list(range(13, 21))
+    assert h.totals()["MOVE"] == 21
+
+
+def test_records_convert_missing_position():
+    h = GestureHistory(4)
+    h.record(scroll_event(120), timestamp=1.0)
+    (rec,) = h.records()
+    assert rec.event_type == "SCROLL"
+    assert rec.position_x is None
+    assert h.last_n(1)["x"][0] == NO_POSITION
+
+
+def test_vectorized_stats():
+    h = GestureHistory(100)
+    _fill(h, 10, step=0.5)                      # MOVE every 0.5 s, t = 0 … 4.5
+    h.record(click_event(0, 0), timestamp=5.0)
+    h.record(click_event(0, 0), timestamp=6.0)
+    assert h.counts() == {"MOVE": 10, "CLICK": 2}
+    assert h.rates()["MOVE"] == pytest.approx(10 / 6.0)
+    assert h.rates(window_s=2.5) == {"MOVE": pytest.approx(1.2), "CLICK": pytest.approx(0.8)}
+    assert h.intervals(EventType.CLICK).tolist() == [1.0]
+    stats = h.interval_stats(EventType.MOVE)
+    assert stats["median"] == pytest.approx(0.5)
+    assert h.interval_stats(EventType.RIGHT_CLICK) == {}
+
+
+@pytest.mark.parametrize("suffix", [".json", ".npz"])
+def test_save_load_round_trip(tmp_path, suffix):
+    h = GestureHistory(16)
+    _fill(h, 20)
+    h.record(scroll_event(-120), timestamp=9.0)
+    path = str(tmp_path / f"session{suffix}")
+    h.save(path)
+    loaded = GestureHistory(16)
+    loaded.load(path)
+    assert loaded.records() == h.records()
+    assert loaded.totals() == h.totals()
+
+
+def test_save_load_reject_unknown_suffix(tmp_path):
+    h = GestureHistory(4)
+    _fill(h, 2)
+    with pytest.raises(ValueError):
+        h.save(str(tmp_path / "session.hist"))
+    assert not list(tmp_path.iterdir())         # np.savez would have written session.hist.npz
+    with pytest.raises(ValueError):
+        h.load(str(tmp_path / "session"))
+
+
+def test_mapped_history_uses_wall_clock(tmp_path, monkeypatch):
+    import time
+    monkeypatch.setattr(time, "monotonic", lambda: 5.0)    # as just after a reboot
+    h = GestureHistory(8, path=str(tmp_path / "session.kmh"))
+    before = time.time()
+    h.record(click_event(1, 1))
+    assert h.last_n(1)["timestamp"][0] >= before
+    memory = GestureHistory(8)
+    memory.record(click_event(1, 1))
+    assert memory.last_n(1)["timestamp"][0] == 5.0
+
+
+def test_memory_mapped_history_survives_reopen(tmp_path):
+    path = tmp_path / "session.kmh"
+    h = GestureHistory(8, path=str(path))
+    _fill(h, 11)
+    del h                                       # no flush: as after a crash
+    reopened = GestureHistory(1000, path=str(path))
+    assert reopened.max_entries == 8
+    assert reopened.last_n(8)["x"].tolist() == list(range(3, 11))
+    reopened.record(click_event(5, 5), timestamp=2.0)
+    assert reopened.counts()["CLICK"] == 1
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 4096)
+    with pytest.raises(ValueError):
+        GestureHistory(8, path=str(path))
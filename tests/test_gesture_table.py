@@ -0,0 +1,179 @@
+"""Unit tests for GestureTable — declarative gesture maps compiled to a table."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.events import EventType
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.gesture_table import (
+    GestureTable, GestureTableSource, builtin_table, load_gesture_map,
+    PINCH_INDEX, PINCH_MIDDLE, MIDDLE_HELD, RIGHT_CLICK, TIMEOUT, N_MASKS,
+)
+
+TOGGLE_MAP = {
+    "name": "toggle",
+    "states": {"OFF": {}, "ON": {"timeout_ms": 100}},
+    "transitions": [
+        {"from": "OFF", "when": {"pinch_index": True}, "to": "ON", "emit": "MOUSE_DOWN"},
+        {"from": "ON", "when": {"timeout": True}, "to": "OFF", "emit": "MOUSE_UP"},
+        {"from": "ON", "emit": "MOVE"},
+    ],
+}
+
+
+@pytest.mark.parametrize("name", ["double_pinch", "speculative"])
+def test_builtin_maps_compile(name):
+    table = builtin_table(name)
+    assert table.states[table.initial] == "IDLE"
+    assert len(table._table) == len(table.states) * N_MASKS
+
+
+@pytest.mark.parametrize("name", ["double_pinch", "speculative"])
+def test_builtin_maps_release_drag_before_right_click(name):
+    table = builtin_table(name)
+    drag, idle = table.index_of("DRAG_MODE"), table.index_of("IDLE")
+    middle = PINCH_MIDDLE | MIDDLE_HELD
+    # Middle pinch while dragging: release the button first, then right-click
+    nxt, emit = table.lookup(drag, middle | RIGHT_CLICK)
+    assert emit == EventType.MOUSE_UP
+    assert table.lookup(nxt, middle) == (idle, EventType.RIGHT_CLICK)
+    assert table.lookup(drag, middle) == (idle, EventType.MOUSE_UP)
+
+
+def test_first_matching_rule_wins_and_default_stays():
+    table = GestureTable(TOGGLE_MAP)
+    off, on = table.index_of("OFF"), table.index_of("ON")
+    assert table.lookup(off, PINCH_INDEX) == (on, EventType.MOUSE_DOWN)
+    assert table.lookup(off, 0) == (off, None)
+    assert table.lookup(on, TIMEOUT | PINCH_INDEX) == (off, EventType.MOUSE_UP)
+    assert table.lookup(on, PINCH_INDEX) == (on, EventType.MOVE)
+
+
+@pytest.mark.parametrize("bad", [
+    {"states": {}},
+    {"states": {"A": {}}, "transitions": [{"from": "A", "when": {"wink": True}}]},
+    {"states": {"A": {}}, "transitions": [{"from": "A", "to": "B"}]},
+    {"states": {"A": {}}, "transitions": [{"from": "A", "emit": "DOUBLE_CLICK"}]},
+    {"states": {"A": {}}, "transitions": [{"from": "A", "emit": "MOTION_GESTURE"}]},
+    {"states": {"A": {}}, "transitions": [{"from": "A", "pose": "SHAKA"}]},
+])
+def test_invalid_maps_rejected(bad):
+    with pytest.raises(ValueError):
+        GestureTable(bad)
+
+
+def test_toml_map(tmp_path):
+    path = tmp_path / "toggle.toml"
+    path.write_text(
+        'name = "toggle"\n'
+        '[states.OFF]\n[states.ON]\n'
+        '[[transitions]]\nfrom = "OFF"\nwhen = { pinch_index = true }\nto = "ON"\nemit = "MOUSE_DOWN"\n'
+    )
+    table = load_gesture_map(path)
+    assert table.lookup(0, PINCH_INDEX) == (1, EventType.MOUSE_DOWN)
+
+
+def test_custom_map_drives_fsm_and_hot_reloads(tmp_path):
+    import json
+    path = tmp_path / "map.json"
+    path.write_text(json.dumps(TOGGLE_MAP))
+    cfg = KineMouseConfig(gesture_map=str(path), suppress_repeat_moves=False)
+    fsm = GestureFSM(cfg, (1920, 1080))
+    assert fsm._transition(True, False, (10, 10), 0.0).type == EventType.MOUSE_DOWN
+    assert fsm._transition(False, False, (10, 10), 0.05).type == EventType.MOVE
+    assert fsm._transition(False, False, (10, 10), 0.2).type == EventType.MOUSE_UP
+    assert fsm.state == "OFF"
+
+    # Edit the map: pinching now right-clicks; picked up on the next check
+    edited = dict(TOGGLE_MAP, transitions=[
+        {"from": "OFF", "when": {"pinch_index": True}, "emit": "RIGHT_CLICK"},
+    ])
+    path.write_text(json.dumps(edited))
+    os.utime(path, (1e9, 1e9))
+    assert fsm._transition(True, False, (10, 10), 5.0).type == EventType.RIGHT_CLICK
+
+
+SCROLL_MAP = {
+    "name": "pose_scroll",
+    "states": {"IDLE": {}},
+    "transitions": [
+        {"from": "IDLE", "pose": "PEACE", "when": {"pinch_ring": True}, "emit": "SCROLL", "amount": -240},
+        {"from": "IDLE", "pose": ["FIST", "THUMBS_UP"], "emit": "SCROLL"},
+        {"from": "IDLE", "when": {"pinch_pinky": True}, "emit": "RIGHT_CLICK"},
+    ],
+}
+
+PEACE = (False, True, True, False, False)
+FIST = (False,) * 5
+
+
+def _features(pinch, extended):
+    """Only the fields the FSM reads for ring/pinky pinch and pose guards."""
+    return SimpleNamespace(pinch_mask=pinch, extended=extended)
+
+
+def test_pose_and_ring_guards_emit_scroll(tmp_path):
+    import json
+    table = GestureTable(SCROLL_MAP)
+    assert table.uses_pose and table.needs_features
+    assert not builtin_table("double_pinch").needs_features
+
+    path = tmp_path / "map.json"
+    path.write_text(json.dumps(SCROLL_MAP))
+    fsm = GestureFSM(KineMouseConfig(gesture_map=str(path)), (1920, 1080))
+    ring = (False, False, True, False)
+
+    event = fsm._transition(False, False, (5, 5), 0.0, _features(ring, PEACE))
+    assert (event.type, event.amount, event.position) == (EventType.SCROLL, -240, None)
+    assert fsm._transition(False, False, (5, 5), 0.1, _features(ring, FIST)).amount == 120
+    assert fsm._transition(False, False, (5, 5), 0.2, _features((False,) * 4, PEACE)).type == EventType.IDLE
+    pinky = (False, False, False, True)
+    assert fsm._transition(False, False, (5, 5), 0.3, _features(pinky, PEACE)).type == EventType.RIGHT_CLICK
+    # Without features the extra inputs read as released and the pose as UNKNOWN
+    assert fsm._transition(False, False, (5, 5), 0.4).type == EventType.IDLE
+
+
+def test_feature_guarded_map_takes_exact_batch_path(tmp_path):
+    import json
+    from kinemouse.state.batch_fsm import BatchGestureEvaluator
+    path = tmp_path / "map.json"
+    path.write_text(json.dumps(SCROLL_MAP))
+    assert BatchGestureEvaluator(KineMouseConfig()).vectorizable
+    assert not BatchGestureEvaluator(KineMouseConfig(gesture_map=str(path))).vectorizable
+
+
+def test_held_states_inferred_from_button_events():
+    table = builtin_table("double_pinch")
+    held = {name for name, h in zip(table.states, table.held) if h}
+    assert held == {"DRAG_MODE"}
+    assert GestureTable(TOGGLE_MAP).held == [False, True]
+
+
+def test_map_swap_mid_drag_releases_button(tmp_path):
+    import json
+    path = tmp_path / "map.json"
+    path.write_text(json.dumps(TOGGLE_MAP))
+    cfg = KineMouseConfig(gesture_map=str(path), suppress_repeat_moves=False)
+    fsm = GestureFSM(cfg, (1920, 1080))
+    assert fsm._transition(True, False, (10, 10), 0.0).type == EventType.MOUSE_DOWN
+    assert fsm.state == "ON"
+
+    # Switching to a built-in map while the button is down releases it first
+    cfg.gesture_map = ""
+    event = fsm._transition(True, False, (20, 20), 0.05)
+    assert (event.type, event.position) == (EventType.MOUSE_UP, (20, 20))
+    assert fsm.state == "IDLE"
+    # Swapping out of a state that holds nothing emits nothing extra
+    cfg.gesture_map = str(path)
+    assert fsm._transition(False, False, (20, 20), 0.1).type == EventType.IDLE
+
+
+def test_broken_custom_map_keeps_previous_table(tmp_path):
+    path = tmp_path / "map.json"
+    path.write_text("{not json")
+    source = GestureTableSource()
+    table = source.get(KineMouseConfig(gesture_map=str(path)), 0.0)
+    assert table is builtin_table("double_pinch")
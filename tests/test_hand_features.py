@@ -0,0 +1,80 @@
+"""Unit tests for HandFeatures — shared per-frame geometry."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import compute_dref, is_pinching
+from kinemouse.state.hand_features import HandFeatures, batch_distances, landmarks_to_array
+
+
+def make_landmarks(thumb=(0.5, 0.5), index=(0.501, 0.5), middle=(0.6, 0.6),
+                   ring=(0.7, 0.7), wrist=(0.5, 0.8), knuckle=(0.5, 0.6)):
+    lm = [MagicMock() for _ in range(21)]
+    for i in range(21):
+        lm[i].x, lm[i].y, lm[i].z = 0.5, 0.5, 0.0
+    for idx, (x, y) in {0: wrist, 4: thumb, 5: knuckle, 8: index,
+                        12: middle, 16: ring}.items():
+        lm[idx].x, lm[idx].y = x, y
+    return lm
+
+
+def test_landmarks_to_array_shape():
+    arr = landmarks_to_array(make_landmarks())
+    assert arr.shape == (21, 3)
+    assert arr[4, 0] == 0.5
+
+
+def test_dref_matches_scalar():
+    lm = make_landmarks()
+    assert HandFeatures(lm, KineMouseConfig()).dref == compute_dref(lm)
+
+
+def test_pinch_flags_match_scalar():
+    cfg = KineMouseConfig()
+    lm = make_landmarks(middle=(0.502, 0.5))
+    f = HandFeatures(lm, cfg)
+    dref = compute_dref(lm)
+    for tip in (cfg.INDEX_TIP, cfg.MIDDLE_TIP, cfg.RING_TIP):
+        assert f.pinching(tip) == is_pinching(lm, cfg.THUMB_TIP, tip, dref, cfg.pinch_threshold)
+    assert f.pinch_index and f.pinch_middle and not f.pinch_ring
+
+
+def test_features_are_lazy_and_memoized():
+    f = HandFeatures(make_landmarks(), KineMouseConfig())
+    assert "extended" not in f.__dict__
+    first = f.tip_distances
+    assert f.tip_distances is not None and np.array_equal(first, f.tip_distances)
+    assert "extended" not in f.__dict__
+
+
+def test_dref_override():
+    f = HandFeatures(make_landmarks(), KineMouseConfig(), dref=0.2)
+    assert f.dref == 0.2
+
+
+def test_pinch_mask_override():
+    f = HandFeatures(make_landmarks(), KineMouseConfig())
+    f.tip_distances                             # reading the geometry is fine
+    f.set_pinch_mask(np.array([False, True, False, False]))
+    assert not f.pinch_index and f.pinch_middle
+    with pytest.raises(RuntimeError):
+        f.set_pinch_mask(np.zeros(4, dtype=bool))   # consumers may already have seen it
+
+
+def test_array_input_matches_objects_and_batch():
+    cfg = KineMouseConfig()
+    lm = make_landmarks(middle=(0.502, 0.5))
+    arr = landmarks_to_array(lm)
+    a, b = HandFeatures(lm, cfg), HandFeatures(arr, cfg)
+    assert a.tip_distances == b.tip_distances and a.dref == b.dref
+    assert a.pinch_mask == b.pinch_mask and a.extended == b.extended
+    assert a.pinch_midpoint == b.pinch_midpoint and a.palm_center == b.palm_center
+    # Bit-identical to the vectorized session pass (batch replay relies on it)
+    assert list(batch_distances(arr[None], cfg)[0]) == [*a.tip_distances, a.dref]
+
+
+def test_pinch_midpoint():
+    f = HandFeatures(make_landmarks(thumb=(0.4, 0.4), index=(0.6, 0.6)), KineMouseConfig())
+    assert f.pinch_midpoint == (0.5, 0.5)
@@ -0,0 +1,135 @@
+"""Tests for the SQLite gesture history store."""
+
+import math
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from kinemouse.state.events import (
+    EventType, click_event, idle_event, mouse_down_event, mouse_up_event, scroll_event,
+)
+from kinemouse.state.gesture_history import GestureHistory, NO_POSITION
+from kinemouse.state.history_store import SQLiteHistoryStore, read_events
+
+
+def test_batched_writes_visible_after_flush(tmp_path):
+    with SQLiteHistoryStore(str(tmp_path / "h.db"), flush_interval=60.0) as store:
+        for i in range(1000):
+            store.record(click_event(i, i), timestamp=float(i))
+        store.record(idle_event(), timestamp=5.0)
+        assert store.flush(timeout=5.0)
+        assert len(store) == 1000
+        rows = store.range(start=10.0, end=20.0)
+        assert rows["x"].tolist() == list(range(10, 20))
+
+
+def test_records_survive_reopen(tmp_path):
+    path = str(tmp_path / "h.db")
+    store = SQLiteHistoryStore(path)
+    store.record(scroll_event(120), timestamp=1.0)
+    store.close()                                  # close writes the queue
+    with SQLiteHistoryStore(path) as reopened:
+        (row,) = reopened.range()
+        assert row["event_type"] == EventType.SCROLL.value
+        assert row["x"] == NO_POSITION
+        assert math.isnan(row["duration_ms"])
+
+
+def test_aggregates_and_drag_durations(tmp_path):
+    with SQLiteHistoryStore(str(tmp_path / "h.db")) as store:
+        for hour in range(3):
+            for k in range(hour + 1):
+                store.record(click_event(0, 0), timestamp=hour * 3600.0 + k)
+        store.record(mouse_down_event(1, 1), timestamp=20000.0)
+        store.record(mouse_up_event(2, 2), timestamp=20000.05)     # 50 ms — accidental
+        store.record(mouse_down_event(1, 1), timestamp=21000.0)
+        store.record(mouse_up_event(2, 2), timestamp=21001.0)
+        store.flush()
+        assert store.per_bucket(EventType.CLICK) == [(0.0, 1), (3600.0, 2), (7200.0, 3)]
+        assert store.per_bucket(EventType.CLICK, start=3600.0) == [(3600.0, 2), (7200.0, 3)]
+        assert store.counts() == {"CLICK": 6, "MOUSE_DOWN": 2, "MOUSE_UP": 2}
+        short = store.drags(max_duration_ms=100)
+        assert len(short) == 1 and np.isclose(short["duration_ms"][0], 50.0)
+        assert len(store.drags()) == 2
+
+
+@pytest.mark.parametrize("start, end", [
+    (None, None), (5000.0, None), (None, 30000.5), (3600.0, 36000.0),
+    (1234.5, 40000.25), (7300.0, 7900.0), (10800.0, 10800.0),
+])
+def test_rollup_counts_match_rows(tmp_path, start, end):
+    rng = np.random.default_rng(1)
+    ts = np.sort(rng.uniform(0.0, 12 * 3600.0, 3000))
+    kinds = rng.choice([EventType.CLICK.value, EventType.SCROLL.value], size=len(ts))
+    with SQLiteHistoryStore(str(tmp_path / "h.db"), batch_size=97) as store:
+        for t, k in zip(ts.tolist(), kinds.tolist()):
+            store.record(click_event(0, 0) if k == EventType.CLICK.value else scroll_event(120), timestamp=t)
+        store.flush()
+        inside = (ts >= (start or 0.0)) & (ts < (end if end is not None else np.inf))
+        clicks = inside & (kinds == EventType.CLICK.value)
+        expected = {name: int((inside & (kinds == t.value)).sum())
+                    for name, t in (("CLICK", EventType.CLICK), ("SCROLL", EventType.SCROLL))}
+        assert store.counts(start, end) == {k: v for k, v in expected.items() if v}
+        for bucket_s in (3600.0, 7200.0, 900.0):
+            b, n = np.unique((ts[clicks] / bucket_s).astype(int), return_counts=True)
+            expected_buckets = list(zip((b * bucket_s).tolist(), n.tolist()))
+            assert store.per_bucket(EventType.CLICK, start, end, bucket_s) == expected_buckets
+
+
+def test_rollup_rebuilt_for_rows_written_without_it(tmp_path):
+    from kinemouse.state.history_store import _INSERT, _SCHEMA
+    path = str(tmp_path / "h.db")
+    conn = sqlite3.connect(path)                   # e.g. a database from before the rollup
+    conn.executescript(_SCHEMA)
+    with conn:
+        conn.executemany(_INSERT, [(h * 3600.0 + 1, EventType.CLICK.value, 0, 0, None) for h in range(5)])
+    conn.close()
+    with SQLiteHistoryStore(path) as store:
+        assert store.per_bucket(EventType.CLICK) == [(h * 3600.0, 1) for h in range(5)]
+        store.record(click_event(0, 0), timestamp=2.0)
+        store.flush()
+        assert store.counts() == {"CLICK": 6}
+
+
+def test_read_events_opens_read_only(tmp_path):
+    path = tmp_path / "h.db"
+    with SQLiteHistoryStore(str(path)) as store:
+        store.record(click_event(1, 2), timestamp=1.0)
+        store.record(scroll_event(120), timestamp=2.0)
+    before = path.read_bytes()
+    rows = read_events(str(path), start=1.5)
+    assert rows["event_type"].tolist() == [EventType.SCROLL.value]
+    assert path.read_bytes() == before
+    with pytest.raises(sqlite3.OperationalError):
+        read_events(str(tmp_path / "missing.db"))          # never created
+
+
+def test_gesture_history_feeds_store(tmp_path):
+    with SQLiteHistoryStore(str(tmp_path / "h.db")) as store:
+        history = GestureHistory(16, store=store)
+        history.record(click_event(3, 4), timestamp=1.0)
+        history.record(idle_event())
+        store.flush()
+        assert store.counts() == {"CLICK": 1}
+        assert len(history) == 1
+
+
+def test_close_closes_other_threads_connections(tmp_path):
+    store = SQLiteHistoryStore(str(tmp_path / "h.db"))
+    conns = []
+
+    def query():
+        len(store)
+        conns.append(store._conn())
+
+    worker = threading.Thread(target=query)
+    worker.start()
+    worker.join()
+    query()                                        # and one on this thread
+    store.close()
+    assert len(conns) == 2 and conns[0] is not conns[1]
+    for conn in conns:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")               # closed
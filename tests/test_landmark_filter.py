@@ -0,0 +1,45 @@
+"""Unit tests for LandmarkFilterBank — vectorized landmark smoothing."""
+
+import numpy as np
+
+from kinemouse.utils.math_utils import OneEuroFilter
+from kinemouse.vision.landmark_filter import LandmarkFilterBank
+
+
+def test_first_frame_passes_through():
+    pts = np.random.default_rng(0).uniform(size=(21, 3))
+    out = LandmarkFilterBank()(pts, 0.0)
+    assert np.array_equal(out, pts)
+    assert out is not pts
+
+
+def test_reduces_noise_on_still_hand():
+    rng = np.random.default_rng(1)
+    base = rng.uniform(0.3, 0.7, size=(21, 3))
+    bank = LandmarkFilterBank()
+    raw, filtered = [], []
+    for i in range(120):
+        p = base + rng.normal(0, 0.003, size=(21, 3))
+        raw.append(p)
+        filtered.append(bank(p, i / 30))
+    assert np.std(np.array(filtered[30:]), axis=0).mean() < 0.5 * np.std(np.array(raw[30:]), axis=0).mean()
+
+
+def test_matches_scalar_one_euro_per_coordinate():
+    """With beta=0 both reduce to the same fixed-cutoff low-pass."""
+    rng = np.random.default_rng(2)
+    bank = LandmarkFilterBank(min_cutoff=2.0, beta=0.0)
+    scalar = OneEuroFilter(min_cutoff=2.0, beta=0.0)
+    for i in range(20):
+        p = rng.uniform(size=(21, 3))
+        out = bank(p, i / 30)
+        ref = scalar((p[8, 0], p[8, 1]), i / 30)
+    assert np.allclose(out[8, :2], ref)
+
+
+def test_reset_restarts_from_raw():
+    bank = LandmarkFilterBank()
+    bank(np.zeros((21, 3)), 0.0)
+    bank.reset()
+    pts = np.ones((21, 3))
+    assert np.array_equal(bank(pts, 0.1), pts)
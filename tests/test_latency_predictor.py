@@ -0,0 +1,38 @@
+"""Unit tests for LatencyPredictor — damped cursor extrapolation."""
+
+import pytest
+
+from kinemouse.state.latency_predictor import LatencyPredictor
+
+
+def run(predictor, xs, dt=1 / 30):
+    return [predictor((x, 0.5), i * dt) for i, x in enumerate(xs)]
+
+
+def test_first_sample_passthrough():
+    assert LatencyPredictor()((0.3, 0.4), 0.0) == (0.3, 0.4)
+
+
+def test_leads_constant_motion_by_latency():
+    p = LatencyPredictor(base_latency_ms=50, velocity_alpha=1.0)
+    out = run(p, [0.1 + 0.02 * i for i in range(10)])   # 0.6 units/s
+    assert out[-1][0] == pytest.approx(0.28 + 0.6 * 0.05)
+
+
+def test_no_prediction_when_still():
+    p = LatencyPredictor()
+    out = run(p, [0.5 + 0.0005 * (-1) ** i for i in range(20)])   # sub-threshold jitter
+    assert all(x == pytest.approx(0.5, abs=0.001) for x, _ in out)
+
+
+def test_reversal_drops_stale_velocity():
+    p = LatencyPredictor(base_latency_ms=100, velocity_alpha=0.3)
+    run(p, [0.1 + 0.02 * i for i in range(10)])
+    x, _ = p((0.27, 0.5), 10 / 30)          # hand turns back
+    assert x <= 0.27
+
+
+def test_measured_latency_adds_to_base():
+    p = LatencyPredictor(base_latency_ms=40)
+    p.observe_latency(0.02)
+    assert p.latency_s == pytest.approx(0.06)
@@ -0,0 +1,60 @@
+"""Tests for the main capture → FSM → dispatch loop (needs OpenCV and MediaPipe to import)."""
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+import main  # noqa: E402
+from kinemouse.utils.config import KineMouseConfig  # noqa: E402
+from kinemouse.vision.hand_tracker import _NO_FRAME  # noqa: E402
+
+
+class _Tracker:
+    """Camera that drops every frame, then stops the loop like Ctrl+C."""
+
+    def __init__(self, config, frames=3):
+        self.frames = frames
+        self.served = 0
+
+    def start(self):
+        return True
+
+    def stop(self):
+        pass
+
+    def next_frame(self):
+        if self.served == self.frames:
+            raise KeyboardInterrupt
+        self.served += 1
+        return _NO_FRAME
+
+
+class _Backend:
+    def __init__(self):
+        self.events = []
+
+    def get_screen_resolution(self):
+        return (1920, 1080)
+
+    def dispatch(self, event):
+        self.events.append(event)
+
+    def scroll_hires(self, units):
+        pass
+
+
+def test_dropped_frames_do_not_stop_the_loop(monkeypatch):
+    trackers = []
+
+    def make_tracker(config):
+        trackers.append(_Tracker(config))
+        return trackers[-1]
+
+    backend = _Backend()
+    monkeypatch.setattr(main, "HandTracker", make_tracker)
+    monkeypatch.setattr(main, "get_backend", lambda config: backend)
+    monkeypatch.setattr(main, "load_profile", lambda name: {})
+    main.run(KineMouseConfig(capture_fps=1000), show_preview=False)
+    assert trackers[0].served == 3
+    assert backend.events == []
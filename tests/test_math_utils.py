@@ -44,3 +44,17 @@ def test_map_to_screen_clamp():
     # Far outside box → should clamp to edge
     x, y = map_to_screen((0.0, 0.0), box, res)
     assert x == 0 and y == 0
+
+def test_one_euro_first_sample_passthrough():
+    from kinemouse.utils.math_utils import OneEuroFilter
+    f = OneEuroFilter()
+    assert f((0.3, 0.4), 0.0) == (0.3, 0.4)
+
+def test_one_euro_less_lag_when_fast():
+    """Higher beta opens the cutoff on a fast sweep, so the output tracks closer."""
+    from kinemouse.utils.math_utils import OneEuroFilter
+    slow, fast = OneEuroFilter(beta=0.0), OneEuroFilter(beta=20.0)
+    for i in range(10):
+        p = (i * 0.03, 0.5)
+        a, b = slow(p, i / 30), fast(p, i / 30)
+    assert abs(b[0] - 0.27) < abs(a[0] - 0.27)
@@ -0,0 +1,121 @@
+"""Unit tests for the streaming motion-gesture recognizer."""
+
+import math
+
+import numpy as np
+import pytest
+
+from kinemouse.backends.base_backend import BaseBackend
+from kinemouse.backends.keyboard_mixin import parse_hotkey
+from kinemouse.state.events import motion_gesture_event
+from kinemouse.state.motion_gestures import (
+    MotionGestureRecognizer, MotionTemplate, builtin_templates, path_to_directions,
+)
+from kinemouse.utils.config import KineMouseConfig
+
+FPS = 30.0
+
+
+def run(points, recognizer=None):
+    """Feed a palm path at 30 FPS; return the gestures fired."""
+    r = recognizer or MotionGestureRecognizer()
+    fired = []
+    for i, p in enumerate(points):
+        name = r.update(p, i / FPS)
+        if name:
+            fired.append(name)
+    return fired
+
+
+def with_rest(path, frames=15):
+    """Hold still at both ends of a path, as a hand does around a gesture."""
+    return [path[0]] * frames + list(path) + [path[-1]] * frames
+
+
+def swipe(dx, dy, n=12, length=0.4, noise=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        (0.5 + dx * length * i / n + rng.normal(0, noise), 0.5 + dy * length * i / n + rng.normal(0, noise))
+        for i in range(n + 1)
+    ]
+
+
+def circle(sign, n=30, phase=0.0, radius=0.12, noise=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    theta = phase + sign * np.linspace(0.0, 2 * math.pi, n)
+    return [
+        (0.5 + radius * math.cos(t) + rng.normal(0, noise), 0.5 + radius * math.sin(t) + rng.normal(0, noise))
+        for t in theta
+    ]
+
+
+@pytest.mark.parametrize("dx, dy, name", [
+    (-1, 0, "swipe_left"), (1, 0, "swipe_right"), (0, -1, "swipe_up"), (0, 1, "swipe_down"),
+])
+def test_swipes(dx, dy, name):
+    assert run(with_rest(swipe(dx, dy, noise=0.003))) == [name]
+
+
+@pytest.mark.parametrize("n", [14, 30, 60])
+@pytest.mark.parametrize("phase", [0.3, 2.0, 4.4])
+def test_circles_any_start_phase_and_speed(n, phase):
+    assert run(with_rest(circle(1, n, phase, noise=0.003))) == ["circle_cw"]
+    assert run(with_rest(circle(-1, n, phase, noise=0.003))) == ["circle_ccw"]
+
+
+def test_still_hand_and_jitter_never_fire():
+    rng = np.random.default_rng(1)
+    jitter = [(0.5 + rng.normal(0, 0.004), 0.5 + rng.normal(0, 0.004)) for _ in range(300)]
+    assert run(jitter) == []
+
+
+def test_slow_drift_never_fires():
+    assert run([(0.3 + 0.0005 * i, 0.5) for i in range(300)]) == []
+
+
+def test_fires_once_then_cooldown():
+    r = MotionGestureRecognizer(cooldown_ms=1000)
+    # Second swipe starts ~0.5s after the first fires — swallowed by the cooldown
+    path = with_rest(swipe(-1, 0)) + with_rest(swipe(1, 0), frames=2)
+    assert run(path, r) == ["swipe_left"]
+
+
+def test_custom_templates():
+    corners = [(0, 0), (1, 1), (2, 0), (3, 1)]
+    zigzag = MotionTemplate("zigzag", path_to_directions(corners, 12))
+    r = MotionGestureRecognizer(templates=builtin_templates() + [zigzag])
+    x = np.linspace(0, 3, 25)
+    y = np.interp(x, [c[0] for c in corners], [c[1] for c in corners])
+    assert run(with_rest([(0.3 + 0.1 * a, 0.4 + 0.1 * b) for a, b in zip(x, y)]), r) == ["zigzag"]
+
+
+def test_parse_hotkey():
+    assert parse_hotkey("Ctrl+Shift+Z") == ["ctrl", "shift", "z"]
+    assert parse_hotkey("+") == ["+"]
+    with pytest.raises(ValueError):
+        parse_hotkey("ctrl+")
+
+
+class _FakeBackend(BaseBackend):
+    def __init__(self, config):
+        super().__init__(config)
+        self.sent = []
+
+    def get_screen_resolution(self):
+        return (1920, 1080)
+
+    def move(self, x, y): pass
+    def click(self, x, y): pass
+    def right_click(self, x, y): pass
+    def mouse_down(self, x, y): pass
+    def mouse_up(self, x, y): pass
+
+    def send_hotkey(self, combo):
+        self.sent.append(combo)
+
+
+def test_dispatch_maps_gesture_to_hotkey():
+    backend = _FakeBackend(KineMouseConfig())
+    backend.dispatch(motion_gesture_event("swipe_left"))
+    backend.dispatch(motion_gesture_event("swipe_up"))   # unbound by default
+    assert backend.sent == ["alt+left"]
@@ -0,0 +1,116 @@
+"""Tests for pinch hysteresis / dwell (PinchDebouncer) and its FSM integration."""
+
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.batch_fsm import BatchGestureEvaluator
+from kinemouse.state.events import EventType
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.pinch_debouncer import PinchDebouncer, debounce_series, pinch_toggles
+
+SCREEN_RES = (1920, 1080)
+
+
+def _run(debouncer, ratios):
+    return [bool(debouncer.update(np.array([r, 1.0, 1.0, 1.0]), 1.0)[0]) for r in ratios]
+
+
+def test_hysteresis_band():
+    d = PinchDebouncer(enter=0.15, exit=0.20)
+    # In the band the previous state holds: open stays open, pinched stays pinched
+    assert _run(d, [0.17, 0.14, 0.17, 0.19, 0.21, 0.17]) == [False, True, True, True, False, False]
+
+
+def test_no_hysteresis_is_single_threshold():
+    d = PinchDebouncer(enter=0.15, exit=0.15)
+    ratios = [0.149, 0.151, 0.149, 0.151]
+    assert _run(d, ratios) == [r < 0.15 for r in ratios]
+
+
+def test_exit_never_below_enter():
+    d = PinchDebouncer()
+    d.configure(0.2, 0.1, 1)
+    assert d.exit == 0.2
+
+
+def test_dwell_needs_consecutive_frames():
+    d = PinchDebouncer(enter=0.15, exit=0.20, dwell_frames=3)
+    out = _run(d, [0.1, 0.1, 0.3, 0.1, 0.1, 0.1, 0.3, 0.3, 0.3])
+    assert out == [False, False, False, False, False, True, True, True, False]
+
+
+def test_reset_releases():
+    d = PinchDebouncer(enter=0.15, exit=0.20)
+    _run(d, [0.1])
+    d.reset()
+    assert _run(d, [0.17]) == [False]
+
+
+@pytest.mark.parametrize("dwell", [1, 2, 3])
+def test_series_matches_streaming(dwell):
+    rng = np.random.default_rng(dwell)
+    n = 500
+    dref = rng.uniform(0.15, 0.25, n)
+    dref[rng.random(n) < 0.05] = 0.0
+    dist = (0.17 + rng.normal(0, 0.03, size=(n, 3))) * dref[:, None]
+    restart = rng.random(n) < 0.02
+    hold = dref == 0
+
+    d = PinchDebouncer(0.15, 0.2, dwell, fingers=3)
+    expected = np.zeros((n, 3), dtype=bool)
+    for i in range(n):
+        if restart[i]:
+            d.reset()
+        if not hold[i]:
+            d.update(dist[i], dref[i])
+        expected[i] = d.state
+    got = debounce_series(dist, dref, 0.15, 0.2, dwell, restart=restart, hold=hold)
+    assert np.array_equal(got, expected)
+
+
+def test_hysteresis_reduces_toggles():
+    rng = np.random.default_rng(0)
+    dist = (0.15 + rng.normal(0, 0.01, size=(1000, 1)))
+    dref = np.ones(1000)
+    raw = debounce_series(dist, dref, 0.15, 0.15)
+    debounced = debounce_series(dist, dref, 0.15, 0.2, dwell_frames=2)
+    assert pinch_toggles(raw) > 100
+    assert pinch_toggles(debounced) < pinch_toggles(raw) / 10
+
+
+def _near_threshold_session(n=300, seed=0):
+    """Index fingertip resting right at the pinch threshold with tracking noise."""
+    rng = np.random.default_rng(seed)
+    lm = np.tile(np.full((1, 21, 3), 0.5), (n, 1, 1))
+    lm[:, 0, 1] = 0.7                                           # D_ref = 0.2
+    lm[:, 8, 0] = 0.5 + 0.2 * (0.15 + rng.normal(0, 0.005, n))  # ratio ≈ pinch_threshold
+    lm[:, 12, 0] = lm[:, 16, 0] = lm[:, 20, 0] = 0.9
+    return lm, np.arange(n) / 30.0
+
+
+def _fsm_counts(config, lm, ts):
+    fsm = GestureFSM(config, SCREEN_RES)
+    counts = {}
+    for frame, t in zip(lm.tolist(), ts.tolist()):
+        event = fsm.process([SimpleNamespace(x=p[0], y=p[1], z=p[2]) for p in frame], timestamp=t)
+        counts[event.type] = counts.get(event.type, 0) + 1
+    return counts
+
+
+def test_fsm_hysteresis_suppresses_spurious_drags():
+    lm, ts = _near_threshold_session()
+    raw = _fsm_counts(KineMouseConfig(), lm, ts)
+    debounced = _fsm_counts(KineMouseConfig(pinch_release_threshold=0.2), lm, ts)
+    assert raw.get(EventType.MOUSE_DOWN, 0) > 0
+    assert debounced.get(EventType.MOUSE_DOWN, 0) == 0
+    assert debounced.get(EventType.MOUSE_UP, 0) == 0
+
+
+def test_batch_matches_fsm_near_threshold():
+    lm, ts = _near_threshold_session(seed=1)
+    config = KineMouseConfig(pinch_release_threshold=0.18, pinch_dwell_frames=2)
+    result = BatchGestureEvaluator(config).evaluate(lm, ts, None, SCREEN_RES)
+    got = {EventType[k]: v for k, v in result.counts().items()}
+    assert got == _fsm_counts(config, lm, ts)
@@ -0,0 +1,59 @@
+"""Unit tests for PoseModel — trainable pose classifier."""
+
+import numpy as np
+import pytest
+
+from kinemouse.state.gesture_classifier import HandPose
+from kinemouse.state.pose_model import PoseModel, normalize_landmarks
+from tests.test_gesture_classifier import posed_hand
+
+POSES = {
+    "ROCK_ON": (120, 0, 240, 240, 0),
+    "POINT": (120, 0, 240, 240, 240),
+    "FIST": (120, 240, 240, 240, 240),
+}
+
+
+def dataset(n_per_pose=60, seed=0):
+    rng = np.random.default_rng(seed)
+    points, labels = [], []
+    for name, curls in POSES.items():
+        for _ in range(n_per_pose):
+            c = np.clip(np.array(curls) + rng.normal(0, 10, 5), 0, None)
+            hand = posed_hand(c, roll_deg=rng.uniform(-90, 90), yaw_deg=rng.uniform(-40, 40))
+            hand *= rng.uniform(0.7, 1.3)                         # distance to camera
+            points.append(hand + rng.normal(0, 0.001, hand.shape))
+            labels.append(name)
+    return np.array(points), np.array(labels)
+
+
+def test_normalization_is_pose_invariant():
+    a = normalize_landmarks(posed_hand(POSES["POINT"]))
+    b = normalize_landmarks(posed_hand(POSES["POINT"], roll_deg=75, yaw_deg=30) * 1.2 + 0.1)
+    assert a.shape == (63,)
+    assert np.allclose(a, b, atol=1e-9)
+
+
+@pytest.mark.parametrize("method", ["centroid", "knn"])
+def test_trains_and_generalizes(method):
+    x, y = dataset(seed=0)
+    model = PoseModel.fit(x, y, method=method)
+    x_test, y_test = dataset(n_per_pose=20, seed=1)
+    pred = np.array(model.classes + ["UNKNOWN"])[model.predict(x_test)]
+    assert np.mean(pred == y_test) > 0.95
+
+
+def test_classify_is_drop_in(tmp_path):
+    x, y = dataset()
+    PoseModel.fit(x, y, method="knn").save(tmp_path / "poses.npz")
+    model = PoseModel.load(tmp_path / "poses.npz")
+    assert model.method == "knn"
+    assert model.classify(None) == HandPose.UNKNOWN
+    assert model.classify(posed_hand(POSES["FIST"], roll_deg=30)) == HandPose.FIST
+    assert model.classify(posed_hand(POSES["ROCK_ON"])) == "ROCK_ON"
+
+
+def test_unseen_pose_rejected():
+    x, y = dataset()
+    model = PoseModel.fit(x, y)
+    assert model.predict_label(posed_hand((0, 0, 0, 0, 0))) == "UNKNOWN"
@@ -44,3 +44,27 @@ def test_scroll_up_detected():
     result = sg.process(lm2, 0.2)
     assert result is not None
     assert result.direction == ScrollDirection.UP
+
+
+def test_scroll_interval_uses_timestamps():
+    sg = ScrollGesture(KineMouseConfig(), scroll_interval_ms=120)
+    sg.process(make_landmarks(thumb_y=0.5, ring_x=0.501, ring_y=0.5), 0.2, timestamp=0.0)
+    up = make_landmarks(thumb_y=0.42, ring_x=0.501, ring_y=0.42)
+    assert sg.process(up, 0.2, timestamp=0.033) is not None
+    assert sg.process(up, 0.2, timestamp=0.066) is None
+    assert sg.process(up, 0.2, timestamp=0.2) is not None
+
+
+def test_velocity_proportional_to_elevation():
+    sg = ScrollGesture(KineMouseConfig(scroll_speed=6.0))
+    sg.process(make_landmarks(thumb_y=0.5, ring_x=0.501, ring_y=0.5), 0.2, timestamp=0.0)
+    assert sg.active and sg.velocity == 0.0
+    sg.process(make_landmarks(thumb_y=0.46, ring_x=0.501, ring_y=0.46), 0.2, timestamp=0.033)
+    slow = sg.velocity
+    sg.process(make_landmarks(thumb_y=0.40, ring_x=0.501, ring_y=0.40), 0.2, timestamp=0.066)
+    assert 0 < slow < sg.velocity
+    assert sg.velocity == pytest.approx(6.0 * (0.10 - 0.02) / 0.04)
+    sg.process(make_landmarks(thumb_y=0.58, ring_x=0.501, ring_y=0.58), 0.2, timestamp=0.1)
+    assert sg.velocity < 0    # below the baseline scrolls down
+    sg.process(make_landmarks(thumb_x=0.5, ring_x=0.8), 0.2, timestamp=0.133)
+    assert not sg.active and sg.velocity == 0.0
@@ -0,0 +1,83 @@
+"""Unit tests for SensitivityController pointer mapping and acceleration."""
+
+import pytest
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.math_utils import map_to_screen
+from kinemouse.state.sensitivity import AccelerationCurve, SensitivityController
+
+SCREEN = (1920, 1080)
+
+
+def stroke(sens, points, start=0.0, fps=30.0, engaged=True):
+    """Map a sequence of hand points; return the screen positions."""
+    return [sens.map(p, start + i / fps, engaged, SCREEN) for i, p in enumerate(points)]
+
+
+def test_curve_table_matches_formula():
+    curve = AccelerationCurve(min_gain=0.5, max_gain=3.0, low_speed=0.1, high_speed=1.0, exponent=2.0)
+    assert curve.gain(0.0) == pytest.approx(0.5)
+    assert curve.gain(0.05) == pytest.approx(0.5)
+    t = (0.55 - 0.1) / 0.9
+    assert curve.gain(0.55) == pytest.approx(0.5 + 2.5 * t ** 2, abs=0.02)
+    assert curve.gain(1.0) == pytest.approx(3.0)
+    assert curve.gain(50.0) == pytest.approx(3.0)
+
+
+def test_curve_from_points_is_monotonic_interpolation():
+    curve = AccelerationCurve(points=[(0.0, 0.3), (0.2, 1.0), (1.0, 4.0)])
+    assert curve.gain(0.1) == pytest.approx(0.65, abs=0.01)
+    gains = [curve.gain(s / 100) for s in range(150)]
+    assert gains == sorted(gains)
+
+
+def test_default_is_plain_absolute_mapping():
+    config = KineMouseConfig()
+    sens = SensitivityController(config)
+    for p in [(0.3, 0.3), (0.5, 0.6), (0.7, 0.4)]:
+        assert sens.map(p, 0.0, True, SCREEN) == map_to_screen(p, config.active_box, SCREEN)
+
+
+def test_sensitivity_mode_applies_to_mapping():
+    config = KineMouseConfig()
+    sens = SensitivityController(config)
+    sens.set_mode("slow")
+    assert sens.map((0.3, 0.3), 0.0, True, SCREEN) == map_to_screen((0.3, 0.3), sens.adjusted_active_box, SCREEN)
+    assert sens.map((0.3, 0.3), 0.0, True, SCREEN) != map_to_screen((0.3, 0.3), config.active_box, SCREEN)
+
+
+def test_relative_clutch_continues_from_cursor():
+    sens = SensitivityController(KineMouseConfig(pointer_mode="relative"))
+    first = stroke(sens, [(0.5 + 0.01 * i, 0.5) for i in range(11)])
+    # Clutch open: the hand returns to the left; the cursor stays put
+    assert stroke(sens, [(0.45, 0.5)], start=1.0, engaged=False) == [first[-1]]
+    second = stroke(sens, [(0.45 + 0.01 * i, 0.5) for i in range(11)], start=2.0)
+    assert second[0] == first[-1]
+    assert second[-1][0] - first[0][0] == pytest.approx(2 * (first[-1][0] - first[0][0]), abs=2)
+
+
+def test_relative_cursor_clamps_to_screen():
+    sens = SensitivityController(KineMouseConfig(pointer_mode="relative"))
+    positions = stroke(sens, [(0.5 + 0.05 * i, 0.5) for i in range(30)])
+    assert positions[-1][0] == SCREEN[0] - 1
+
+
+def test_accel_slow_moves_less_than_fast():
+    config = KineMouseConfig(pointer_mode="relative", pointer_accel=True)
+    distance = 0.1
+    slow = SensitivityController(config)
+    fast = SensitivityController(config)
+    s = stroke(slow, [(0.5 + distance * i / 60, 0.5) for i in range(61)])       # 0.05 units/s
+    f = stroke(fast, [(0.5 + distance * i / 3, 0.5) for i in range(4)])         # 1.0 units/s
+    unit_px = distance * SCREEN[0] / (config.active_box[2] - config.active_box[0])
+    assert s[-1][0] - s[0][0] == pytest.approx(unit_px * config.accel_min_gain, rel=0.05)
+    assert f[-1][0] - f[0][0] == pytest.approx(unit_px * config.accel_max_gain, rel=0.05)
+
+
+def test_absolute_accel_reanchors_each_stroke():
+    config = KineMouseConfig(pointer_accel=True)
+    sens = SensitivityController(config)
+    stroke(sens, [(0.5 + 0.03 * i, 0.5) for i in range(5)])
+    sens.release()
+    start = stroke(sens, [(0.4, 0.4)], start=1.0)[0]
+    assert start == map_to_screen((0.4, 0.4), config.active_box, SCREEN)
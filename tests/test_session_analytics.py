@@ -0,0 +1,92 @@
+"""Tests for the session gesture-quality analytics."""
+
+import numpy as np
+import pytest
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.session_io import RecordedSession
+from kinemouse.utils.session_analytics import aggregate, analyze_history, analyze_session
+from kinemouse.state.events import click_event, mouse_down_event, mouse_up_event
+from kinemouse.state.gesture_history import GestureHistory
+
+FPS = 30.0
+
+
+def scripted(segments, noise=0.0, seed=0):
+    """
+    A session from (frames, pinch, (vx, vy) units/s, found) segments; the
+    pinch midpoint starts at the center of the active box.
+    """
+    rng = np.random.default_rng(seed)
+    rows, found, pos = [], [], np.array([0.5, 0.5])
+    for frames, pinch, vel, visible in segments:
+        for _ in range(frames):
+            pos = pos + np.asarray(vel) / FPS
+            hand = np.zeros((21, 3))
+            mid = pos + rng.normal(0.0, noise, 2)
+            hand[:, :2] = mid + (0.0, -0.05)
+            hand[4, :2] = mid - (0.002, 0) if pinch else mid - (0.05, 0)
+            hand[8, :2] = mid + (0.002, 0) if pinch else mid + (0.05, 0)
+            hand[5, :2] = mid + (0.0, 0.1)
+            hand[0, :2] = hand[5, :2] + (0.0, 0.2)             # D_ref = 0.2
+            rows.append(hand if visible else np.full((21, 3), np.nan))
+            found.append(visible)
+    n = len(rows)
+    return RecordedSession(np.arange(n) / FPS, np.array(rows), np.array(found), (1920, 1080), "scripted")
+
+
+OPEN = (20, False, (0, 0), True)
+
+
+def test_clean_and_accidental_clicks():
+    session = scripted([OPEN, (6, True, (0, 0), True), OPEN,
+                        (2, True, (0, 0), True), OPEN])
+    report = analyze_session(session, KineMouseConfig())
+    assert report.clicks == 2
+    assert report.accidental_clicks == 1
+
+
+def test_click_that_travels_is_accidental():
+    session = scripted([OPEN, (8, True, (0.3, 0), True), OPEN])
+    report = analyze_session(session, KineMouseConfig())
+    assert report.clicks == 1 and report.accidental_clicks == 1
+
+
+def test_drag_broken_by_tracking_loss_and_regrab():
+    grab = [(4, True, (0, 0), True), (3, False, (0, 0), True)]
+    session = scripted([OPEN, *grab, (20, True, (0.2, 0), True), (10, False, (0, 0), False), OPEN,
+                        *grab, (20, True, (0, 0), True), (2, False, (0, 0), True),
+                        *grab, (20, True, (0, 0), True), OPEN])
+    report = analyze_session(session, KineMouseConfig())
+    assert report.drags == 3
+    assert report.broken_drags == 2          # lost mid-drag, then released and re-grabbed on the spot
+
+
+def test_jitter_and_lag_follow_smoothing():
+    segments = [OPEN, (60, True, (0, 0), True), (30, True, (0.5, 0), True), (30, True, (0, 0), True), OPEN]
+    session = scripted(segments, noise=0.002, seed=1)
+    smooth = analyze_session(session, KineMouseConfig(ema_alpha=0.1))
+    snappy = analyze_session(session, KineMouseConfig(ema_alpha=0.6))
+    assert smooth.jitter_samples > 30 and smooth.lag_samples > 10
+    assert smooth.hover_jitter_px < snappy.hover_jitter_px
+    assert smooth.sweep_lag_ms > snappy.sweep_lag_ms > 0
+    assert analyze_session(session, KineMouseConfig(pointer_mode="relative")).sweep_lag_ms is None
+
+
+def test_history_and_aggregate():
+    history = GestureHistory(100)
+    history.record(click_event(1, 1), timestamp=0.0)
+    history.record(mouse_down_event(5, 5), timestamp=1.0)
+    history.record(mouse_up_event(50, 5), timestamp=1.5)
+    history.record(mouse_down_event(52, 6), timestamp=1.7)     # re-grab 200 ms later
+    history.record(mouse_up_event(90, 5), timestamp=2.5)
+    h = analyze_history(history.last_n(len(history)), "history")
+    assert (h.clicks, h.drags, h.broken_drags, h.accidental_clicks) == (1, 2, 1, None)
+
+    s = analyze_session(scripted([OPEN, (2, True, (0, 0), True), OPEN]), KineMouseConfig())
+    total = aggregate([s, h])
+    assert total["sessions"] == 2
+    assert total["clicks"] == 2
+    assert total["accidental_click_rate"] == pytest.approx(1.0)   # only the session's click is judged
+    assert total["broken_drag_rate"] == pytest.approx(0.5)
+    assert total["counts"]["CLICK"] == 2
@@ -0,0 +1,96 @@
+"""Tests for shadow-mode evaluation of candidate configs on live frames."""
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import apply_overrides
+from kinemouse.state.events import EventType
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.shadow_eval import ShadowEvaluator
+
+SCREEN_RES = (1920, 1080)
+
+
+def make_frames(n=400, seed=0):
+    """Random-walk hand with index-pinch bursts and dropouts, as per-frame landmark lists."""
+    rng = np.random.default_rng(seed)
+    lm = np.tile(rng.uniform(0.3, 0.7, size=(1, 21, 3)), (n, 1, 1))
+    lm[:, :, :2] += np.cumsum(rng.normal(0, 0.004, size=(n, 1, 2)), axis=0)
+    lm[:, 0, :2] = lm[:, 5, :2] + (0.0, 0.2)
+    state = rng.integers(0, 4, size=n // 8).repeat(8)[:n]
+    lm[state == 1, 8, :2] = lm[state == 1, 4, :2] + 0.005
+    timestamps = np.cumsum(rng.uniform(0.02, 0.05, size=n)).tolist()
+    frames = [None if s == 3 else [SimpleNamespace(x=p[0], y=p[1], z=p[2]) for p in f]
+              for f, s in zip(lm.tolist(), state)]
+    return frames, timestamps
+
+
+def replay(shadows, config, frames, timestamps, threaded=False):
+    active = GestureFSM(config, SCREEN_RES)
+    for landmarks, t in zip(frames, timestamps):
+        event = active.process(landmarks, timestamp=t)
+        if threaded:
+            shadows.submit(landmarks, t, event)
+        else:
+            shadows.process(landmarks, t, (event.type.value, event.position))
+
+
+def test_identical_shadow_agrees():
+    config = KineMouseConfig()
+    shadows = ShadowEvaluator(config, SCREEN_RES, {"same": {}})
+    frames, ts = make_frames()
+    replay(shadows, config, frames, ts)
+    r = shadows.report()["same"]
+    assert r["frames"] == len(frames)
+    assert r["agreement"] == 1.0
+    assert r["divergences"] == 0
+    assert r["cursor_error_px"] == 0.0
+    assert r["shadow_counts"] == r["active_counts"]
+
+
+def test_different_config_diverges():
+    config = KineMouseConfig()
+    shadows = ShadowEvaluator(config, SCREEN_RES, {"speculative": {"click_mode": "speculative"},
+                                                   "smooth": {"ema_alpha": 0.05}})
+    frames, ts = make_frames(seed=1)
+    replay(shadows, config, frames, ts)
+    r = shadows.report()
+    assert r["speculative"]["divergences"] > 0
+    assert r["speculative"]["agreement"] < 1.0
+    assert r["smooth"]["cursor_error_px"] > 0
+
+
+def test_submit_never_blocks():
+    config = KineMouseConfig()
+    shadows = ShadowEvaluator(config, SCREEN_RES, {"same": {}}, queue_size=2)
+    event = GestureFSM(config, SCREEN_RES).process(None, timestamp=0.0)
+    for i in range(5):        # worker not started: the queue fills and frames are dropped
+        shadows.submit(None, i / 30, event)
+    assert shadows.dropped == 3
+
+
+def test_worker_logs_shadow_events(tmp_path):
+    config = KineMouseConfig()
+    log_path = tmp_path / "shadow.jsonl"
+    shadows = ShadowEvaluator(config, SCREEN_RES, {"spec": {"click_mode": "speculative"}},
+                              queue_size=10_000, log_path=str(log_path))
+    shadows.start()
+    frames, ts = make_frames(seed=2)
+    replay(shadows, config, frames, ts, threaded=True)
+    shadows.stop()
+    assert shadows.report()["spec"]["frames"] == len(frames)
+    rows = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert rows and {r["shadow"] for r in rows} == {"spec"}
+    assert all(r["type"] != EventType.IDLE.name for r in rows)
+
+
+def test_apply_overrides_rejects_unknown_keys():
+    config = KineMouseConfig()
+    assert apply_overrides(config, {"ema_alpha": 0.1}).ema_alpha == 0.1
+    assert config.ema_alpha == 0.25
+    with pytest.raises(ValueError):
+        apply_overrides(config, {"ema_alfa": 0.1})
@@ -0,0 +1,135 @@
+"""Unit tests for momentum scrolling, the hi-res scroll path and the periodic timer."""
+
+import time
+
+import pytest
+
+from kinemouse.backends.base_backend import BaseBackend
+from kinemouse.backends.smooth_scroll import ScrollMomentum, SmoothScroller, WHEEL_UNITS
+from kinemouse.state.events import EventType, scroll_event
+from kinemouse.state.scroll_gesture import ScrollDirection
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.hires_timer import PeriodicTimer
+
+
+def run_momentum(m, seconds, rate=120.0, start=0.0):
+    """Step at `rate` Hz for `seconds`; return the total units sent."""
+    total = 0
+    n = int(round(seconds * rate))
+    for i in range(1, n + 1):
+        total += m.step(start + i / rate)
+    return total
+
+
+def test_constant_velocity_integrates_exactly():
+    m = ScrollMomentum(response_ms=0)
+    m.set_target(5.0)
+    m.step(0.0)
+    total = run_momentum(m, 2.0)
+    # Fractions carry, so only the first step's ramp from rest is missing
+    assert 0 <= 5.0 * 2.0 * WHEEL_UNITS - total <= 5.0 * WHEEL_UNITS / 120
+
+
+def test_release_coasts_then_stops():
+    m = ScrollMomentum(friction_ms=300, response_ms=0)
+    m.set_target(10.0)
+    m.step(0.0)
+    run_momentum(m, 0.5)
+    m.release()
+    coast = run_momentum(m, 3.0, start=0.5)
+    # Exponential decay: distance ≈ v·τ notches
+    assert coast == pytest.approx(10.0 * 0.3 * WHEEL_UNITS, rel=0.1)
+    assert m.idle
+
+
+def test_zero_friction_stops_at_release():
+    m = ScrollMomentum(friction_ms=0, response_ms=0)
+    m.set_target(-8.0)
+    m.step(0.0)
+    assert run_momentum(m, 0.5) < 0
+    m.release()
+    run_momentum(m, 1 / 120, start=0.5)
+    assert m.idle
+    assert run_momentum(m, 0.5, start=0.6) == 0
+
+
+class _FakeBackend(BaseBackend):
+    def __init__(self, config=None):
+        super().__init__(config or KineMouseConfig())
+        self.hires = []
+        self.notches = []
+
+    def get_screen_resolution(self):
+        return (1920, 1080)
+
+    def move(self, x, y): pass
+    def click(self, x, y): pass
+    def right_click(self, x, y): pass
+    def mouse_down(self, x, y): pass
+    def mouse_up(self, x, y): pass
+
+    def scroll(self, direction, magnitude=1):
+        self.notches.append(magnitude if direction == ScrollDirection.UP else -magnitude)
+
+
+def test_base_backend_accumulates_hires_into_notches():
+    backend = _FakeBackend()
+    for _ in range(10):
+        backend.scroll_hires(30)           # 300 units = 2.5 notches
+    assert backend.notches == [1, 1]
+    backend.dispatch(scroll_event(-3 * 120))   # the pending +60 offsets part of it
+    assert backend.notches == [1, 1, -2]
+
+
+class _Sink:
+    def __init__(self):
+        self.events = []
+
+    def submit(self, event):
+        self.events.append(event)
+
+
+def test_smooth_scroller_thread_delivers_units():
+    sink = _Sink()
+    scroller = SmoothScroller(sink, KineMouseConfig(scroll_friction_ms=0))
+    scroller.start()
+    try:
+        scroller.set_velocity(20.0)
+        time.sleep(0.2)
+        scroller.release()
+        time.sleep(0.05)
+    finally:
+        scroller.stop()
+    units = [e.amount for e in sink.events]
+    assert all(e.type == EventType.SCROLL for e in sink.events)
+    assert len(units) > 10                  # many small steps, not a few coarse ticks
+    assert all(u > 0 for u in units)
+    assert sum(units) == pytest.approx(20.0 * 0.2 * WHEEL_UNITS, rel=0.4)
+
+
+def test_set_velocity_during_idle_reset_is_kept():
+    sink = _Sink()
+    scroller = SmoothScroller(sink, KineMouseConfig(scroll_friction_ms=0))
+    scroller.start()
+    try:
+        for _ in range(20):                 # gesture flickering on and off
+            scroller.set_velocity(20.0)
+            time.sleep(0.005)
+            scroller.release()
+            time.sleep(0.005)
+        scroller.set_velocity(20.0)
+        time.sleep(0.1)
+        assert scroller.momentum.target == 20.0
+    finally:
+        scroller.stop()
+    assert sink.events
+
+
+@pytest.mark.parametrize("use_timerfd", [True, False])
+def test_periodic_timer_keeps_rate(use_timerfd):
+    with PeriodicTimer(0.005, use_timerfd=use_timerfd) as timer:
+        start = time.monotonic()
+        ticks = sum(timer.wait() for _ in range(10))
+        elapsed = time.monotonic() - start
+    assert ticks >= 10
+    assert elapsed == pytest.approx(ticks * 0.005, abs=0.01)
@@ -0,0 +1,105 @@
+"""Tests for the tremor band-stop filter and the sliding-DFT frequency estimator."""
+
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.state.gesture_fsm import GestureFSM
+from kinemouse.state.tremor_filter import TremorEstimator, TremorFilter
+
+FS = 30.0
+
+
+def _run(f, x, y, t):
+    return np.array([f((a, b), c) for a, b, c in zip(x.tolist(), y.tolist(), t.tolist())])
+
+
+def _amplitude(signal, freq, t):
+    """Amplitude of one sinusoidal component (least squares)."""
+    basis = np.stack([np.sin(2 * np.pi * freq * t), np.cos(2 * np.pi * freq * t), np.ones_like(t)], axis=1)
+    coef = np.linalg.lstsq(basis, signal, rcond=None)[0]
+    return float(np.hypot(coef[0], coef[1]))
+
+
+def test_removes_tremor_keeps_slow_motion():
+    t = np.arange(0, 10, 1 / FS)
+    slow = 0.1 * np.sin(2 * np.pi * 0.5 * t)
+    x = 0.5 + slow + 0.01 * np.sin(2 * np.pi * 8 * t)
+    out = _run(TremorFilter(center_hz=8.0), x, np.full_like(t, 0.5), t)[60:, 0]
+    assert _amplitude(out, 8.0, t[60:]) < 0.001
+    assert _amplitude(out, 0.5, t[60:]) == pytest.approx(0.1, rel=0.02)
+
+
+def test_primed_on_first_sample():
+    f = TremorFilter()
+    t = np.arange(0, 1, 1 / FS)
+    out = _run(f, np.full_like(t, 0.7), np.full_like(t, 0.3), t)
+    assert np.allclose(out, (0.7, 0.3))
+
+
+def test_measured_ramp_lag_matches_group_delay():
+    f = TremorFilter(center_hz=8.0, bandwidth_hz=6.0)
+    t = np.arange(0, 4, 1 / FS)
+    x = 0.2 + 0.1 * t                                  # steady sweep
+    out = _run(f, x, np.zeros_like(t), t)[:, 0]
+    lag_s = float(np.mean((x[60:] - out[60:]) / 0.1))
+    assert lag_s == pytest.approx(f.delay_s(0.0), abs=0.002)
+    assert 0 < f.delay_s(1.0) < 0.03                   # far below an EMA with the same tremor rejection
+
+
+def test_estimator_finds_tremor_frequency():
+    rng = np.random.default_rng(0)
+    t = np.arange(0, 6, 1 / FS)
+    x = 0.1 * np.sin(2 * np.pi * 0.3 * t) + 0.004 * np.sin(2 * np.pi * 5.5 * t) + rng.normal(0, 5e-4, len(t))
+    est = TremorEstimator(window=64)
+    for dx in np.diff(x):
+        est.update(dx, 0.0)
+    assert est.estimate(FS) == pytest.approx(5.5, abs=0.3)
+
+
+def test_estimator_ignores_plain_motion():
+    t = np.arange(0, 6, 1 / FS)
+    est = TremorEstimator(window=64)
+    for dx in np.diff(0.2 * np.sin(2 * np.pi * 0.4 * t)):
+        est.update(dx, dx)
+    assert est.estimate(FS) is None
+
+
+def test_adaptive_notch_follows_user_and_round_trips():
+    t = np.arange(0, 20, 1 / FS)
+    x = 0.5 + 0.005 * np.sin(2 * np.pi * 5.0 * t)
+    f = TremorFilter(center_hz=9.0, bandwidth_hz=3.0, adaptive=True)
+    _run(f, x, np.full_like(t, 0.5), t)
+    assert f.center_hz == pytest.approx(5.0, abs=0.3)
+
+    g = TremorFilter()
+    g.load_state(f.state())
+    assert g.center_hz == f.center_hz
+    f.reset()                                          # hand lost keeps what was learned
+    assert f.center_hz == g.center_hz
+
+
+def test_fsm_tremor_filter_steadies_cursor():
+    t = np.arange(0, 4, 1 / FS)
+    wobble = 0.01 * np.sin(2 * np.pi * 8 * t)
+
+    def cursor_xs(config):
+        fsm = GestureFSM(config, (1920, 1080))
+        xs, x = [], None
+        for ti, w in zip(t.tolist(), wobble.tolist()):
+            pts = [SimpleNamespace(x=0.5, y=0.5, z=0.0) for _ in range(21)]
+            pts[0] = SimpleNamespace(x=0.5, y=0.7, z=0.0)              # D_ref = 0.2
+            pts[4] = SimpleNamespace(x=0.5 + w, y=0.5, z=0.0)
+            pts[8] = SimpleNamespace(x=0.5 + w + 0.005, y=0.5, z=0.0)  # index pinch
+            for tip in (12, 16, 20):
+                pts[tip] = SimpleNamespace(x=0.9, y=0.5, z=0.0)
+            event = fsm.process(pts, timestamp=ti)
+            if event.position is not None:
+                x = event.position[0]          # repeats of the last position are not re-sent
+            xs.append(x)
+        return np.array(xs[60:])
+
+    raw = cursor_xs(KineMouseConfig(ema_alpha=0.9))
+    filtered = cursor_xs(KineMouseConfig(ema_alpha=0.9, tremor_filter=True))
+    assert np.ptp(filtered) < np.ptp(raw) / 5
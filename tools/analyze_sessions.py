@@ -0,0 +1,115 @@
+"""
+analyze_sessions.py — gesture-quality report for a config over a corpus.
+
+Each input file is analyzed in a worker process (load, batch replay,
+metrics), so large corpora use every core. Inputs are recorded sessions
+(.json / .npz from examples/record_session.py) or event histories
+(GestureHistory .json / .npz / .kmh, SQLiteHistoryStore .db); histories
+get the event-based metrics only. See kinemouse/utils/session_analytics.py
+for the metric definitions.
+
+The JSON report holds one entry per file plus the corpus aggregate.
+
+Usage:
+    python tools/analyze_sessions.py sessions/*.npz
+    python tools/analyze_sessions.py sessions/*.json --config candidate.json --json report.json
+    python tools/analyze_sessions.py corpus/**/*.npz --workers 8
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_config
+from kinemouse.utils.session_io import load_session, session_from_json
+from kinemouse.utils.session_analytics import (
+    AnalysisThresholds, SessionReport, aggregate, analyze_history, analyze_session,
+)
+from kinemouse.state.gesture_history import GestureHistory, records_from_json
+from kinemouse.state.history_store import read_events
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("analyze")
+
+
+def analyze_file(path: str, config: KineMouseConfig, thresholds: AnalysisThresholds) -> SessionReport:
+    """Worker: one file → one report."""
+    p = Path(path)
+    if p.suffix == ".db":
+        return analyze_history(read_events(str(p)), p.stem, thresholds)
+    if p.suffix == ".kmh":
+        history = GestureHistory(path=str(p))
+        return analyze_history(history.last_n(len(history)).copy(), p.stem, thresholds)
+    if p.suffix == ".npz":
+        with np.load(p) as data:
+            # GestureHistory.save() writes "records"; sessions hold "landmarks"
+            if "records" in data.files:
+                return analyze_history(data["records"], p.stem, thresholds)
+        return analyze_session(load_session(p), config, thresholds)
+    data = json.loads(p.read_text())
+    # GestureHistory.save() writes {"records": [...], "counts": {...}}; sessions hold "frames"
+    if isinstance(data, dict) and "records" in data:
+        records, _ = records_from_json(data)
+        return analyze_history(records, p.stem, thresholds)
+    return analyze_session(session_from_json(data, p.stem), config, thresholds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture-quality analytics over recorded sessions")
+    parser.add_argument("files", nargs="+", help="Session or history files")
+    parser.add_argument("--config", default=None, help="Config JSON to evaluate (default: built-in defaults)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--json", default=None, help="Write the full report to this JSON file")
+    parser.add_argument("--min-click-pinch-ms", type=float, default=AnalysisThresholds.min_click_pinch_ms)
+    parser.add_argument("--drag-rejoin-ms", type=float, default=AnalysisThresholds.drag_rejoin_ms)
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    config = load_config(Path(args.config)) if args.config else KineMouseConfig()
+    thresholds = AnalysisThresholds(
+        min_click_pinch_ms=args.min_click_pinch_ms,
+        drag_rejoin_ms=args.drag_rejoin_ms,
+    )
+
+    t0 = time.perf_counter()
+    n = len(args.files)
+    if args.workers > 1 and n > 1:
+        with ProcessPoolExecutor(max_workers=min(args.workers, n)) as pool:
+            reports = list(pool.map(
+                analyze_file, args.files, [config] * n, [thresholds] * n,
+                chunksize=max(1, n // (4 * args.workers)),
+            ))
+    else:
+        reports = [analyze_file(f, config, thresholds) for f in args.files]
+    elapsed = time.perf_counter() - t0
+
+    for r in reports:
+        log.info("%-30s jitter=%s px  lag=%s ms  clicks=%d (accidental %s)  drags=%d (broken %d)",
+                 r.name, _fmt(r.hover_jitter_px), _fmt(r.sweep_lag_ms), r.clicks,
+                 "-" if r.accidental_clicks is None else r.accidental_clicks, r.drags, r.broken_drags)
+    total = aggregate(reports)
+    log.info("Aggregate: %s", {k: v for k, v in total.items() if k != "counts"})
+    log.info("Analyzed %d files (%d frames) in %.2fs", n, total["frames"], elapsed)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(
+            {"config": args.config, "sessions": [r.to_dict() for r in reports], "aggregate": total},
+            indent=2,
+        ))
+
+
+def _fmt(value) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+if __name__ == "__main__":
+    main()
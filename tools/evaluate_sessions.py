@@ -0,0 +1,61 @@
+"""
+evaluate_sessions.py — evaluate a config against many recorded sessions at once.
+
+Runs the vectorized BatchGestureEvaluator over every session (no webcam,
+no sleeping through the recording) and prints per-session event counts.
+Config overrides use the same keys as ~/.kinemouse/config.json.
+
+Usage:
+    python tools/evaluate_sessions.py sessions/*.json
+    python tools/evaluate_sessions.py sessions/*.npz --config candidate.json
+    python tools/evaluate_sessions.py sessions/*.json --cache-npz   # write .npz next to each .json
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_config
+from kinemouse.utils.session_io import load_session, save_session_npz
+from kinemouse.state.batch_fsm import BatchGestureEvaluator
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("evaluate")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-evaluate a config on recorded sessions")
+    parser.add_argument("files", nargs="+", help="Session files (.json or .npz)")
+    parser.add_argument("--config", default=None, help="Config JSON to evaluate (default: built-in defaults)")
+    parser.add_argument("--cache-npz", action="store_true", help="Save a .npz copy of each JSON session")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    config = load_config(Path(args.config)) if args.config else KineMouseConfig()
+    evaluator = BatchGestureEvaluator(config)
+
+    sessions = []
+    for f in args.files:
+        session = load_session(f)
+        if args.cache_npz and Path(f).suffix == ".json":
+            save_session_npz(session, Path(f).with_suffix(".npz"))
+        sessions.append(session)
+
+    total_frames = sum(len(s) for s in sessions)
+    t0 = time.perf_counter()
+    results = evaluator.evaluate_many(sessions)
+    elapsed = time.perf_counter() - t0
+
+    for session, result in zip(sessions, results):
+        counts = {k: v for k, v in result.counts().items() if k != "IDLE"}
+        log.info("%-30s frames=%-6d %s", session.name, len(session), counts)
+
+    log.info("Evaluated %d sessions (%d frames) in %.3fs", len(sessions), total_frames, elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+filter_report.py — compare cursor smoothing filters on recorded sessions.
+
+For each session the raw pinch midpoint is run through the One Euro filter
+(parameters from the config) and through the fixed-alpha EMA. The EMA alpha
+is calibrated so both filters have the SAME jitter while the hand is still;
+the report then shows how much lag each adds during motion at that jitter.
+
+Jitter is the RMS frame-to-frame cursor step (screen pixels) while the hand
+is still; lag is the median delay (ms) behind the intended hand position
+while moving.
+
+Usage:
+    python tools/filter_report.py sessions/*.json
+    python tools/filter_report.py sessions/*.npz --config candidate.json --json report.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_config
+from kinemouse.utils.math_utils import OneEuroFilter, ema_smooth
+from kinemouse.utils.session_io import load_session
+from kinemouse.utils import signal_metrics as sm
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("filter_report")
+
+STILL_SPEED = 0.03    # normalized units/s — below this the hand counts as still
+MOVING_SPEED = 0.3    # normalized units/s — above this the hand counts as sweeping
+
+
+class _EMA:
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.state = None
+
+    def __call__(self, point, t):
+        self.state = point if self.state is None else ema_smooth(point, self.state, self.alpha)
+        return self.state
+
+
+def prepare(session, config: KineMouseConfig) -> dict:
+    """Raw midpoint trajectory of found frames plus intent/still/moving masks."""
+    lm = session.landmarks[session.found]
+    t = session.timestamps[session.found]
+    restart = sm.segment_restarts(session.found)[session.found]
+    raw = (lm[:, config.THUMB_TIP, :2] + lm[:, config.INDEX_TIP, :2]) / 2.0
+    intent = sm.intent_trajectory(raw, restart)
+    v = sm.speed(intent, t, restart)
+    box = config.active_box
+    px_per_unit = session.screen_res[0] / (box[2] - box[0])
+    return dict(name=session.name, raw=raw, t=t, restart=restart, intent=intent,
+                speed=v, still=v < STILL_SPEED, moving=v > MOVING_SPEED, px=px_per_unit)
+
+
+def measure(s: dict, make_filter) -> tuple:
+    out = sm.run_filter(s["raw"], s["t"], s["restart"], make_filter)
+    jitter = sm.stillness_jitter(out, s["restart"], s["still"]) * s["px"]
+    lag = sm.tracking_lag_ms(out, s["intent"], s["speed"], s["moving"])
+    return jitter, lag
+
+
+def corpus_jitter(prepared, make_filter) -> float:
+    return float(np.mean([measure(s, make_filter)[0] for s in prepared]))
+
+
+def calibrate_ema(prepared, target_jitter: float) -> float:
+    """Bisect the EMA alpha whose stillness jitter matches the target."""
+    lo, hi = 0.005, 1.0
+    for _ in range(20):
+        mid = (lo + hi) / 2
+        if corpus_jitter(prepared, lambda: _EMA(mid)) > target_jitter:
+            hi = mid
+        else:
+            lo = mid
+    return (lo + hi) / 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lag/jitter report: One Euro vs EMA")
+    parser.add_argument("files", nargs="+", help="Session files (.json or .npz)")
+    parser.add_argument("--config", default=None, help="Config JSON with one_euro_* parameters")
+    parser.add_argument("--json", default=None, help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    config = load_config(Path(args.config)) if args.config else KineMouseConfig()
+    prepared = [prepare(load_session(f), config) for f in args.files]
+
+    def one_euro():
+        return OneEuroFilter(config.one_euro_min_cutoff, config.one_euro_beta, config.one_euro_d_cutoff)
+
+    target = corpus_jitter(prepared, one_euro)
+    alpha = calibrate_ema(prepared, target)
+    log.info("One Euro (min_cutoff=%.2f, beta=%.2f): stillness jitter %.2f px; "
+             "EMA matched at alpha=%.3f (configured alpha=%.2f)",
+             config.one_euro_min_cutoff, config.one_euro_beta, target, alpha, config.ema_alpha)
+
+    report = {"ema_alpha_matched": alpha, "sessions": []}
+    for s in prepared:
+        oe_jitter, oe_lag = measure(s, one_euro)
+        ema_jitter, ema_lag = measure(s, lambda: _EMA(alpha))
+        cur_jitter, cur_lag = measure(s, lambda: _EMA(config.ema_alpha))
+        row = {
+            "session": s["name"],
+            "one_euro": {"jitter_px": oe_jitter, "lag_ms": oe_lag},
+            "ema_matched": {"jitter_px": ema_jitter, "lag_ms": ema_lag},
+            "ema_current": {"jitter_px": cur_jitter, "lag_ms": cur_lag},
+        }
+        report["sessions"].append(row)
+        log.info("%-24s one_euro %5.2fpx %6.1fms | ema(matched) %5.2fpx %6.1fms | ema(current) %5.2fpx %6.1fms",
+                 s["name"], oe_jitter, oe_lag, ema_jitter, ema_lag, cur_jitter, cur_lag)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
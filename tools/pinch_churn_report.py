@@ -0,0 +1,111 @@
+"""
+pinch_churn_report.py — measure what pinch hysteresis / dwell buys on recorded sessions.
+
+For each session the index, middle and ring pinches are computed twice:
+with the single pinch_threshold cutoff (baseline) and with the candidate
+pinch_release_threshold / pinch_dwell_frames. The report shows pinch
+toggles per minute of tracked hand, and the MOUSE_DOWN / MOUSE_UP / CLICK /
+RIGHT_CLICK events each setting produces when the session is replayed
+through BatchGestureEvaluator — every spurious toggle near the threshold
+shows up there as an extra click or drag.
+
+Usage:
+    python tools/pinch_churn_report.py sessions/*.npz --release 0.2 --dwell 2
+    python tools/pinch_churn_report.py sessions/*.json --config candidate.json --json churn.json
+"""
+
+import sys
+import json
+import argparse
+import dataclasses
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_config
+from kinemouse.utils.session_io import load_session
+from kinemouse.state.batch_fsm import BatchGestureEvaluator
+from kinemouse.state.events import EventType
+from kinemouse.state.hand_features import batch_distances
+from kinemouse.state.pinch_debouncer import debounce_series, pinch_toggles
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("pinch_churn")
+
+FINGERS = ("index", "middle", "ring")
+EVENTS = (EventType.MOUSE_DOWN, EventType.MOUSE_UP, EventType.CLICK, EventType.RIGHT_CLICK)
+
+
+def pinch_series(session, config: KineMouseConfig) -> np.ndarray:
+    """(N, 3) debounced index/middle/ring pinch flags under config, as the FSM sees them."""
+    found = np.asarray(session.found, dtype=bool)
+    pts = np.where(found[:, None, None], session.landmarks, 0.0)
+    dist = batch_distances(pts, config)
+    dref = dist[:, 4]
+    active = found & (dref != 0)
+    return debounce_series(
+        dist[:, :3], dref, config.pinch_threshold, config.pinch_release_threshold, config.pinch_dwell_frames,
+        restart=found & ~np.concatenate(([False], found[:-1])), hold=~active,
+    ) & active[:, None]
+
+
+def churn(session, config: KineMouseConfig) -> dict:
+    """Toggles per minute per finger and the emitted button events for one config."""
+    pinch = pinch_series(session, config)
+    t = np.asarray(session.timestamps, dtype=np.float64)
+    found = np.asarray(session.found, dtype=bool)
+    dt = np.diff(t, prepend=t[:1])
+    minutes = max(float(dt[found].sum()) / 60.0, 1e-9)
+    counts = BatchGestureEvaluator(config).evaluate_session(session).counts()
+    return {
+        "toggles_per_min": {f: pinch_toggles(pinch[:, i]) / minutes for i, f in enumerate(FINGERS)},
+        "events": {e.name: counts.get(e.name, 0) for e in EVENTS},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pinch toggle / spurious event report: single threshold vs hysteresis")
+    parser.add_argument("files", nargs="+", help="Session files (.json or .npz)")
+    parser.add_argument("--config", default=None, help="Config JSON to evaluate (default: built-in defaults)")
+    parser.add_argument("--release", type=float, default=None, help="Override pinch_release_threshold")
+    parser.add_argument("--dwell", type=int, default=None, help="Override pinch_dwell_frames")
+    parser.add_argument("--json", default=None, help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    candidate = load_config(Path(args.config)) if args.config else KineMouseConfig()
+    if args.release is not None:
+        candidate.pinch_release_threshold = args.release
+    if args.dwell is not None:
+        candidate.pinch_dwell_frames = args.dwell
+    baseline = dataclasses.replace(
+        candidate, pinch_release_threshold=candidate.pinch_threshold, pinch_dwell_frames=1,
+    )
+    log.info("Baseline threshold %.3f vs release %.3f, dwell %d",
+             candidate.pinch_threshold, candidate.pinch_release_threshold, candidate.pinch_dwell_frames)
+
+    report = {"config": args.config, "release": candidate.pinch_release_threshold,
+              "dwell": candidate.pinch_dwell_frames, "sessions": []}
+    for f in args.files:
+        session = load_session(f)
+        before, after = churn(session, baseline), churn(session, candidate)
+        report["sessions"].append({"session": session.name, "baseline": before, "candidate": after})
+        log.info("%-24s toggles/min %s → %s | down/up/click/right %s → %s",
+                 session.name,
+                 _fmt(before["toggles_per_min"]), _fmt(after["toggles_per_min"]),
+                 "/".join(str(v) for v in before["events"].values()),
+                 "/".join(str(v) for v in after["events"].values()))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+def _fmt(rates: dict) -> str:
+    return " ".join(f"{k}={v:.1f}" for k, v in rates.items())
+
+
+if __name__ == "__main__":
+    main()
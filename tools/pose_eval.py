@@ -0,0 +1,113 @@
+"""
+pose_eval.py — accuracy and speed of the pose classifiers on labeled sessions.
+
+Runs the legacy tip/PIP classify_pose and the joint-angle PoseClassifier
+frame by frame over every labeled frame (see examples/record_session.py
+--label) and reports accuracy per pose, a confusion summary and the mean
+per-frame cost of each classifier (including feature extraction).
+
+Usage:
+    python tools/pose_eval.py sessions/*.json
+    python tools/pose_eval.py sessions/*.npz --hold-frames 1 --json report.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import DEFAULT_CONFIG
+from kinemouse.utils.session_io import load_session
+from kinemouse.state.hand_features import HandFeatures
+from kinemouse.state.gesture_classifier import PoseClassifier, classify_pose
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("pose_eval")
+
+
+def run_session(session, classifier: PoseClassifier) -> dict:
+    """Per-classifier predictions and total time over one session."""
+    classifier.reset()
+    preds = {"legacy": [], "angles": []}
+    elapsed = {"legacy": 0.0, "angles": 0.0}
+    for i in range(len(session)):
+        lm = session.landmarks[i] if session.found[i] else None
+
+        t0 = time.perf_counter()
+        legacy = classify_pose(lm, HandFeatures(lm, DEFAULT_CONFIG) if lm is not None else None)
+        t1 = time.perf_counter()
+        angles = classifier.classify(lm, HandFeatures(lm, DEFAULT_CONFIG) if lm is not None else None)
+        t2 = time.perf_counter()
+
+        elapsed["legacy"] += t1 - t0
+        elapsed["angles"] += t2 - t1
+        preds["legacy"].append(legacy.name)
+        preds["angles"].append(angles.name)
+    return {"preds": preds, "elapsed": elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate pose classifiers on labeled sessions")
+    parser.add_argument("files", nargs="+", help="Labeled session files (.json or .npz)")
+    parser.add_argument("--hold-frames", type=int, default=3, help="PoseClassifier hold frames")
+    parser.add_argument("--json", default=None, help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    classifier = PoseClassifier(hold_frames=args.hold_frames)
+
+    hits = {"legacy": Counter(), "angles": Counter()}
+    confusion = {"legacy": Counter(), "angles": Counter()}
+    totals = Counter()
+    elapsed = {"legacy": 0.0, "angles": 0.0}
+    frames = 0
+
+    for f in args.files:
+        session = load_session(f)
+        if session.labels is None:
+            log.warning("%s has no labels — skipped", f)
+            continue
+        out = run_session(session, classifier)
+        frames += len(session)
+        for name in elapsed:
+            elapsed[name] += out["elapsed"][name]
+        for i, label in enumerate(session.labels.tolist()):
+            if not label or not session.found[i]:
+                continue
+            totals[label] += 1
+            for name, preds in out["preds"].items():
+                if preds[i] == label:
+                    hits[name][label] += 1
+                else:
+                    confusion[name][f"{label}->{preds[i]}"] += 1
+
+    if not totals:
+        log.error("No labeled frames found")
+        sys.exit(1)
+
+    report = {"frames": frames, "labeled": sum(totals.values()), "classifiers": {}}
+    for name in ("legacy", "angles"):
+        per_pose = {pose: hits[name][pose] / n for pose, n in totals.items()}
+        overall = sum(hits[name].values()) / sum(totals.values())
+        us = elapsed[name] / max(frames, 1) * 1e6
+        report["classifiers"][name] = {
+            "accuracy": overall,
+            "per_pose": per_pose,
+            "top_confusions": confusion[name].most_common(5),
+            "us_per_frame": us,
+        }
+        log.info("%-7s accuracy %5.1f%%  %6.1f µs/frame  %s", name, overall * 100, us,
+                 "  ".join(f"{p}={a:.0%}" for p, a in sorted(per_pose.items())))
+        for pair, n in confusion[name].most_common(3):
+            log.info("          confused %s ×%d", pair, n)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+prediction_report.py — measure what latency compensation does on recorded sessions.
+
+The cursor drawn at time t reflects the frame captured at t - latency, so
+the reference for every output sample is the intended hand position
+`latency` seconds later. For each session the raw pinch midpoint is smoothed
+with the configured filter, then optionally run through LatencyPredictor,
+and both outputs are compared against that shifted intent:
+
+- lag_ms        median delay behind the hand while moving
+- overshoot_px  mean distance the cursor runs past the stop point
+- jitter_px     RMS frame-to-frame step while the hand is still
+
+Recordings carry no processing delay, so the measured capture→dispatch
+latency is supplied with --processing-ms.
+
+Usage:
+    python tools/prediction_report.py sessions/*.json
+    python tools/prediction_report.py sessions/*.npz --config tuned.json --processing-ms 20 --json out.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_config
+from kinemouse.utils.math_utils import OneEuroFilter
+from kinemouse.utils.session_io import load_session
+from kinemouse.utils import signal_metrics as sm
+from kinemouse.utils.logger import init_logging, get_logger
+from kinemouse.state.latency_predictor import LatencyPredictor
+from filter_report import prepare, _EMA
+
+log = get_logger("prediction_report")
+
+
+def make_smoother(config: KineMouseConfig):
+    if config.smoothing == "one_euro":
+        return lambda: OneEuroFilter(config.one_euro_min_cutoff, config.one_euro_beta,
+                                     config.one_euro_d_cutoff)
+    return lambda: _EMA(config.ema_alpha)
+
+
+def make_predictor(config: KineMouseConfig, processing_s: float):
+    def build():
+        p = LatencyPredictor()
+        p.configure(config)
+        p.observe_latency(processing_s)
+        return p
+    return build
+
+
+def score(s: dict, out, target) -> dict:
+    return {
+        "lag_ms": sm.tracking_lag_ms(out, target, s["speed"], s["moving"]),
+        "overshoot_px": sm.overshoot(out, target, s["t"], s["restart"], s["moving"]) * s["px"],
+        "jitter_px": sm.stillness_jitter(out, s["restart"], s["still"]) * s["px"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lag/overshoot report for cursor prediction")
+    parser.add_argument("files", nargs="+", help="Session files (.json or .npz)")
+    parser.add_argument("--config", default=None, help="Config JSON (smoothing + prediction_*)")
+    parser.add_argument("--processing-ms", type=float, default=15.0,
+                        help="Capture→dispatch latency to assume (default: 15)")
+    parser.add_argument("--json", default=None, help="Write the report to this JSON file")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    config = load_config(Path(args.config)) if args.config else KineMouseConfig()
+    processing_s = args.processing_ms / 1000.0
+    display_latency_s = config.prediction_latency_ms / 1000.0 + processing_s
+
+    report = {"latency_ms": display_latency_s * 1000.0, "sessions": []}
+    for f in args.files:
+        s = prepare(load_session(f), config)
+        target = sm.shift_trajectory(s["intent"], s["t"], display_latency_s)
+        smoothed = sm.run_filter(s["raw"], s["t"], s["restart"], make_smoother(config))
+        predicted = sm.run_filter(smoothed, s["t"], s["restart"], make_predictor(config, processing_s))
+        row = {
+            "session": s["name"],
+            "smoothed": score(s, smoothed, target),
+            "predicted": score(s, predicted, target),
+        }
+        report["sessions"].append(row)
+        a, b = row["smoothed"], row["predicted"]
+        log.info("%-24s smoothed %6.1fms %5.2fpx over %5.2fpx jit | predicted %6.1fms %5.2fpx over %5.2fpx jit",
+                 s["name"], a["lag_ms"], a["overshoot_px"], a["jitter_px"],
+                 b["lag_ms"], b["overshoot_px"], b["jitter_px"])
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,14 @@ replay_session.py — replay a recorded gesture session without a webcam.
 Loads a JSON file saved by record_session.py and runs it through the FSM,
 printing events and optionally dispatching them to the OS backend.
 
+The FSM is driven by the recorded frame timestamps, so replay runs at full
+speed and still reproduces double-pinch timing exactly. Wall-clock pacing is
+only applied when events are dispatched to the OS (or with --realtime).
+
 Usage:
     python tools/replay_session.py session.json
     python tools/replay_session.py session.json --dispatch   # actually moves mouse
-    python tools/replay_session.py session.json --speed 2.0  # 2x speed
+    python tools/replay_session.py session.json --dispatch --speed 2.0  # 2x speed
 """
 
 import sys
@@ -36,7 +40,8 @@ def main():
     parser = argparse.ArgumentParser(description="Replay a recorded gesture session")
     parser.add_argument("file", help="Path to session JSON file")
     parser.add_argument("--dispatch", action="store_true", help="Dispatch events to OS (moves real cursor)")
-    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed multiplier")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed multiplier (paced replay only)")
+    parser.add_argument("--realtime", action="store_true", help="Pace replay to the recording even without --dispatch")
     args = parser.parse_args()
 
     init_logging("INFO")
@@ -60,18 +65,24 @@ def main():
         backend = get_backend(config)
         log.info("Dispatching events to OS backend")
 
-    log.info("Replaying %d frames from %s at %.1fx speed", len(frames), path.name, args.speed)
+    paced = args.dispatch or args.realtime
+    if paced:
+        log.info("Replaying %d frames from %s at %.1fx speed", len(frames), path.name, args.speed)
+    else:
+        log.info("Replaying %d frames from %s at full speed", len(frames), path.name)
 
+    t_wall = time.perf_counter()
     prev_t = 0.0
     for i, frame in enumerate(frames):
-        # Maintain original timing
-        gap = (frame["t"] - prev_t) / args.speed
-        if gap > 0:
-            time.sleep(gap)
-        prev_t = frame["t"]
+        if paced:
+            # Only the OS needs wall-clock pacing; the FSM uses frame["t"]
+            gap = (frame["t"] - prev_t) / args.speed
+            if gap > 0:
+                time.sleep(gap)
+            prev_t = frame["t"]
 
         lm = dict_to_landmarks(frame["landmarks"]) if frame["found"] else None
-        event = fsm.process(lm)
+        event = fsm.process(lm, timestamp=frame["t"])
 
         if event.type != EventType.IDLE:
             log.info("[%05.2fs] frame=%d  event=%-12s  pos=%s",
@@ -80,7 +91,7 @@ def main():
         if backend and event.type != EventType.IDLE:
             backend.dispatch(event)
 
-    log.info("Replay complete.")
+    log.info("Replay complete in %.2fs.", time.perf_counter() - t_wall)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+"""
+seed_double_pinch.py — seed a profile's adaptive double-pinch window from
+recorded sessions.
+
+With adaptive_double_pinch on, the window is learned from the user's own
+release → re-pinch intervals, and until min_samples of them are seen the
+fixed double_pinch_window_ms applies. This replays the index pinch of
+recorded sessions (.json / .npz from examples/record_session.py) through
+the same pinch detection as the live FSM, feeds every plausible re-pinch to
+the profile's DoublePinchLearner, and saves the profile, so a new user (or
+a new machine) starts with a learned window.
+
+Event histories (GestureHistory, SQLiteHistoryStore) cannot seed it: they
+hold the emitted mouse events, not the pinch releases.
+
+Usage:
+    python tools/seed_double_pinch.py sessions/alice_*.npz --profile alice
+    python tools/seed_double_pinch.py sessions/*.json --config my.json --dry-run
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.config import KineMouseConfig
+from kinemouse.utils.config_io import load_config, load_profile, save_profile
+from kinemouse.utils.session_io import load_session
+from kinemouse.state.adaptive_timing import DoublePinchLearner, repinch_intervals
+from kinemouse.state.batch_fsm import pinch_series
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("seed_double_pinch")
+
+
+def session_intervals(path: str, config: KineMouseConfig, min_hold_ms: float) -> np.ndarray:
+    """Release → re-pinch intervals (ms) of one recorded session, oldest first."""
+    session = load_session(path)
+    found = session.found
+    pts = np.where(found[:, None, None], session.landmarks, 0.0)
+    pinch, dref = pinch_series(pts, found, config)
+    # Live, a frame without a usable D_ref is skipped (not a release); a lost hand resets
+    keep = ~(found & (dref == 0))
+    return repinch_intervals(pinch[keep, 0] & found[keep], session.timestamps[keep], found[keep],
+                             min_hold_ms=min_hold_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the adaptive double-pinch window from recorded sessions")
+    parser.add_argument("files", nargs="+", help="Session files (.json or .npz)")
+    parser.add_argument("--config", default=None, help="Config JSON (pinch thresholds, learner bounds)")
+    parser.add_argument("--profile", default=None, help="Profile to update (default: the config's profile)")
+    parser.add_argument("--dry-run", action="store_true", help="Report the learned window without saving")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    config = load_config(Path(args.config)) if args.config else KineMouseConfig()
+    profile = args.profile or config.profile
+
+    state = load_profile(profile)
+    learner = DoublePinchLearner(reliability=config.adaptive_double_pinch_reliability)
+    learner.min_ms = config.adaptive_double_pinch_min_ms
+    learner.max_ms = config.adaptive_double_pinch_max_ms
+    learner.load_state(state.get("double_pinch"))
+    before = learner.samples
+
+    for f in args.files:
+        intervals = session_intervals(f, config, learner.min_hold_ms)
+        for interval in intervals.tolist():
+            learner.observe(interval)
+        log.info("%-30s %d re-pinches", Path(f).stem, len(intervals))
+
+    window = learner.window_ms(config.double_pinch_window_ms)
+    log.info("Profile %r: %d samples (%d new), window %.0f ms (fixed: %d ms)",
+             profile, learner.samples, learner.samples - before, window, config.double_pinch_window_ms)
+    if learner.samples < learner.min_samples:
+        log.warning("Fewer than %d samples — the fixed window stays in use until more are seen",
+                    learner.min_samples)
+    if not args.dry_run:
+        state["double_pinch"] = learner.state()
+        save_profile(profile, state)
+        log.info("Saved profile %r", profile)
+
+
+if __name__ == "__main__":
+    main()
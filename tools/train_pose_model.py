@@ -0,0 +1,95 @@
+"""
+train_pose_model.py — train a custom static-pose model from labeled sessions.
+
+Collects every labeled frame with a hand (see examples/record_session.py
+--label), holds out a fraction of frames for validation, trains a
+PoseModel and saves it as a small .npz loadable with PoseModel.load().
+Any label string is a pose: built-in HandPose names map back to HandPose,
+others become custom poses.
+
+Usage:
+    python tools/train_pose_model.py sessions/*.json --out poses.npz
+    python tools/train_pose_model.py sessions/*.npz --method knn --k 7 --out poses.npz
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kinemouse.utils.session_io import load_session
+from kinemouse.state.pose_model import PoseModel
+from kinemouse.utils.logger import init_logging, get_logger
+
+log = get_logger("train_pose")
+
+
+def collect(files):
+    """Stack all labeled hand frames into (N, 21, 3) points and N labels."""
+    points, labels = [], []
+    for f in files:
+        session = load_session(f)
+        if session.labels is None:
+            log.warning("%s has no labels — skipped", f)
+            continue
+        mask = session.found & (session.labels != "")
+        points.append(session.landmarks[mask])
+        labels.append(session.labels[mask])
+    if not points:
+        return np.empty((0, 21, 3)), np.empty(0, dtype=str)
+    return np.concatenate(points), np.concatenate(labels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train a pose model from labeled sessions")
+    parser.add_argument("files", nargs="+", help="Labeled session files (.json or .npz)")
+    parser.add_argument("--out", default="poses.npz", help="Output model file")
+    parser.add_argument("--method", choices=["centroid", "knn"], default="centroid")
+    parser.add_argument("--k", type=int, default=5, help="Neighbours for --method knn")
+    parser.add_argument("--max-per-class", type=int, default=500, help="Samples kept per pose (knn)")
+    parser.add_argument("--holdout", type=float, default=0.2, help="Fraction of frames for validation")
+    args = parser.parse_args()
+
+    init_logging("INFO")
+    points, labels = collect(args.files)
+    if len(points) == 0:
+        log.error("No labeled frames found")
+        sys.exit(1)
+
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(points))
+    n_val = int(len(points) * args.holdout)
+    val, train = order[:n_val], order[n_val:]
+
+    t0 = time.perf_counter()
+    model = PoseModel.fit(points[train], labels[train], args.method, args.k, args.max_per_class)
+    train_s = time.perf_counter() - t0
+    log.info("Trained %s model on %d frames, %d poses %s in %.2fs",
+             model.method, len(train), len(model.classes), model.classes, train_s)
+
+    if n_val:
+        pred = model.predict(points[val])
+        names = np.array(model.classes + ["UNKNOWN"])[pred]
+        accuracy = float(np.mean(names == labels[val]))
+        log.info("Validation accuracy %.1f%% on %d frames", accuracy * 100, n_val)
+        for cls in model.classes:
+            sel = labels[val] == cls
+            if sel.any():
+                log.info("  %-16s %5.1f%% (%d)", cls, np.mean(names[sel] == cls) * 100, sel.sum())
+
+    single = points[0]
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        model.classify(single)
+    log.info("Inference: %.1f µs/frame", (time.perf_counter() - t0) * 1000)
+
+    model.save(args.out)
+    log.info("Saved %s (%.1f KB)", args.out, Path(args.out).stat().st_size / 1024)
+
+
+if __name__ == "__main__":
+    main()